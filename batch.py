@@ -0,0 +1,160 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Sequence, Tuple
+from core.workload import Workload
+from core.workload_generator import generate_workload
+from simulator import SchedulerApp, SchedulerType
+
+"""
+여러 작업량 × 프로세서 구성 × 스케줄러 조합을 한 번에 실행하는 배치 실험 모듈
+- 작업량: [(pid, 도착 시간, 실행 시간), ...]
+- 프로세서 구성: [(id, 타입, 시간 쿼텀), ...]  (시간 쿼텀은 GUI와 같이 RR에서만 사용, CUSTOM은 1)
+- 실행마다 프로세스, 프로세서 객체를 새로 만들어 실행 간에 상태가 섞이지 않음
+- 작업량은 작업 프로세스를 시작할 때 한 번만 넘기고, 실행 단위에는 작업량 이름과 조합 정보만 담음
+"""
+
+WorkloadRows = Sequence[Tuple[int, int, int]]
+ProcessorConfig = Sequence[Tuple[int, str, int]]
+
+RESULT_FIELDS = ["workload", "processors", "scheduler", "avg_wt", "avg_tt", "avg_ntt", "total_power", "makespan"]
+
+
+def processor_time_quantum(scheduler_type: SchedulerType, time_quantum: int):
+    """스케줄러별로 프로세서에 줄 시간 쿼텀 (GUI의 시뮬레이션 시작 규칙과 같음)"""
+    if scheduler_type == SchedulerType.CUSTOM:
+        return 1
+    if scheduler_type == SchedulerType.RR:
+        if time_quantum is None or time_quantum <= 0:
+            raise ValueError("RR은 양수인 Time Quantum 값이 필요합니다.")
+        return time_quantum
+    return None
+
+
+_workloads: Dict[str, Workload] = {}               # 현재 프로세스가 받아 둔 작업량 (이름 -> Workload)
+
+
+def init_worker(workloads: Dict[str, Workload]) -> None:
+    """작업 프로세스마다 한 번 호출되어 작업량을 받아 둠"""
+    global _workloads
+    _workloads = workloads
+
+
+def run_job(job: tuple) -> dict:
+    """배치 실행 단위 하나를 실행하고 요약 지표를 반환 (작업 프로세스에서 호출됨)"""
+    workload_name, processors_name, processors, scheduler_name = job
+    scheduler_type = SchedulerType[scheduler_name]
+
+    app = SchedulerApp(scheduler_type=scheduler_type, event_driven=True)
+    app.load_workload(_workloads[workload_name])
+    for id, type, time_quantum in processors:
+        app.add_processor(id=id, type=type, time_quantum=processor_time_quantum(scheduler_type, time_quantum))
+    app.run()
+
+    processes = app.scheduler.get_process()
+    count = len(processes)
+    return {
+        "workload": workload_name,
+        "processors": processors_name,
+        "scheduler": scheduler_name,
+        "avg_wt": sum(p.wait_time for p in processes) / count if count else 0,
+        "avg_tt": sum(p.turnaround_time for p in processes) / count if count else 0,
+        "avg_ntt": sum(p.normalized_turnaround_time for p in processes) / count if count else 0,
+        "total_power": app.scheduler.calculate_total_power(),
+        "makespan": max((p.arrival + p.turnaround_time for p in processes), default=0),
+    }
+
+
+def build_workloads(workloads: Dict[str, WorkloadRows]) -> Dict[str, Workload]:
+    """작업량을 작업 프로세스로 한 번에 넘길 Workload로 변환"""
+    return {name: workload if isinstance(workload, Workload) else
+            Workload((int(pid), int(arrival), int(burst)) for pid, arrival, burst in workload)
+            for name, workload in workloads.items()}
+
+
+def build_jobs(workloads: Dict[str, WorkloadRows], processor_configs: Dict[str, ProcessorConfig],
+               scheduler_types: Iterable[SchedulerType]) -> List[tuple]:
+    """실행할 조합 목록 생성 (작업량은 이름만 담고, 작업 프로세스로 넘길 수 있도록 기본 자료형만 사용)"""
+    scheduler_types = list(scheduler_types)
+    jobs = []
+    for workload_name in workloads:
+        for processors_name, processors in processor_configs.items():
+            processors = tuple((int(id), str(type), None if time_quantum is None else int(time_quantum))
+                               for id, type, time_quantum in processors)
+            for scheduler_type in scheduler_types:
+                for _, _, time_quantum in processors:
+                    processor_time_quantum(scheduler_type, time_quantum) # 잘못된 구성은 실행 전에 확인
+                jobs.append((workload_name, processors_name, processors, scheduler_type.name))
+    return jobs
+
+
+def run_batch(workloads: Dict[str, WorkloadRows], processor_configs: Dict[str, ProcessorConfig],
+              scheduler_types: Iterable[SchedulerType] = SchedulerType,
+              max_workers: int = None, chunksize: int = None) -> List[dict]:
+    """
+    모든 조합을 실행하고 결과 표(행마다 dict)를 조합 순서대로 반환
+    - max_workers: 작업 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순서대로 실행)
+    - chunksize: 작업 프로세스에 한 번에 넘길 실행 수 (None이면 작업 프로세스마다 4묶음 정도가 되도록 계산)
+    """
+    jobs = build_jobs(workloads, processor_configs, scheduler_types)
+    workloads = build_workloads(workloads)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1 or len(jobs) <= 1:
+        init_worker(workloads)
+        return [run_job(job) for job in jobs]
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(workloads,)) as executor:
+        return list(executor.map(run_job, jobs, chunksize=chunksize))
+
+
+def write_csv(results: List[dict], stream) -> None:
+    writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    writer.writerows(results)
+
+
+def print_table(results: List[dict], stream=None) -> None:
+    stream = stream if stream is not None else sys.stdout
+    print(" | ".join(field.rjust(12) for field in RESULT_FIELDS), file=stream)
+    for row in results:
+        cells = [f"{row[field]:.3f}" if isinstance(row[field], float) else str(row[field]) for field in RESULT_FIELDS]
+        print(" | ".join(cell.rjust(12) for cell in cells), file=stream)
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    사용법: python batch.py config.json [--workers N] [--chunksize N] [--csv 결과.csv]
+    config.json 형식:
+      {"workloads": {"이름": [[pid, 도착, 실행], ...] 또는 generate_workload 인자 {"count": .., "processors": "PPEE", ...}},
+       "processors": {"이름": [[id, "P" 또는 "E", 시간 쿼텀 또는 null], ...]},
+       "schedulers": ["FCFS", "RR", ...]}   (생략하면 전체 스케줄러)
+    """
+    parser = argparse.ArgumentParser(description="스케줄러 × 작업량 × 프로세서 구성 배치 실험")
+    parser.add_argument("config", help="실험 구성 JSON 파일")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunksize", type=int, default=None, help="작업 프로세스에 한 번에 넘길 실행 수")
+    parser.add_argument("--csv", default=None, help="결과를 저장할 CSV 파일")
+    args = parser.parse_args(argv)
+
+    with open(args.config, encoding="utf-8") as file:
+        config = json.load(file)
+    workloads = {name: generate_workload(**spec) if isinstance(spec, dict) else spec
+                 for name, spec in config["workloads"].items()}
+    scheduler_types = [SchedulerType[name] for name in config.get("schedulers", [t.name for t in SchedulerType])]
+    results = run_batch(workloads, config["processors"], scheduler_types,
+                        max_workers=args.workers, chunksize=args.chunksize)
+
+    if args.csv:
+        with open(args.csv, "w", encoding="utf-8", newline="") as file:
+            write_csv(results, file)
+    else:
+        print_table(results)
+
+
+if __name__ == '__main__':
+    main()
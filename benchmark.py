@@ -0,0 +1,219 @@
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from batch import processor_time_quantum
+from core.workload_generator import generate_workload
+from simulator import SchedulerApp, SchedulerType
+
+try:
+    import resource                                 # 최대 메모리 측정용 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+"""
+스케줄러 성능 측정 모듈
+- 프로세스 수 × 프로세서 구성 × 스케줄러(RR은 시간 쿼텀별) × 실행 시간 분포 조합마다
+  실행 시간, 초당 시뮬레이션 시간(ticks/s), 초당 스케줄링 단계(steps/s), 최대 메모리를 측정
+- 조합마다 새 프로세스에서 실행하므로 메모리 측정이 서로 섞이지 않음
+- 실행 시간 분포에 따라 비용이 달라지는 스케줄러는 WORST_CASES의 분포로도 측정 (HRRN: 실행 시간 종류가 많은 pareto)
+- 비선점 FCFS, SPN도 바로 계산(closed_form)하지 않고 지정한 엔진(tick/event)으로 시뮬레이션해 측정
+- 결과를 JSON 기준값으로 저장하고, 다시 실행할 때 기준값보다 느려지거나 메모리가 늘어난 조합을 표시
+
+사용법:
+  python benchmark.py --save baseline.json
+  python benchmark.py --compare baseline.json --threshold 0.2
+"""
+
+DEFAULT_COUNTS = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DEFAULT_PROCESSORS = ["P", "PE", "PPEE"]
+DEFAULT_QUANTUMS = [1, 4, 16]
+DEFAULT_BURST = "exponential"
+WORST_CASES = {SchedulerType.HRRN: ["pareto"]}     # 기본 분포 외에 함께 측정할 스케줄러별 실행 시간 분포
+UTILIZATION = 0.9
+SEED = 0
+MIN_MEASURE_TIME = 0.2                              # 짧은 조합은 이 시간이 찰 때까지 반복 실행하고 가장 빠른 값 사용
+MIN_MEMORY_CHANGE_MB = 4.0                          # 최대 메모리가 이보다 적게 늘면 비율과 상관없이 성능 저하로 보지 않음
+
+
+def case_key(case: dict) -> str:
+    """조합을 구분하는 이름 (기준값 비교용)"""
+    quantum = f"/q{case['quantum']}" if case["quantum"] is not None else ""
+    burst = case.get("burst", DEFAULT_BURST)
+    burst = f"/{burst}" if burst != DEFAULT_BURST else ""
+    return f"{case['scheduler']}{quantum}/{case['processors']}{burst}/n{case['count']}/{case['engine']}"
+
+
+def build_cases(counts: List[int], processor_mixes: List[str], quantums: List[int],
+                scheduler_types: List[SchedulerType], event_driven: bool = True, bursts: List[str] = None) -> List[dict]:
+    bursts = bursts if bursts is not None else [DEFAULT_BURST]
+    cases = []
+    for count in counts:
+        for processors in processor_mixes:
+            for scheduler_type in scheduler_types:
+                extra = [burst for burst in WORST_CASES.get(scheduler_type, []) if burst not in bursts]
+                for burst in bursts + extra:
+                    for quantum in (quantums if scheduler_type == SchedulerType.RR else [None]):
+                        cases.append({
+                            "scheduler": scheduler_type.name,
+                            "quantum": quantum,
+                            "processors": processors,
+                            "burst": burst,
+                            "count": count,
+                            "engine": "event" if event_driven else "tick",
+                        })
+    return cases
+
+
+def peak_memory_mb() -> float:
+    """현재 프로세스의 최대 메모리 사용량 (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # macOS는 바이트, Linux는 KB
+
+
+def run_engine(app: SchedulerApp, event_driven: bool) -> None:
+    """
+    지정한 엔진으로 끝까지 시뮬레이션 (다시 실행하면 이전 결과는 초기화됨)
+    - SchedulerApp.run()은 비선점 FCFS, SPN을 closed_form으로 바로 계산하므로 엔진을 직접 호출
+    """
+    if app.scheduler is not None:
+        app.reset_state()
+    app.select_scheduler()
+    if event_driven:
+        app.scheduler.simulate_event_driven()
+    else:
+        app.scheduler.simulate()
+
+
+def run_case(case: dict) -> dict:
+    """
+    조합 하나를 실행하고 측정값을 더해 반환
+    - peak_memory_mb는 작업량을 만들고 불러온 뒤부터 잰 엔진의 최대 메모리 증가량, workload_memory_mb는 작업량 생성분
+    """
+    memory_start = peak_memory_mb()
+    scheduler_type = SchedulerType[case["scheduler"]]
+    workload = generate_workload(case["count"], case["processors"], utilization=UTILIZATION,
+                                 burst=case.get("burst", DEFAULT_BURST), seed=SEED)
+
+    event_driven = case["engine"] == "event"
+    app = SchedulerApp(scheduler_type=scheduler_type, event_driven=event_driven, columnar=True)
+    app.load_workload(workload)
+    for id, type in enumerate(case["processors"], start=1):
+        time_quantum = case["quantum"] if case["quantum"] is not None else 1
+        app.add_processor(id=id, type=type, time_quantum=processor_time_quantum(scheduler_type, time_quantum))
+    memory_before = peak_memory_mb()
+
+    wall_time = None
+    repeats = 0
+    measured = 0.0
+    while measured < MIN_MEASURE_TIME:
+        start = time.perf_counter()
+        run_engine(app, event_driven)
+        elapsed = time.perf_counter() - start
+        wall_time = elapsed if wall_time is None else min(wall_time, elapsed)
+        measured += elapsed
+        repeats += 1
+    memory_after = peak_memory_mb()
+
+    ticks = app.scheduler.current_time
+    steps = app.scheduler.step_count
+    result = dict(case)
+    result.update({
+        "wall_time": wall_time,
+        "repeats": repeats,
+        "ticks": ticks,
+        "steps": steps,
+        "ticks_per_sec": ticks / wall_time if wall_time > 0 else None,
+        "steps_per_sec": steps / wall_time if wall_time > 0 else None,
+        "peak_memory_mb": None if memory_before is None else memory_after - memory_before,
+        "workload_memory_mb": None if memory_start is None else memory_before - memory_start,
+    })
+    return result
+
+
+def run_isolated(case: dict) -> dict:
+    """새 프로세스에서 조합을 실행 (이전 조합의 메모리 사용량이 섞이지 않도록)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_case, case).result()
+
+
+def compare_results(results: List[dict], baseline: List[dict], threshold: float,
+                    min_memory_mb: float = MIN_MEMORY_CHANGE_MB) -> List[str]:
+    """
+    기준값과 비교해 성능이 나빠진 조합 목록 반환
+    - ticks/s가 threshold 비율보다 많이 줄었거나, 최대 메모리가 threshold 비율과 min_memory_mb보다 많이 늘면 표시
+      (작은 조합의 최대 메모리는 몇 MB 안에서 흔들리므로 비율만으로 비교하지 않음)
+    """
+    baseline_by_key = {case_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        base = baseline_by_key.get(case_key(row))
+        if base is None:
+            continue
+        if base.get("ticks_per_sec") and row.get("ticks_per_sec") is not None:
+            change = row["ticks_per_sec"] / base["ticks_per_sec"] - 1
+            if change < -threshold:
+                regressions.append(f"{case_key(row)}: ticks/s {base['ticks_per_sec']:.0f} -> {row['ticks_per_sec']:.0f} ({change:+.1%})")
+        if base.get("peak_memory_mb") and row.get("peak_memory_mb") is not None:
+            change = row["peak_memory_mb"] / base["peak_memory_mb"] - 1
+            if change > threshold and row["peak_memory_mb"] - base["peak_memory_mb"] > min_memory_mb:
+                regressions.append(f"{case_key(row)}: 메모리 {base['peak_memory_mb']:.1f}MB -> {row['peak_memory_mb']:.1f}MB ({change:+.1%})")
+    return regressions
+
+
+def print_result(row: dict, stream=None) -> None:
+    stream = stream if stream is not None else sys.stdout
+    memory = "-" if row["peak_memory_mb"] is None else f"{row['peak_memory_mb']:.1f}MB"
+    ticks_per_sec = "-" if row["ticks_per_sec"] is None else f"{row['ticks_per_sec']:.0f}"
+    steps_per_sec = "-" if row["steps_per_sec"] is None else f"{row['steps_per_sec']:.0f}"
+    print(f"{case_key(row).ljust(36)} {row['wall_time']:9.3f}s {ticks_per_sec.rjust(12)} ticks/s {steps_per_sec.rjust(12)} steps/s {memory.rjust(10)}", file=stream, flush=True)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="스케줄러 성능 측정")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS, help="프로세스 수 목록")
+    parser.add_argument("--processors", nargs="+", default=DEFAULT_PROCESSORS, help='프로세서 구성 목록 (예: "PPEE")')
+    parser.add_argument("--quantums", type=int, nargs="+", default=DEFAULT_QUANTUMS, help="RR 시간 쿼텀 목록")
+    parser.add_argument("--schedulers", nargs="+", default=[t.name for t in SchedulerType], help="스케줄러 목록")
+    parser.add_argument("--bursts", nargs="+", default=[DEFAULT_BURST],
+                        help="실행 시간 분포 목록 (WORST_CASES의 분포는 해당 스케줄러에 항상 추가)")
+    parser.add_argument("--tick", action="store_true", help="이벤트 기반 대신 tick 단위 시뮬레이션으로 측정")
+    parser.add_argument("--save", default=None, help="결과를 기준값 JSON으로 저장")
+    parser.add_argument("--compare", default=None, help="비교할 기준값 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="성능 저하로 볼 변화 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--min-memory-mb", type=float, default=MIN_MEMORY_CHANGE_MB,
+                        help="성능 저하로 볼 최소 메모리 증가량 (MB)")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.counts, args.processors, args.quantums,
+                        [SchedulerType[name] for name in args.schedulers], event_driven=not args.tick, bursts=args.bursts)
+    results = []
+    for case in cases:
+        row = run_isolated(case)
+        print_result(row)
+        results.append(row)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_results(results, baseline, args.threshold, args.min_memory_mb)
+        if regressions:
+            print(f"\n성능 저하 ({len(regressions)}건)")
+            for line in regressions:
+                print(" ", line)
+            return 1
+        print("\n성능 저하 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
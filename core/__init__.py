@@ -1,2 +1,7 @@
-from .process import Process
-from .processor import Processor
\ No newline at end of file
+from .timeline import Timeline, BoundedTimeline
+from .process import Process, WaitClock
+from .processor import Processor
+from .process_table import ProcessTable, ProcessView
+from .workload import Workload
+from .process_stream import ProcessStream, read_csv, read_jsonl
+from .workload_generator import generate_workload, generate_processes
\ No newline at end of file
@@ -1,15 +1,77 @@
+class WaitClock:
+    """
+    대기 시간 계산용 시간 (스케줄러가 대기 시간을 반영한 시간까지 진행)
+    - 대기 중인 프로세스는 모두 이 시간만큼 함께 대기하므로, 매 시간 프로세스마다 더하지 않아도 됨
+    """
+    __slots__ = ('time',)
+
+    def __init__(self, time: int = 0) -> None:
+        self.time = time
+
+
 class Process:
+    __slots__ = (
+        'pid', 'arrival', 'burst', 'start_time', 'accumulated_wait_time', 'waiting_since', 'clock',
+        'turnaround_time', 'normalized_turnaround_time', 'remaining_time', 'running',
+    )
+
     def __init__(self, pid, arrival, burst):
         self.pid = pid                              # 프로세스 ID
         self.arrival = arrival                      # 도착 시간
         self.burst = burst                          # 실행 시간
         self.start_time = None                      # 시작 시간
-        self.wait_time = 0                          # 대기 시간
+        self.accumulated_wait_time = 0              # 지난 대기 구간들의 대기 시간 합
+        self.waiting_since = arrival                # 현재 대기 구간의 시작 시간 (실행 중이면 None)
+        self.clock: WaitClock = None                # 대기 시간 계산용 시간 (스케줄러가 연결)
         self.turnaround_time = None                 # 반환 시간
         self.normalized_turnaround_time = None      # 정규화된 실행 시간
         self.remaining_time = burst                 # 남은 실행 시간
         self.running = False                        # 실행 중인지 여부
         
+    @property
+    def wait_time(self) -> int:
+        """대기 시간 (현재 대기 중이면 지금까지의 대기 구간 포함)"""
+        return self.accumulated_wait_time + self.pending_wait_time()
+
+    @wait_time.setter
+    def wait_time(self, value: int) -> None:
+        self.accumulated_wait_time = value
+        if self.waiting_since is not None and self.clock is not None:
+            self.waiting_since = max(self.clock.time, self.arrival)
+
+    def reset(self) -> None:
+        """실행 결과를 지우고 처음 만든 상태로 되돌림 (같은 프로세스로 다른 스케줄러를 다시 실행할 때 사용)"""
+        self.start_time = None
+        self.accumulated_wait_time = 0
+        self.waiting_since = self.arrival
+        self.clock = None
+        self.turnaround_time = None
+        self.normalized_turnaround_time = None
+        self.remaining_time = self.burst
+        self.running = False
+
+    def get_state(self) -> tuple:
+        """체크포인트용 상태 (pid, 도착 시간, 실행 시간과 실행 결과)"""
+        return (self.pid, self.arrival, self.burst, self.start_time, self.accumulated_wait_time, self.waiting_since,
+                self.turnaround_time, self.normalized_turnaround_time, self.remaining_time, self.running)
+
+    def set_state(self, state: tuple) -> None:
+        """get_state()로 저장한 실행 결과를 되돌림 (pid가 다르면 ValueError)"""
+        if state[0] != self.pid:
+            raise ValueError(f"체크포인트의 프로세스가 작업량과 다릅니다 (PID {state[0]} != {self.pid})")
+        (self.start_time, self.accumulated_wait_time, self.waiting_since, self.turnaround_time,
+         self.normalized_turnaround_time, self.remaining_time, self.running) = state[3:]
+
+    def pending_wait_time(self) -> int:
+        """현재 대기 구간의 대기 시간 (도착 전이거나 실행 중이면 0)"""
+        if self.waiting_since is None or self.clock is None:
+            return 0
+        return max(0, self.clock.time - self.waiting_since)
+
+    def settle_wait_time(self) -> None:
+        """현재 대기 구간을 대기 시간에 반영하고 대기 구간 종료"""
+        self.accumulated_wait_time += self.pending_wait_time()
+        self.waiting_since = None
         
     def is_completed(self) -> bool:
         return self.remaining_time == 0
@@ -19,6 +81,7 @@ class Process:
 
     def start(self, current_time: int) -> None:
         """프로세스의 시작 시간 업데이트 및 실행 상태 설정"""
+        self.settle_wait_time()
         self.running = True
         if self.start_time is None:
             self.start_time = current_time
@@ -32,9 +95,11 @@ class Process:
     def wait(self) -> None:
         """프로세스의 대기 상태설정(ready queue에 들어갈때)"""
         self.running = False
+        self.waiting_since = self.clock.time if self.clock is not None else None
         
     def stop(self, current_time: int) -> None:
         """프로세스의 종료 상태 설정"""
+        self.settle_wait_time()
         self.running = False
         self.remaining_time = 0
         self.turnaround_time = current_time - self.arrival
@@ -0,0 +1,186 @@
+import csv
+import heapq
+import json
+from typing import Callable, Iterable, Iterator, List, Optional
+from core.process import Process, WaitClock
+
+
+class ProcessStream:
+    """
+    도착 순서로 프로세스를 하나씩 읽어 오는 작업량 (아주 큰 도착 기록 재생용)
+    - 스케줄러가 현재 시간까지 도착한 프로세스만 꺼내 가므로, 도착했지만 끝나지 않은 프로세스만 메모리에 남음
+    - 끝난 프로세스는 on_complete로 넘기고 버림 (keep_completed가 True면 completed에 보관)
+    - reorder_window: 도착 시간이 조금 뒤섞인 입력을 바로잡기 위해 미리 읽어 둘 프로세스 수
+      (그 범위를 넘어 순서가 어긋나면 ValueError)
+    - 한 번만 실행할 수 있음 (다시 실행하려면 새로 읽어야 함)
+    """
+    def __init__(self, processes: Iterable[Process], reorder_window: int = 0,
+                 on_complete: Callable[[Process], None] = None, keep_completed: bool = False) -> None:
+        self.source = iter(processes)
+        self.reorder_window = reorder_window
+        self.on_complete = on_complete              # 프로세스가 끝날 때 호출
+        self.keep_completed = keep_completed
+        self.buffer = []                            # 미리 읽어 둔 프로세스 (도착 시간, 순번, 프로세스)
+        self.sequence = 0
+        self.exhausted = False                      # 입력을 끝까지 읽었는지 여부
+        self.last_arrival = None                    # 마지막으로 내보낸 도착 시간
+        self.resident = {}                          # 도착했지만 끝나지 않은 프로세스
+        self.completed: List[Process] = []          # 끝난 프로세스 (keep_completed일 때만)
+        self.completed_count = 0
+        self.clock: WaitClock = None                # 대기 시간 계산용 시간 (스케줄러가 연결)
+
+    def fill(self) -> None:
+        """버퍼에 reorder_window + 1개가 찰 때까지 입력을 읽음"""
+        while not self.exhausted and len(self.buffer) <= self.reorder_window:
+            process = next(self.source, None)
+            if process is None:
+                self.exhausted = True
+                break
+            self.sequence += 1
+            heapq.heappush(self.buffer, (process.arrival, self.sequence, process))
+
+    def next_time(self) -> Optional[int]:
+        """다음에 도착할 프로세스의 도착 시간 (없으면 None)"""
+        self.fill()
+        if not self.buffer:
+            return None
+        arrival = self.buffer[0][0]
+        if self.last_arrival is not None and arrival < self.last_arrival:
+            raise ValueError(f"도착 시간 순서가 아닙니다 (PID {self.buffer[0][2].pid}, 도착 {arrival} < {self.last_arrival}). reorder_window를 늘려야 합니다")
+        return arrival
+
+    def pop_arrived(self, time: int) -> List[Process]:
+        """time까지 도착한 프로세스를 꺼냄 (PID 큰 값 우선)"""
+        arrived = []
+        while True:
+            arrival = self.next_time()
+            if arrival is None or arrival > time:
+                break
+            process = heapq.heappop(self.buffer)[2]
+            self.last_arrival = arrival
+            process.clock = self.clock
+            self.resident[id(process)] = process
+            arrived.append(process)
+        if len(arrived) > 1:
+            arrived.sort(key=lambda p: -p.pid)
+        return arrived
+
+    def complete(self, process: Process) -> None:
+        """끝난 프로세스를 메모리에서 내보냄"""
+        if self.resident.pop(id(process), None) is None:
+            return
+        self.completed_count += 1
+        if self.keep_completed:
+            self.completed.append(process)
+        if self.on_complete is not None:
+            self.on_complete(process)
+
+    def __bool__(self) -> bool:
+        return self.next_time() is not None
+
+    def saved_processes(self) -> List[Process]:
+        """체크포인트에 상태를 저장할 프로세스 (도착했지만 끝나지 않은 프로세스)"""
+        return list(self.resident.values())
+
+    def get_state(self) -> dict:
+        """
+        체크포인트용 상태 (읽은 위치, 미리 읽어 둔 프로세스, 끝난 프로세스 수)
+        - 끝난 프로세스는 keep_completed일 때만 저장하므로 크기는 메모리에 남은 프로세스 수에 비례
+        """
+        return {
+            "sequence": self.sequence,
+            "exhausted": self.exhausted,
+            "last_arrival": self.last_arrival,
+            "buffer": [(sequence, process.pid, process.arrival, process.burst) for _, sequence, process in self.buffer],
+            "completed": [process.get_state() for process in self.completed],
+            "completed_count": self.completed_count,
+        }
+
+    def set_state(self, state: dict, records: List[tuple]) -> None:
+        """
+        같은 입력으로 새로 만든 스트림을 체크포인트 위치로 옮김 (records: 도착했지만 끝나지 않은 프로세스의 상태)
+        - 이미 읽은 입력은 다시 읽어 버리므로, 시뮬레이션을 시작하기 전에 호출해야 함
+        """
+        if self.sequence or self.buffer or self.resident:
+            raise ValueError("이미 읽기 시작한 스트림에는 체크포인트를 되돌릴 수 없습니다")
+        for _ in range(state["sequence"]):
+            if next(self.source, None) is None:
+                raise ValueError("입력이 체크포인트를 저장할 때보다 짧습니다")
+        self.sequence = state["sequence"]
+        self.exhausted = state["exhausted"]
+        self.last_arrival = state["last_arrival"]
+        self.buffer = [(arrival, sequence, Process(pid=pid, arrival=arrival, burst=burst))
+                       for sequence, pid, arrival, burst in state["buffer"]] # 저장한 힙 순서 그대로
+        for record in records:
+            process = Process(pid=record[0], arrival=record[1], burst=record[2])
+            process.clock = self.clock
+            self.resident[id(process)] = process
+        self.completed = []
+        for record in state["completed"]:
+            process = Process(pid=record[0], arrival=record[1], burst=record[2])
+            process.set_state(record)
+            self.completed.append(process)
+        self.completed_count = state["completed_count"]
+
+    def __iter__(self) -> Iterator[Process]:
+        """보관 중인 프로세스 (끝난 프로세스, 도착했지만 끝나지 않은 프로세스 순)"""
+        yield from self.completed
+        yield from list(self.resident.values())
+
+
+def open_source(file):
+    """경로면 열고, 파일 객체면 그대로 사용"""
+    if isinstance(file, str):
+        return open(file, encoding="utf-8", newline="")
+    return file
+
+
+CSV_FIELDS = ("pid", "arrival", "burst")
+
+
+def read_csv(file) -> Iterator[Process]:
+    """
+    CSV에서 프로세스를 한 줄씩 읽음
+    - 첫 줄에 pid, arrival, burst 열 이름이 모두 있으면 머리글로 보고 열을 이름으로 찾음, 아니면 앞의 세 열을 순서대로 사용
+    - 값이 정수가 아니거나 열이 모자라면 줄 번호와 열 이름을 담아 ValueError
+    """
+    stream = open_source(file)
+    try:
+        columns = (0, 1, 2)
+        first = True
+        reader = csv.reader(stream)
+        for row in reader:
+            if not row or row[0].startswith("#"):
+                continue
+            if first:
+                first = False
+                header = [name.strip().lower() for name in row]
+                if all(field in header for field in CSV_FIELDS):
+                    columns = tuple(header.index(field) for field in CSV_FIELDS)
+                    continue
+            values = []
+            for field, column in zip(CSV_FIELDS, columns):
+                if column >= len(row):
+                    raise ValueError(f"CSV {reader.line_num}번째 줄에 {field} 열이 없습니다")
+                try:
+                    values.append(int(row[column]))
+                except ValueError:
+                    raise ValueError(f"CSV {reader.line_num}번째 줄의 {field} 값이 정수가 아닙니다: {row[column]!r}") from None
+            yield Process(pid=values[0], arrival=values[1], burst=values[2])
+    finally:
+        if stream is not file:
+            stream.close()
+
+
+def read_jsonl(file) -> Iterator[Process]:
+    """JSONL에서 프로세스를 한 줄씩 읽음 (한 줄: {"pid": .., "arrival": .., "burst": ..})"""
+    stream = open_source(file)
+    try:
+        for line in stream:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield Process(pid=int(record["pid"]), arrival=int(record["arrival"]), burst=int(record["burst"]))
+    finally:
+        if stream is not file:
+            stream.close()
@@ -0,0 +1,213 @@
+from array import array
+from typing import Iterable, Iterator, Union
+from core.process import Process, WaitClock
+
+NONE = -(2 ** 63)                                   # 열에서 None을 나타내는 값
+
+
+class ProcessTable:
+    """
+    프로세스 정보를 열(array) 단위로 저장하는 프로세스 목록 (대규모 작업량용)
+    - 프로세스마다 객체를 두지 않고, 필요할 때 ProcessView를 만들어 Process처럼 사용
+    - list[Process] 대신 스케줄러와 SchedulerApp에 그대로 넘길 수 있음
+    """
+    def __init__(self, processes: Iterable[Process] = ()) -> None:
+        self.pid = array('q')                       # 프로세스 ID
+        self.arrival = array('q')                   # 도착 시간
+        self.burst = array('q')                     # 실행 시간
+        self.remaining = array('d')                 # 남은 실행 시간
+        self.start = array('q')                     # 시작 시간 (NONE: 시작 전)
+        self.wait = array('q')                      # 지난 대기 구간들의 대기 시간 합
+        self.waiting_since = array('q')             # 현재 대기 구간의 시작 시간 (NONE: 실행 중)
+        self.turnaround = array('q')                # 반환 시간 (NONE: 종료 전)
+        self.state = array('b')                     # 1: 실행 중, 0: 실행 중 아님
+        self.clock: WaitClock = None                # 대기 시간 계산용 시간 (스케줄러가 연결)
+        self.extend(processes)
+
+    def add(self, pid: int, arrival: int, burst: int) -> 'ProcessView':
+        self.pid.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.remaining.append(burst)
+        self.start.append(NONE)
+        self.wait.append(0)
+        self.waiting_since.append(arrival)
+        self.turnaround.append(NONE)
+        self.state.append(0)
+        return ProcessView(self, len(self.pid) - 1)
+
+    def append(self, process: Process) -> None:
+        """Process의 초기 정보(pid, 도착 시간, 실행 시간)를 복사해서 추가"""
+        self.add(process.pid, process.arrival, process.burst)
+
+    def extend(self, processes: Iterable[Process]) -> None:
+        for process in processes:
+            self.append(process)
+
+    def clear(self) -> None:
+        for column in (self.pid, self.arrival, self.burst, self.remaining, self.start,
+                       self.wait, self.waiting_since, self.turnaround, self.state):
+            del column[:]
+
+    @classmethod
+    def from_columns(cls, pid: Iterable[int], arrival: Iterable[int], burst: Iterable[int]) -> 'ProcessTable':
+        """pid, 도착 시간, 실행 시간 열을 한 번에 복사해서 만듦 (프로세스마다 add를 부르지 않음)"""
+        table = cls()
+        table.pid = array('q', pid)
+        table.arrival = array('q', arrival)
+        table.burst = array('q', burst)
+        if not len(table.pid) == len(table.arrival) == len(table.burst):
+            raise ValueError("열 길이가 서로 다릅니다")
+        table.reset()
+        return table
+
+    def reset(self) -> None:
+        """실행 결과 열을 한 번에 처음 상태로 되돌림 (pid, 도착 시간, 실행 시간 열은 그대로)"""
+        count = len(self.pid)
+        self.remaining = array('d', self.burst)
+        self.start = array('q', [NONE]) * count
+        self.wait = array('q', [0]) * count
+        self.waiting_since = array('q', self.arrival)
+        self.turnaround = array('q', [NONE]) * count
+        self.state = array('b', [0]) * count
+        self.clock = None
+
+    def without_pid(self, pid: int) -> 'ProcessTable':
+        """pid인 프로세스를 뺀 새 목록"""
+        return ProcessTable(p for p in self if p.pid != pid)
+
+    def arrival_order(self) -> 'ProcessTableOrder':
+        """도착 시간, PID 큰 값 우선으로 정렬한 순서 (스케줄러의 도착 대기 목록용)"""
+        indexes = sorted(range(len(self.pid)), key=lambda i: -self.pid[i])
+        indexes.sort(key=self.arrival.__getitem__) # 안정 정렬이므로 같은 도착 시간 안에서는 PID 순서 유지
+        return ProcessTableOrder(self, array('q', indexes))
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __getitem__(self, index: int) -> 'ProcessView':
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("프로세스 목록 범위를 벗어났습니다")
+        return ProcessView(self, index)
+
+    def __iter__(self) -> Iterator['ProcessView']:
+        for index in range(len(self.pid)):
+            yield ProcessView(self, index)
+
+
+class ProcessTableOrder:
+    """ProcessTable의 일부를 정해진 순서로 보여주는 목록 (인덱스만 저장)"""
+    def __init__(self, table: ProcessTable, indexes: array) -> None:
+        self.table = table
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            return [ProcessView(self.table, index) for index in self.indexes[key]]
+        return ProcessView(self.table, self.indexes[key])
+
+
+class ProcessView(Process):
+    """
+    ProcessTable의 한 행을 Process처럼 다루는 가벼운 객체
+    - 값은 모두 table의 열에 저장되므로 같은 행의 view끼리는 같은 프로세스로 취급
+    """
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: ProcessTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProcessView) and other.table is self.table and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.table), self.index))
+
+    def __repr__(self) -> str:
+        return f"ProcessView(pid={self.pid}, arrival={self.arrival}, burst={self.burst})"
+
+    @property
+    def pid(self):
+        return self.table.pid[self.index]
+
+    @property
+    def arrival(self):
+        return self.table.arrival[self.index]
+
+    @property
+    def burst(self):
+        return self.table.burst[self.index]
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value) -> None:
+        self.table.remaining[self.index] = value
+
+    @property
+    def start_time(self):
+        value = self.table.start[self.index]
+        return None if value == NONE else value
+
+    @start_time.setter
+    def start_time(self, value) -> None:
+        self.table.start[self.index] = NONE if value is None else value
+
+    @property
+    def accumulated_wait_time(self):
+        return self.table.wait[self.index]
+
+    @accumulated_wait_time.setter
+    def accumulated_wait_time(self, value) -> None:
+        self.table.wait[self.index] = value
+
+    @property
+    def waiting_since(self):
+        value = self.table.waiting_since[self.index]
+        return None if value == NONE else value
+
+    @waiting_since.setter
+    def waiting_since(self, value) -> None:
+        self.table.waiting_since[self.index] = NONE if value is None else value
+
+    @property
+    def turnaround_time(self):
+        value = self.table.turnaround[self.index]
+        return None if value == NONE else value
+
+    @turnaround_time.setter
+    def turnaround_time(self, value) -> None:
+        self.table.turnaround[self.index] = NONE if value is None else value
+
+    @property
+    def normalized_turnaround_time(self):
+        turnaround_time = self.turnaround_time
+        return None if turnaround_time is None else turnaround_time / self.burst
+
+    @normalized_turnaround_time.setter
+    def normalized_turnaround_time(self, value) -> None:
+        pass # 반환 시간과 실행 시간으로 계산
+
+    @property
+    def running(self):
+        return self.table.state[self.index] == 1
+
+    @running.setter
+    def running(self, value) -> None:
+        self.table.state[self.index] = 1 if value else 0
+
+    @property
+    def clock(self):
+        return self.table.clock
+
+    @clock.setter
+    def clock(self, value) -> None:
+        self.table.clock = value
@@ -1,15 +1,26 @@
 from core import Process
+from core.timeline import Timeline
+from typing import Callable
+import math
 
 class Processor:
+    __slots__ = (
+        'id', 'type', 'current_process', 'used_power', 'PowerOn', 'timeline', 'time_quantum_original', 'time_quantum',
+        'start_power', 'working_power', 'working_speed', 'dispatches', 'preemptions', 'idle_since',
+    )
+
     def __init__(self, id: int, type: str, time_quantum: int = None):
         self.id = id                                # 프로세서 ID
         self.type = type                            # 'P' 또는 'E' 코어 구분
         self.current_process: Process = None        # 현재 실행 중인 프로세스
         self.used_power = 0.0                       # 누적 사용 전력량
         self.PowerOn = False                        # 프로세서 전원 상태
-        self.process_queue = []                     # 디버깅용 프로세스 실행 로그
+        self.timeline = Timeline()                  # 프로세스 실행 기록 (구간 단위)
         self.time_quantum_original = time_quantum   # 초기 시간 쿼텀 (RR 스케줄링용)
         self.time_quantum = time_quantum            # 남은 시간 쿼텀 (RR 스케줄링용)
+        self.dispatches = 0                         # 프로세스를 할당한 횟수
+        self.preemptions = 0                        # 끝나지 않은 프로세스를 회수한 횟수
+        self.idle_since = None                      # 쉬는 동안 실행 기록을 미뤄 둔 시작 시간 (None이면 미룬 기록 없음)
         
         
         # 프로세서의 전력 사용량 및 속도
@@ -24,6 +35,55 @@ class Processor:
 
 
 
+    def reset(self) -> None:
+        """실행 기록, 사용 전력, 전원 상태를 처음 만든 상태로 되돌림"""
+        self.current_process = None
+        self.used_power = 0.0
+        self.PowerOn = False
+        self.timeline = Timeline()
+        self.time_quantum = self.time_quantum_original
+        self.dispatches = 0
+        self.preemptions = 0
+        self.idle_since = None
+
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        """체크포인트용 상태 (실행 중인 프로세스는 encode로 번호로 바꿔 저장)"""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "process": encode(self.current_process) if self.current_process is not None else None,
+            "used_power": self.used_power,
+            "power_on": self.PowerOn,
+            "time_quantum": self.time_quantum,
+            "dispatches": self.dispatches,
+            "preemptions": self.preemptions,
+            "timeline": self.timeline.get_state(),
+        }
+
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        """get_state()로 저장한 상태를 되돌림 (id나 종류가 다르면 ValueError)"""
+        if state["id"] != self.id or state["type"] != self.type:
+            raise ValueError(f"체크포인트의 프로세서가 구성과 다릅니다 ({state['id']}/{state['type']} != {self.id}/{self.type})")
+        self.current_process = decode(state["process"]) if state["process"] is not None else None
+        self.used_power = state["used_power"]
+        self.PowerOn = state["power_on"]
+        self.time_quantum = state["time_quantum"]
+        self.dispatches = state["dispatches"]
+        self.preemptions = state["preemptions"]
+        self.timeline.set_state(state["timeline"])
+
+    def record_idle_until(self, time: int) -> None:
+        """
+        쉬는 동안 미뤄 둔 실행 기록을 time 직전까지 채움 (스케줄러가 쉬는 프로세서를 매 단계 실행하지 않을 때 사용)
+        - idle_since ~ time - 1 시간마다 execute()를 호출한 것과 같은 결과 (시간 0은 기록하지 않음)
+        """
+        if self.idle_since is None:
+            return
+        ticks = time - max(self.idle_since, 1)
+        if ticks > 0:
+            self.timeline.record(0, ticks) # 실행 기록 (쉬는 중)
+        self.idle_since = max(self.idle_since, time)
+
     def is_time_quantum_expired(self, current_time: int) -> bool:
         """시간 쿼텀 만료 여부 확인 (RR 전용)"""
         return self.time_quantum is not None and self.time_quantum <= 0
@@ -38,6 +98,10 @@ class Processor:
         self.time_quantum = self.time_quantum_original
 
 
+    def ticks_to_completion(self) -> int:
+        """현재 프로세스가 완료되기까지 남은 실행 횟수 (이벤트 기반 시뮬레이션용)"""
+        return math.ceil(self.current_process.remaining_time / self.working_speed)
+
     def is_process_empty(self) -> bool:
         """할당된 프로세스가 없으면 True 반환"""
         return self.current_process is None
@@ -54,6 +118,7 @@ class Processor:
             self.PowerOn = True
             self.used_power += self.start_power
         self.current_process = process
+        self.dispatches += 1
         self.reset_time_quantum()
         self.current_process.start(current_time)
 
@@ -67,6 +132,7 @@ class Processor:
             process = self.current_process
             process.wait()
             self.current_process = None
+            self.preemptions += 1
             return process
         return None
 
@@ -81,7 +147,7 @@ class Processor:
         """
 
         if self.current_process:
-            self.process_queue.append(self.current_process.pid) # 디버깅용 로그
+            self.timeline.record(self.current_process.pid) # 실행 기록
 
             if self.time_quantum is not None:
                 self.decrease_time_quantum()
@@ -94,4 +160,25 @@ class Processor:
                 self.current_process = None
 
         elif current_time != 0:
-            self.process_queue.append(0) # 디버깅용 로그
\ No newline at end of file
+            self.timeline.record(0) # 실행 기록 (쉬는 중)
+
+    def fast_forward(self, ticks: int) -> None:
+        """
+        이벤트가 없는 구간을 한 번에 실행한다. (이벤트 기반 시뮬레이션용)
+        - execute()를 ticks 번 호출한 것과 같은 결과
+        - 구간 안에서 프로세스가 완료되거나 시간 쿼텀이 만료되지 않아야 함
+        """
+        if ticks <= 0:
+            return
+
+        if self.current_process:
+            self.timeline.record(self.current_process.pid, ticks) # 실행 기록
+
+            if self.time_quantum is not None:
+                self.time_quantum -= ticks
+
+            self.used_power += self.working_power * ticks
+            self.current_process.run(self.working_speed * ticks)
+
+        else:
+            self.timeline.record(0, ticks) # 실행 기록 (쉬는 중)
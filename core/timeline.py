@@ -0,0 +1,175 @@
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Tuple
+
+
+class Timeline:
+    """
+    프로세서 실행 기록 (같은 프로세스가 이어서 실행된 구간을 하나로 묶어 저장)
+    - 구간 i는 [starts[i], starts[i+1]) 동안 pids[i]가 실행됨 (마지막 구간은 end까지)
+    - PID 0은 쉬는 구간
+    """
+    __slots__ = ('pids', 'starts', 'end', 'busy')
+
+    def __init__(self) -> None:
+        self.pids = array('q')                      # 구간별 PID
+        self.starts = array('q')                    # 구간별 시작 시간
+        self.end = 0                                # 기록된 마지막 시간
+        self.busy = 0                               # 쉬지 않은(PID가 0이 아닌) 시간 합
+
+    def record(self, pid: int, ticks: int = 1) -> None:
+        """기록 끝에 pid가 ticks 만큼 실행된 것을 추가 (직전 구간과 PID가 같으면 구간을 늘림)"""
+        if ticks <= 0:
+            return
+        if not self.pids or self.pids[-1] != pid:
+            self.pids.append(pid)
+            self.starts.append(self.end)
+        self.end += ticks
+        if pid != 0:
+            self.busy += ticks
+
+    def get_state(self) -> dict:
+        """체크포인트용 상태 (구간 열은 바이트로 저장)"""
+        return {"pids": self.pids.tobytes(), "starts": self.starts.tobytes(), "end": self.end, "busy": self.busy}
+
+    def set_state(self, state: dict) -> None:
+        self.pids = array('q')
+        self.pids.frombytes(state["pids"])
+        self.starts = array('q')
+        self.starts.frombytes(state["starts"])
+        self.end = state["end"]
+        self.busy = state["busy"]
+
+    def segments(self) -> Iterator[Tuple[int, int, int]]:
+        """(pid, 시작 시간, 끝 시간) 구간 순회"""
+        for i in range(len(self.pids)):
+            end = self.starts[i + 1] if i + 1 < len(self.starts) else self.end
+            yield self.pids[i], self.starts[i], end
+
+    def pid_at(self, time: int) -> int:
+        """time ~ time+1 구간에 실행된 PID (기록이 없거나 쉬는 중이면 0)"""
+        if time < 0 or time >= self.end:
+            return 0
+        return self.pids[bisect_right(self.starts, time) - 1]
+
+    def __len__(self) -> int:
+        return self.end
+
+    def __iter__(self) -> Iterator[int]:
+        """시간 단위로 PID 순회 (디버깅 출력용)"""
+        for pid, start, end in self.segments():
+            for _ in range(end - start):
+                yield pid
+
+
+class BoundedTimeline:
+    """
+    최근 구간만 그대로 두고 오래된 구간은 고정 폭 묶음(bin)으로 줄여 보관하는 실행 기록 (GUI 간트 차트용)
+    - 최근 max_segments개 구간은 Timeline과 같이 (PID, 시작 시간)으로 보관
+    - 밀려난 구간은 bin_ticks 폭의 묶음마다 (가장 오래 실행한 PID, 그 PID의 실행 시간, 실행 시간 합)으로 합침
+      묶음이 max_bins개를 넘으면 이웃한 두 묶음을 하나로 합치고 폭을 두 배로 늘림
+      → 메모리는 실행 길이와 상관없이 max_segments + max_bins에 비례
+    - 묶음의 PID는 들어온 순서대로 고른 근사값 (같은 PID가 이어지면 실행 시간을 더하고, 더 길게 실행한 PID가 오면 바꿈)
+    """
+    __slots__ = ('pids', 'starts', 'head', 'end', 'max_segments', 'max_bins', 'bin_ticks', 'bin_pids', 'bin_pid_ticks', 'bin_busy')
+
+    def __init__(self, max_segments: int = 4096, max_bins: int = 2048, bin_ticks: int = 16) -> None:
+        self.pids = array('q')                      # 구간별 PID (head 앞은 이미 묶음으로 옮긴 구간)
+        self.starts = array('q')                    # 구간별 시작 시간
+        self.head = 0                               # 남아 있는 가장 오래된 구간 위치
+        self.end = 0                                # 기록된 마지막 시간
+        self.max_segments = max_segments            # 그대로 보관할 최근 구간 수
+        self.max_bins = max_bins                    # 묶음 수 상한
+        self.bin_ticks = bin_ticks                  # 묶음 하나의 폭 (tick)
+        self.bin_pids = array('q')                  # 묶음별 가장 오래 실행한 PID
+        self.bin_pid_ticks = array('q')             # 묶음별 그 PID의 실행 시간
+        self.bin_busy = array('q')                  # 묶음별 실행 시간 합
+
+    @property
+    def detail_start(self) -> int:
+        """구간으로 남아 있는 기록의 시작 시간 (이보다 앞은 묶음으로만 남음)"""
+        return self.starts[self.head] if self.head < len(self.starts) else self.end
+
+    def record(self, pid: int, ticks: int = 1) -> None:
+        """기록 끝에 pid가 ticks 만큼 실행된 것을 추가 (구간이 max_segments개를 넘으면 가장 오래된 구간을 묶음으로 옮김)"""
+        if ticks <= 0:
+            return
+        if self.head == len(self.pids) or self.pids[-1] != pid:
+            self.pids.append(pid)
+            self.starts.append(self.end)
+            if len(self.pids) - self.head > self.max_segments:
+                self.fold()
+        self.end += ticks
+
+    def fold(self) -> None:
+        """가장 오래된 구간을 묶음으로 옮김 (옮긴 구간이 max_segments개 쌓이면 배열 앞을 잘라 냄)"""
+        index = self.head
+        self.head += 1
+        self.add_to_bins(self.pids[index], self.starts[index], self.starts[index + 1])
+        if self.head >= self.max_segments:
+            del self.pids[:self.head]
+            del self.starts[:self.head]
+            self.head = 0
+
+    def add_to_bins(self, pid: int, start: int, end: int) -> None:
+        while end > self.bin_ticks * self.max_bins:
+            self.downsample()
+        width = self.bin_ticks
+        last = (end - 1) // width
+        while len(self.bin_pids) <= last:
+            self.bin_pids.append(0)
+            self.bin_pid_ticks.append(0)
+            self.bin_busy.append(0)
+        if pid == 0:
+            return
+        for index in range(start // width, last + 1):
+            ticks = min(end, (index + 1) * width) - max(start, index * width)
+            self.bin_busy[index] += ticks
+            if self.bin_pids[index] == pid:
+                self.bin_pid_ticks[index] += ticks
+            elif ticks > self.bin_pid_ticks[index]:
+                self.bin_pids[index] = pid
+                self.bin_pid_ticks[index] = ticks
+
+    def downsample(self) -> None:
+        """이웃한 두 묶음을 하나로 합치고 묶음 폭을 두 배로 늘림"""
+        pids, pid_ticks, busy = array('q'), array('q'), array('q')
+        for index in range(0, len(self.bin_pids), 2):
+            pid, ticks = self.bin_pids[index], self.bin_pid_ticks[index]
+            total = self.bin_busy[index]
+            if index + 1 < len(self.bin_pids):
+                other, other_ticks = self.bin_pids[index + 1], self.bin_pid_ticks[index + 1]
+                total += self.bin_busy[index + 1]
+                if other == pid:
+                    ticks += other_ticks
+                elif other_ticks > ticks:
+                    pid, ticks = other, other_ticks
+            pids.append(pid)
+            pid_ticks.append(ticks)
+            busy.append(total)
+        self.bin_pids, self.bin_pid_ticks, self.bin_busy = pids, pid_ticks, busy
+        self.bin_ticks *= 2
+
+    def segments(self, start: float = 0, end: float = None) -> Iterator[Tuple[int, int, int]]:
+        """start ~ end와 겹치는 남아 있는 (pid, 시작 시간, 끝 시간) 구간 순회"""
+        if end is None:
+            end = self.end
+        index = max(self.head, bisect_right(self.starts, start, self.head) - 1)
+        while index < len(self.pids) and self.starts[index] < end:
+            segment_end = self.starts[index + 1] if index + 1 < len(self.starts) else self.end
+            if segment_end > start:
+                yield self.pids[index], self.starts[index], segment_end
+            index += 1
+
+    def bins(self, start: float = 0, end: float = None) -> Iterator[Tuple[int, int, int, int, int]]:
+        """
+        start ~ end와 겹치는 묶음의 (시작 시간, 끝 시간, PID, PID 실행 시간, 실행 시간 합) 순회
+        - 끝 시간은 detail_start를 넘지 않음 (그 뒤는 segments()로 남아 있음)
+        """
+        detail_start = self.detail_start
+        end = detail_start if end is None else min(end, detail_start)
+        width = self.bin_ticks
+        index = max(0, int(start // width))
+        while index < len(self.bin_pids) and index * width < end:
+            yield index * width, min((index + 1) * width, detail_start), self.bin_pids[index], self.bin_pid_ticks[index], self.bin_busy[index]
+            index += 1
@@ -0,0 +1,59 @@
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+from core.process import Process
+from core.process_table import ProcessTable
+
+
+class Workload:
+    """
+    변경되지 않는 작업량 명세 (pid, 도착 시간, 실행 시간만 보관)
+    - 실행 상태는 담지 않으므로 같은 작업량으로 여러 스케줄러를 반복 실행할 수 있음
+    - to_processes(), to_table()로 매번 새 실행 상태를 만듦
+    """
+    __slots__ = ('_pids', '_arrivals', '_bursts')
+
+    def __init__(self, processes: Iterable[Tuple[int, int, int]] = ()) -> None:
+        pids, arrivals, bursts = array('q'), array('q'), array('q')
+        for pid, arrival, burst in processes:
+            pids.append(pid)
+            arrivals.append(arrival)
+            bursts.append(burst)
+        self._pids = pids
+        self._arrivals = arrivals
+        self._bursts = bursts
+
+    @classmethod
+    def from_columns(cls, pids: Iterable[int], arrivals: Iterable[int], bursts: Iterable[int]) -> 'Workload':
+        """pid, 도착 시간, 실행 시간 열을 그대로 복사해서 만듦"""
+        workload = cls()
+        workload._pids = array('q', pids)
+        workload._arrivals = array('q', arrivals)
+        workload._bursts = array('q', bursts)
+        if not len(workload._pids) == len(workload._arrivals) == len(workload._bursts):
+            raise ValueError("열 길이가 서로 다릅니다")
+        return workload
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Process]) -> 'Workload':
+        """Process 목록(또는 ProcessTable)의 초기 정보만 복사"""
+        if isinstance(processes, ProcessTable):
+            return cls.from_columns(processes.pid, processes.arrival, processes.burst)
+        return cls((p.pid, p.arrival, p.burst) for p in processes)
+
+    def to_processes(self) -> List[Process]:
+        return [Process(pid=pid, arrival=arrival, burst=burst) for pid, arrival, burst in self]
+
+    def to_table(self) -> ProcessTable:
+        return ProcessTable.from_columns(self._pids, self._arrivals, self._bursts)
+
+    def __len__(self) -> int:
+        return len(self._pids)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return zip(self._pids, self._arrivals, self._bursts)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Workload) and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
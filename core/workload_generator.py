@@ -0,0 +1,107 @@
+import random
+from array import array
+from typing import Iterable, Iterator, Tuple, Union
+from core.process import Process
+from core.processor import Processor
+from core.workload import Workload
+
+"""
+부하 테스트용 작업량 생성 모듈 (seed가 같으면 항상 같은 작업량)
+- 도착 분포
+  · poisson: 도착 간격이 지수 분포
+  · bursty: 묶음 단위로 한꺼번에 도착 (묶음 크기는 평균 batch_size인 기하 분포, 묶음 사이 간격은 지수 분포)
+- 실행 시간 분포 (평균 mean_burst, 최소 1)
+  · exponential: 지수 분포
+  · bimodal: 짧은 작업 80%, 긴 작업 20%
+  · pareto: 꼬리가 두꺼운 파레토 분포 (alpha = 1.5)
+- utilization: 프로세서 구성의 처리 능력(P 코어 2, E 코어 1) 대비 평균 부하
+  예) generate_workload(10 ** 6, "PPEE", utilization=0.9) -> 2P+2E에서 90% 부하
+"""
+
+ARRIVALS = ("poisson", "bursty")
+BURSTS = ("exponential", "bimodal", "pareto")
+
+PARETO_ALPHA = 1.5
+BIMODAL_SHORT_RATIO = 0.8
+
+
+def processing_capacity(processors: Union[str, Iterable[Union[str, Processor]]]) -> float:
+    """
+    프로세서 구성이 한 시간 단위에 처리하는 실행 시간 합
+    (processors: "PPEE" 같은 문자열, 코어 타입 목록 또는 Processor 목록)
+    """
+    capacity = 0.0
+    for processor in processors:
+        if not isinstance(processor, Processor):
+            processor = Processor(id=0, type=processor)
+        capacity += processor.working_speed
+    if capacity <= 0:
+        raise ValueError("프로세서가 하나 이상 필요합니다")
+    return capacity
+
+
+def burst_sampler(rng: random.Random, distribution: str, mean_burst: float):
+    """평균이 mean_burst 근처인 정수 실행 시간(최소 1)을 뽑는 함수 반환"""
+    if distribution == "exponential":
+        rate = 1.0 / mean_burst
+        return lambda: max(1, round(rng.expovariate(rate)))
+    if distribution == "bimodal":
+        short = max(1, round(mean_burst / 4))
+        long = max(1, round((mean_burst - BIMODAL_SHORT_RATIO * short) / (1 - BIMODAL_SHORT_RATIO)))
+        return lambda: short if rng.random() < BIMODAL_SHORT_RATIO else long
+    if distribution == "pareto":
+        scale = mean_burst * (PARETO_ALPHA - 1) / PARETO_ALPHA
+        return lambda: max(1, round(scale * rng.paretovariate(PARETO_ALPHA)))
+    raise ValueError(f"지원하지 않는 실행 시간 분포입니다: {distribution} (가능: {', '.join(BURSTS)})")
+
+
+def generate_rows(count: int, processors: Union[str, Iterable] = "PE", utilization: float = 0.8,
+                  arrival: str = "poisson", burst: str = "exponential", mean_burst: float = 5.0,
+                  batch_size: float = 8.0, seed: int = 0) -> Iterator[Tuple[int, int, int]]:
+    """(pid, 도착 시간, 실행 시간)을 도착 순서로 생성 (pid는 1부터)"""
+    if count < 0:
+        raise ValueError("프로세스 수는 0 이상이어야 합니다")
+    if utilization <= 0:
+        raise ValueError("utilization은 양수여야 합니다")
+    if mean_burst < 1:
+        raise ValueError("mean_burst는 1 이상이어야 합니다")
+    if arrival not in ARRIVALS:
+        raise ValueError(f"지원하지 않는 도착 분포입니다: {arrival} (가능: {', '.join(ARRIVALS)})")
+
+    rng = random.Random(seed)
+    sample_burst = burst_sampler(rng, burst, mean_burst)
+    rate = utilization * processing_capacity(processors) / mean_burst    # 시간 단위당 평균 도착 수
+    if arrival == "bursty":
+        batch_rate = rate / batch_size
+        continue_probability = 1 - 1 / batch_size
+
+    time = 0.0
+    pid = 0
+    while pid < count:
+        if arrival == "poisson":
+            time += rng.expovariate(rate)
+            size = 1
+        else:
+            time += rng.expovariate(batch_rate)
+            size = 1
+            while rng.random() < continue_probability:
+                size += 1
+        for _ in range(min(size, count - pid)):
+            pid += 1
+            yield pid, int(time), sample_burst()
+
+
+def generate_workload(count: int, processors: Union[str, Iterable] = "PE", **options) -> Workload:
+    """생성한 작업량을 열 단위로 바로 담아 반환 (SchedulerApp.load_workload, 배치 실행용)"""
+    pids, arrivals, bursts = array('q'), array('q'), array('q')
+    for pid, arrival, burst in generate_rows(count, processors, **options):
+        pids.append(pid)
+        arrivals.append(arrival)
+        bursts.append(burst)
+    return Workload.from_columns(pids, arrivals, bursts)
+
+
+def generate_processes(count: int, processors: Union[str, Iterable] = "PE", **options) -> Iterator[Process]:
+    """생성한 작업량을 Process로 하나씩 반환 (SchedulerApp.load_stream용, 전체를 메모리에 올리지 않음)"""
+    for pid, arrival, burst in generate_rows(count, processors, **options):
+        yield Process(pid=pid, arrival=arrival, burst=burst)
@@ -3,10 +3,11 @@ from core import Processor
 from scheduler import CustomScheduler
 from simulator import SchedulerApp
 from scheduler import SchedulerType
+from scheduler import TextTraceSink
 
 # 스케쥴러 작동 테스트 하는 곳
 def main():
-    app = SchedulerApp(scheduler_type=SchedulerType.FCFS)
+    app = SchedulerApp(scheduler_type=SchedulerType.FCFS, trace=TextTraceSink())
     processes = [
         Process(pid=1, arrival=0, burst=7),
         Process(pid=2, arrival=1, burst=6),
@@ -1,3 +1,11 @@
+from .stats import SimulationStats
+from .metrics import RunningStat, QuantileSketch, StreamingMetrics
+from .trace import TraceSink, NullTraceSink, TextTraceSink, JSONLTraceSink
+from .replay import RecordingTraceSink, Replay, SimulationCancelled
+from .arrivals import SortedArrivals
+from .checkpoint import Checkpointer
+from .event_queue import EventQueue, EventType
+from .ready_queue import ReadyQueue, FIFOReadyQueue, HeapReadyQueue, ResponseRatioReadyQueue, RunQueues
 from .base_scheduler import BaseScheduler
 from .fcfs_scheduler import FCFSScheduler
 from .rr_scheduler import RRScheduler
@@ -0,0 +1,56 @@
+from typing import List, Optional
+from core.process import Process
+
+
+class SortedArrivals:
+    """
+    아직 도착하지 않은 프로세스 목록 (도착 시간, PID 큰 값 우선으로 한 번만 정렬하고 위치만 옮김)
+    - ProcessStream과 같은 메서드(next_time, pop_arrived, complete, 체크포인트용 get_state/set_state)를 제공해 스케줄러가 구분 없이 사용
+    """
+    def __init__(self, processes) -> None:
+        self.processes = processes                  # 정렬된 프로세스 목록 (list 또는 ProcessTableOrder)
+        self.index = 0                              # 다음에 도착할 프로세스 위치
+
+    def next_time(self) -> Optional[int]:
+        """다음에 도착할 프로세스의 도착 시간 (없으면 None)"""
+        if self.index < len(self.processes):
+            return self.processes[self.index].arrival
+        return None
+
+    def pop_arrived(self, time: int) -> List[Process]:
+        """time까지 도착한 프로세스를 꺼냄 (PID 큰 값 우선)"""
+        start = self.index
+        end = start
+        while end < len(self.processes) and self.processes[end].arrival <= time:
+            end += 1
+        if start == end:
+            return []
+        self.index = end
+
+        arrived = self.processes[start:end]
+        if arrived[0].arrival != arrived[-1].arrival: # 도착 시간이 섞인 경우에도 PID 순서 유지
+            arrived.sort(key=lambda p: -p.pid)
+        return arrived
+
+    def complete(self, process: Process) -> None:
+        pass # 모든 프로세스를 처음부터 보관하므로 할 일 없음
+
+    def saved_processes(self) -> list:
+        """체크포인트에 상태를 저장할 프로세스 (이미 도착한 프로세스)"""
+        return self.processes[:self.index]
+
+    def get_state(self) -> dict:
+        return {"index": self.index}
+
+    def set_state(self, state: dict, records: List[tuple]) -> None:
+        """도착 위치만 되돌림 (프로세스는 같은 작업량으로 다시 만든 목록을 그대로 사용)"""
+        if not 0 <= state["index"] <= len(self.processes):
+            raise ValueError("체크포인트의 작업량 크기가 다릅니다")
+        self.index = state["index"]
+
+    def __len__(self) -> int:
+        """남은 프로세스 수"""
+        return len(self.processes) - self.index
+
+    def __bool__(self) -> bool:
+        return self.index < len(self.processes)
@@ -1,19 +1,131 @@
 from abc import ABC, abstractmethod
-from core.process import Process
-from typing import List
+from bisect import bisect_right, insort
+from core.process import Process, WaitClock
+from core.process_table import ProcessTable
+from core.process_stream import ProcessStream
+from typing import Iterator, List
 from core.processor import Processor
-from collections import deque
-import heapq
+from scheduler.arrivals import SortedArrivals
+from scheduler.event_queue import EventQueue
+from scheduler.ready_queue import ReadyQueue, FIFOReadyQueue, RunQueues
+from scheduler.metrics import StreamingMetrics
+from scheduler.stats import SimulationStats
+from scheduler.trace import TraceSink, NullTraceSink
+from scheduler.checkpoint import Checkpointer
+from scheduler import checkpoint as checkpoint_file
 
 # 추상 클래스
 class BaseScheduler(ABC):
-    def __init__(self, processes: List[Process], processors_info: List[Processor]) -> None:
+    def __init__(self, processes: List[Process], processors_info: List[Processor], trace: TraceSink = None,
+                 stats: SimulationStats = None, metrics: StreamingMetrics = None, checkpoint: Checkpointer = None,
+                 multi_queue: bool = False) -> None:
         self.processes = processes                  # 프로세스 리스트
         # P 코어 우선할당
         self.processors_info = sorted(processors_info, key=lambda p: 0 if p.type.upper() == 'P' else 1)
         self.current_time = 0                       # 현재 시간
-        self.ready_queue = deque()                  # 대기 큐
+        self.index_processors()
+        self.multi_queue = multi_queue              # True면 프로세서마다 대기 큐를 따로 둠 (RunQueues 참고)
+        if multi_queue:
+            self.ready_queue = RunQueues(self.create_ready_queue, len(self.processors_info),
+                                         busy=lambda order: not self.processors_info[order].is_process_empty())
+        else:
+            self.ready_queue = self.create_ready_queue()  # 대기 큐
         self.current_power = 0                      # 현재 프로세서의 전력 사용량
+        self.wait_clock = WaitClock()               # 대기 시간을 반영한 시간
+        self.trace = trace if trace is not None else NullTraceSink()  # 추적 출력 (기본은 출력 안 함)
+        self.step_count = 0                         # 스케줄링 단계를 실행한 횟수 (tick 또는 이벤트 수)
+        # 아직 도착하지 않은 프로세스 (ProcessStream은 도착할 때 읽어 옴, 나머지는 한 번만 정렬)
+        if isinstance(processes, ProcessStream):
+            processes.clock = self.wait_clock
+            self.arrivals = processes
+        elif isinstance(processes, ProcessTable):
+            processes.clock = self.wait_clock
+            self.arrivals = SortedArrivals(processes.arrival_order())
+        else:
+            for process in processes:
+                process.clock = self.wait_clock
+            self.arrivals = SortedArrivals(sorted(processes, key=lambda p: (p.arrival, -p.pid)))
+        self.stats = stats                          # 단계별 측정 (None이면 측정 안 함)
+        if stats is not None:
+            stats.attach(self)
+        self.metrics = metrics                      # 끝난 프로세스 결과 집계 (None이면 집계 안 함)
+        if metrics is not None:
+            metrics.attach(self)
+        self.checkpoint = checkpoint                # 주기적 체크포인트 저장 (None이면 저장 안 함)
+
+    def index_processors(self) -> None:
+        """
+        프로세서 상태로 실행 중, 쉬는 프로세서 목록을 새로 만듦 (목록은 processors_info 순서 번호, 즉 P 코어 우선 순서로 정렬)
+        - 쉬는 프로세서는 매 단계 실행하지 않고 실행 기록을 미뤄 둠 (record_idle_until 참고)
+        """
+        self.busy_order = []                        # 실행 중인 프로세서 순서 번호
+        self.idle_order = []                        # 쉬는 프로세서 순서 번호
+        self.released = []                          # 이번 단계에 비게 된 프로세서 (전원 끄기용)
+        for order, processor in enumerate(self.processors_info):
+            if processor.is_process_empty():
+                self.idle_order.append(order)
+                processor.idle_since = self.current_time
+                if processor.PowerOn:
+                    self.released.append(processor)
+            else:
+                self.busy_order.append(order)
+                processor.idle_since = None
+
+    def sync_idle_processors(self, time: int) -> None:
+        """쉬는 프로세서의 미뤄 둔 실행 기록을 time 직전까지 채움 (실행 기록을 읽기 전에 호출)"""
+        for order in self.idle_order:
+            self.processors_info[order].record_idle_until(time)
+
+    def dispatch_order(self) -> Iterator[Processor]:
+        """
+        할당 단계에서 살펴볼 프로세서를 P 코어 우선 순서로 내보냄
+        - 실행 중인 프로세서는 모두, 쉬는 프로세서는 그 차례에 대기 큐가 비어 있지 않을 때만
+          (모든 프로세서를 순서대로 살펴보는 것과 같은 결과, 쉬는 프로세서를 보는 횟수는 할당 횟수와 같음)
+        - 각 프로세서를 처리한 뒤 실행 중, 쉬는 프로세서 목록을 고침
+        - 멀티 큐 모드면 처리하는 동안 그 프로세서의 큐를 ready_queue로 고르고,
+          큐가 빈 쉬는 프로세서는 다른 프로세서의 큐에서 프로세스를 가져옴
+        """
+        processors = self.processors_info
+        run_queues = self.ready_queue if self.multi_queue else None
+        busy = list(self.busy_order)
+        index = 0
+        last = -1
+        idled = []                                  # 이번 단계에 비게 된 프로세서 (끝난 뒤 쉬는 목록에 넣음)
+        while True:
+            next_busy = busy[index] if index < len(busy) else len(processors)
+            order = None
+            if self.ready_queue:
+                position = bisect_right(self.idle_order, last)
+                if position < len(self.idle_order) and self.idle_order[position] < next_busy:
+                    order = self.idle_order.pop(position)
+                    was_busy = False
+            if order is None:
+                if index >= len(busy):
+                    break
+                order = next_busy
+                index += 1
+                was_busy = True
+            last = order
+            processor = processors[order]
+            if run_queues is not None:
+                run_queues.select(order)
+                if not was_busy and not run_queues:
+                    run_queues.steal(order)
+            yield processor
+            if run_queues is not None:
+                run_queues.select(None)
+                run_queues.update(order)            # 실행 여부가 바뀌었을 수 있음
+            if processor.is_process_empty():
+                idled.append(order)
+                if was_busy:
+                    self.busy_order.remove(order)
+                    self.released.append(processor)
+            elif not was_busy:
+                processor.record_idle_until(self.current_time + 1)
+                processor.idle_since = None
+                insort(self.busy_order, order)
+        for order in idled:
+            insort(self.idle_order, order)
 
     def simulate(self) -> None:
         """스케줄링 시뮬레이션 실행"""
@@ -24,10 +136,129 @@ class BaseScheduler(ABC):
             self.power_off_idle_processors()          # 프로세서 전원 끄기
             self.process_waiting_time_update()  # 대기 중인 프로세스의 대기 시간 업데이트
             self.log_state()                    # 현재 상태 출력 (디버깅용)
+            self.step_count += 1
             self.update_current_time()          # 현재 시간 업데이트
+            if self.checkpoint is not None:
+                self.checkpoint.step(self)      # 주기가 되면 체크포인트 저장
+        self.sync_idle_processors(self.current_time)
+        if self.stats is not None:
+            self.stats.collect()
+
+    def simulate_event_driven(self) -> None:
+        """
+        이벤트 기반 스케줄링 시뮬레이션 실행
+        - 도착, 완료, 시간 쿼텀 만료가 있는 시간에만 스케줄링 단계를 실행
+        - 사이 구간은 한 번에 건너뛰며 simulate()와 같은 결과를 냄
+        """
+        event_queue = EventQueue()
+        while self.has_next():
+            self.update_ready_queue()           # 대기 큐 업데이트
+            self.schedule()                     # 스케줄링 알고리즘 실행
+            self.assign_process()               # 프로세서에 프로세스 할당
+            self.power_off_idle_processors()          # 프로세서 전원 끄기
+            self.process_waiting_time_update()  # 대기 중인 프로세스의 대기 시간 업데이트
+            self.log_state()                    # 현재 상태 출력 (디버깅용)
+            self.step_count += 1
+            self.advance_to_next_event(event_queue)  # 다음 이벤트 시간으로 이동
+            if self.checkpoint is not None:
+                self.checkpoint.step(self)      # 주기가 되면 체크포인트 저장
+        self.sync_idle_processors(self.current_time)
+        if self.stats is not None:
+            self.stats.collect()
+
+    def advance_to_next_event(self, event_queue: EventQueue) -> None:
+        """
+        다음 이벤트 직전까지의 구간을 한 번에 실행하고 현재 시간을 이벤트 시간으로 옮기는 메서드
+        (구간 안에서는 도착, 완료, 선점이 없으므로 실행과 대기 시간만 누적됨)
+        """
+        arrival_time = self.arrivals.next_time()
+        if arrival_time is not None:
+            event_queue.schedule_arrival(arrival_time)
+        for processor in list(event_queue.scheduled):  # 비게 된 프로세서의 예약 취소
+            if processor.is_process_empty():
+                event_queue.reschedule(processor, self.current_time)
+        for order in self.busy_order:
+            event_queue.reschedule(self.processors_info[order], self.current_time)
+        next_time = event_queue.next_time(self.current_time)
+        if next_time is None:
+            self.update_current_time()
+            return
+
+        skipped = next_time - self.current_time - 1
+        if skipped > 0:
+            for order in self.busy_order:           # 쉬는 프로세서는 나중에 한 번에 기록
+                self.processors_info[order].fast_forward(skipped)
+            self.process_waiting_time_update(skipped)
+        self.current_time = next_time
 
     
     
+    def get_state(self) -> dict:
+        """
+        체크포인트용 상태 (스케줄링 단계 사이, 즉 simulate()의 반복 사이에서만 호출)
+        - 현재 시간, 대기 큐 순서, 프로세서 할당과 남은 시간 쿼텀, 전원 상태와 누적 전력, 실행 기록, 집계 지표
+        - 프로세스는 도착한 프로세스의 상태만 저장 (ProcessStream이면 도착했지만 끝나지 않은 프로세스만)
+          대기 큐와 프로세서는 그 목록 안의 번호로 프로세스를 가리킴
+        - 이벤트 큐는 저장하지 않음 (이어서 실행할 때 현재 상태로 다시 예약해도 같은 결과)
+        - SimulationStats의 단계별 시간은 저장하지 않음
+        """
+        self.sync_idle_processors(self.current_time)
+        processes = self.arrivals.saved_processes()
+        refs = {process: ref for ref, process in enumerate(processes)}
+        return {
+            "scheduler": type(self).__name__,
+            "multi_queue": self.multi_queue,
+            "current_time": self.current_time,
+            "step_count": self.step_count,
+            "wait_clock": self.wait_clock.time,
+            "current_power": self.current_power,
+            "arrivals": self.arrivals.get_state(),
+            "processes": [process.get_state() for process in processes],
+            "ready_queue": self.ready_queue.get_state(refs.__getitem__),
+            "processors": [processor.get_state(refs.__getitem__) for processor in self.processors_info],
+            "metrics": self.metrics.get_state() if self.metrics is not None else None,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        get_state()로 저장한 상태를 되돌림 (같은 작업량, 프로세서 구성으로 새로 만든 스케줄러에서 시작 전에 호출)
+        - 이후 simulate() 또는 simulate_event_driven()을 호출하면 중단 없이 실행한 것과 같은 결과를 냄
+        """
+        if state["scheduler"] != type(self).__name__:
+            raise ValueError(f"체크포인트의 스케줄러가 다릅니다 ({state['scheduler']} != {type(self).__name__})")
+        if state["multi_queue"] != self.multi_queue:
+            raise ValueError("체크포인트의 대기 큐 모드가 다릅니다")
+        if len(state["processors"]) != len(self.processors_info):
+            raise ValueError("체크포인트의 프로세서 수가 다릅니다")
+        if self.metrics is not None and state["metrics"] is None:
+            raise ValueError("체크포인트에 집계 지표가 없습니다")
+        self.current_time = state["current_time"]
+        self.step_count = state["step_count"]
+        self.wait_clock.time = state["wait_clock"]
+        self.current_power = state["current_power"]
+        self.arrivals.set_state(state["arrivals"], state["processes"])
+        processes = self.arrivals.saved_processes()
+        if len(processes) != len(state["processes"]):
+            raise ValueError("체크포인트의 프로세스 수가 다릅니다")
+        for process, record in zip(processes, state["processes"]):
+            process.set_state(record)                # 대기 큐의 key가 프로세스 상태를 쓰므로 먼저 되돌림
+        self.ready_queue.set_state(state["ready_queue"], processes.__getitem__)
+        for processor, processor_state in zip(self.processors_info, state["processors"]):
+            processor.set_state(processor_state, processes.__getitem__)
+        self.index_processors()
+        if self.multi_queue:
+            self.ready_queue.reindex()              # 프로세서 할당을 되돌린 뒤 부하를 다시 계산
+        if self.metrics is not None:
+            self.metrics.set_state(state["metrics"])
+
+    def save_checkpoint(self, path: str) -> None:
+        """현재 상태를 체크포인트 파일로 저장"""
+        checkpoint_file.save(self, path)
+
+    def restore_checkpoint(self, path: str) -> None:
+        """체크포인트 파일의 상태를 되돌림 (set_state 참고)"""
+        checkpoint_file.load(self, path)
+
     @abstractmethod
     def assign_process(self) -> None:
         """
@@ -36,38 +267,57 @@ class BaseScheduler(ABC):
         pass
     
     
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        스케줄러가 사용할 대기 큐 생성 (기본은 FIFO, 정렬 기준이 있는 스케줄러는 재정의)
+        """
+        return FIFOReadyQueue()
+
     def schedule(self)-> None:
-        """프로세서 실행"""
-        for processor in self.processors_info:
+        """실행 중인 프로세서 실행 (쉬는 프로세서의 실행 기록은 미뤄 둠)"""
+        for order in list(self.busy_order):
+            processor = self.processors_info[order]
+            process = processor.current_process
             processor.execute(self.current_time)
+            if processor.current_process is None: # 실행이 끝난 프로세스
+                self.busy_order.remove(order)
+                insort(self.idle_order, order)
+                self.released.append(processor)
+                if self.multi_queue:
+                    self.ready_queue.update(order)
+                self.complete_process(process)
+
+    def complete_process(self, process: Process) -> None:
+        """끝난 프로세스를 집계에 반영하고 도착 목록에서 내보냄"""
+        if self.metrics is not None:
+            self.metrics.add(process)
+        self.arrivals.complete(process)
     
     def update_ready_queue(self) -> None:
         """도착한 프로세스를 대기 큐에 추가 (PID 우선순위: 큰 값 우선)"""
-        process_priority_queue = []
-        for process in self.processes:
-            # 프로세스가 도착했지만 대기 큐에 없고 실행 중이지 않으며 남은 시간이 있는 경우
-            if process.arrival <= self.current_time and not process.is_running() and process not in self.ready_queue and process.remaining_time > 0:
-                heapq.heappush(process_priority_queue, (-process.pid, process))
-        while process_priority_queue:
-            process = heapq.heappop(process_priority_queue)[1]
-            self.ready_queue.appendleft(process)
+        for process in self.arrivals.pop_arrived(self.current_time):
+            if process.remaining_time > 0:
+                self.ready_queue.push(process)
 
 
-    def process_waiting_time_update(self) -> None:
+    def process_waiting_time_update(self, elapsed: int = 1) -> None:
         """
         대기 중인 프로세스의 대기 시간을 업데이트하는 메서드
+        (elapsed: 누적할 시간, 이벤트 기반 시뮬레이션에서 건너뛴 구간 처리용)
+        - 도착했지만 실행 중이지 않으며 남은 시간이 있는 프로세스는 모두 함께 대기하므로
+          공용 시간만 진행하고, 각 프로세스는 상태가 바뀔 때 대기 시간을 반영함
         """
-        for process in self.processes:
-            # 프로세스가 도착했지만 실행 중이지 않으며 남은 시간이 있는 경우
-            if process.arrival <= self.current_time and not process.is_running() and process.remaining_time > 0:
-                process.wait_time+=1
+        self.wait_clock.time += elapsed
 
     
     def has_next(self)-> bool:
         """
         시뮬레이션이 계속 진행될 수 있는지 확인하는 메서드
+        (도착할 프로세스, 대기 중인 프로세스, 실행 중인 프로세스 중 하나라도 있으면 계속)
         """
-        return any(process.turnaround_time is None for process in self.processes)
+        if self.arrivals or self.ready_queue:
+            return True
+        return bool(self.busy_order)
     
     
     def calculate_total_power(self) -> float:
@@ -83,10 +333,15 @@ class BaseScheduler(ABC):
         """
         프로세서의 전원을 끄는 메서드
         (할당된 프로세스가 없고 대기 중인 프로세스가 없고 전원이 켜져 있는 경우)
+        - 전원이 켜진 채 쉬는 프로세서는 이번 단계에 비게 된 프로세서뿐이므로 그것만 확인
+        - 다음 단계부터 쉬는 동안의 실행 기록을 미뤄 둠
         """
-        for processor in self.processors_info:
-            if processor.is_process_empty() and processor.PowerOn:
+        for processor in self.released:
+            if processor.is_process_empty():
                 processor.PowerOn = False
+                if processor.idle_since is None:
+                    processor.idle_since = self.current_time + 1
+        self.released.clear()
     
     def update_current_time(self) -> None:
         self.current_time += 1
@@ -110,62 +365,15 @@ class BaseScheduler(ABC):
     # 디버깅용 출력 메서드들
     def log_state(self) -> None:
         """
-        현재 시간과 프로세스 상태를 출력 (디버깅용)
+        현재 시간과 프로세스 상태를 추적 출력으로 보냄 (디버깅용)
         """
-        waiting_processes = [p for p in self.processes if not p.is_completed() and not p.is_running()]
-        ended_processes = [p for p in self.processes if p.is_completed()]
-        
-        print("-----------")
-        print(f"현재 시간: {self.current_time}")
-        print(f"현재 전력 사용량: {self.calculate_total_power()}")
-        print(f"현재 대기 큐:", end="")
-        for process in self.ready_queue:
-            print(f" {process.pid}", end="")
-        print()
-        print("실행 중인 프로세스")
-        for processor in self.processors_info:
-            if(processor.PowerOn == False): print(f"[꺼짐]", end="")
-            else: print(f"[켜짐]", end="")
-            print(f"프로세서 {processor.id} |", end="")
-            if(processor.time_quantum is not None): print(f"시간 쿼텀: {processor.time_quantum}", end="")
-            if(processor.current_process):
-                processor.current_process.log_state()
-            else:
-                print("없음")
-            
-        print("쉬는 프로세스")
-        for process in waiting_processes:
-            process.log_state()
-        
-        print("종료된 프로세스")
-        for process in ended_processes:
-            process.log_state()
-        print("-----------")
-        print()
-        print()
+        if self.trace.enabled:
+            self.sync_idle_processors(self.current_time + 1)
+            self.trace.state(self)
     
     def log_process_queue(self) -> None:
         """
-        프로세스 큐를 출력 (디버깅용)
+        프로세서별 실행 기록과 결과를 추적 출력으로 보냄 (디버깅용)
         """
-        cell_width = 5
-        header = "프로세서 시간|"
-        for t in range(1, self.current_time):
-            header += f"{str(t).rjust(cell_width)}"
-        print(header)
-        for processor in self.processors_info:
-            row = f"프로세서 {processor.id}".ljust(9) + "|"
-            for pid in processor.process_queue:
-                cell = str(pid) if pid is not None else "-"
-                row += f"{cell.rjust(cell_width)}"
-            print(row)
-
-        # 평균 NTT 값 (성능평가용)
-        ended_processes = [p for p in self.processes if p.is_completed()]
-        sum_ntt = 0
-        for process in ended_processes:
-            sum_ntt += process.normalized_turnaround_time
-        avg_ntt = sum_ntt / len(ended_processes)
-        print("평균 NTT : ", avg_ntt)
-
-        
+        if self.trace.enabled:
+            self.trace.summary(self)
@@ -0,0 +1,84 @@
+import io
+import os
+import pickle
+import zlib
+
+"""
+실행 중인 시뮬레이션을 파일로 저장하고 이어서 실행하는 모듈
+- 파일 형식: MAGIC + 버전(1바이트) + zlib으로 압축한 pickle (숫자, 문자열, 바이트, list, tuple, dict만 포함)
+- 저장 내용은 BaseScheduler.get_state() 참고 (프로세스 목록 자체는 저장하지 않으므로 같은 작업량, 프로세서 구성으로
+  새로 만든 스케줄러에 되돌려야 함)
+"""
+
+MAGIC = b"SCHEDCKPT"
+VERSION = 1
+
+
+class StateUnpickler(pickle.Unpickler):
+    """클래스나 함수를 만들지 않는 Unpickler (기본 자료형만 읽음)"""
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"체크포인트에 허용되지 않은 객체가 있습니다: {module}.{name}")
+
+
+def dumps(state: dict) -> bytes:
+    return MAGIC + bytes([VERSION]) + zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def loads(data: bytes) -> dict:
+    if not data.startswith(MAGIC):
+        raise ValueError("체크포인트 파일이 아닙니다")
+    version = data[len(MAGIC)]
+    if version != VERSION:
+        raise ValueError(f"지원하지 않는 체크포인트 버전입니다: {version}")
+    return StateUnpickler(io.BytesIO(zlib.decompress(data[len(MAGIC) + 1:]))).load()
+
+
+def save(scheduler, path: str) -> None:
+    """
+    스케줄러 상태를 path에 저장
+    - 임시 파일에 쓴 뒤 바꿔치기하므로, 저장 도중 종료되어도 이전 체크포인트는 남음
+    """
+    data = dumps(scheduler.get_state())
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def load(scheduler, path: str) -> None:
+    """path의 체크포인트를 스케줄러에 되돌림 (시뮬레이션을 시작하기 전에 호출)"""
+    with open(path, "rb") as file:
+        scheduler.set_state(loads(file.read()))
+
+
+class Checkpointer:
+    """
+    시뮬레이션 중 주기적으로 체크포인트를 저장 (스케줄러에 넘기면 스케줄링 단계가 끝날 때마다 확인)
+    - every_steps: 스케줄링 단계(tick 또는 이벤트) every_steps 번마다 저장
+    - every_time: 시뮬레이션 시간이 every_time 만큼 지날 때마다 저장
+    - 저장 비용은 남은 프로세스와 실행 기록 구간 수에 비례 (지난 tick 수와는 무관)
+    """
+    def __init__(self, path: str, every_steps: int = None, every_time: int = None) -> None:
+        if every_steps is not None and every_steps <= 0 or every_time is not None and every_time <= 0:
+            raise ValueError("체크포인트 주기는 1 이상이어야 합니다")
+        self.path = path
+        self.every_steps = every_steps
+        self.every_time = every_time
+        self.next_time = None                       # 다음에 저장할 시뮬레이션 시간 (every_time용)
+        self.saved = 0                              # 저장한 횟수
+
+    def step(self, scheduler) -> None:
+        """스케줄링 단계가 끝난 뒤 호출 (주기가 되면 저장)"""
+        due = self.every_steps is not None and scheduler.step_count % self.every_steps == 0
+        if self.every_time is not None:
+            if self.next_time is None:
+                self.next_time = scheduler.current_time - scheduler.current_time % self.every_time + self.every_time
+            if scheduler.current_time >= self.next_time:
+                due = True
+                self.next_time = scheduler.current_time - scheduler.current_time % self.every_time + self.every_time
+        if due:
+            self.save(scheduler)
+
+    def save(self, scheduler) -> None:
+        save(scheduler, self.path)
+        self.saved += 1
@@ -0,0 +1,105 @@
+from scheduler.arrivals import SortedArrivals
+from scheduler.base_scheduler import BaseScheduler
+from scheduler.fcfs_scheduler import FCFSScheduler
+from scheduler.spn_scheduler import SPNScheduler
+import heapq
+import math
+
+"""
+비선점 FCFS, SPN의 결과를 시간 단위 시뮬레이션 없이 바로 계산하는 모듈
+- 프로세스마다 할당 시간만 구하면 시작, 대기, 반환 시간과 전력이 모두 정해짐
+- simulate()와 같은 규칙을 따름
+  · 같은 시간에 끝난 프로세서와 쉬던 프로세서는 P 코어 우선 순서대로 할당
+  · 끝난 시간에 바로 다시 할당되면 시동 전력 없음, 한 번이라도 쉬었으면 시동 전력 추가
+"""
+
+# 스케줄러별 대기 큐 우선순위 (index: 도착 순서, 같은 도착 시간이면 PID 큰 값 우선)
+PRIORITY_KEYS = {
+    FCFSScheduler: lambda process, index: index,
+    SPNScheduler: lambda process, index: (process.burst, process.arrival, index),
+}
+
+
+def can_solve(scheduler: BaseScheduler) -> bool:
+    """바로 계산할 수 있는 구성인지 확인 (아니면 일반 시뮬레이션 사용)"""
+    if type(scheduler) not in PRIORITY_KEYS or scheduler.trace.enabled or scheduler.stats is not None or scheduler.current_time != 0 \
+            or scheduler.checkpoint is not None or scheduler.multi_queue:
+        return False
+    if not isinstance(scheduler.arrivals, SortedArrivals) or not scheduler.processors_info:
+        return False
+    for processor in scheduler.processors_info:
+        if processor.time_quantum is not None or processor.working_speed <= 0 or not processor.is_process_empty():
+            return False
+    for process in scheduler.processes:
+        if process.burst <= 0 or process.remaining_time != process.burst or process.start_time is not None:
+            return False
+    return True
+
+
+def solve(scheduler: BaseScheduler) -> None:
+    """
+    스케줄러의 프로세스, 프로세서 상태를 시뮬레이션이 끝난 상태로 채움
+    """
+    priority_key = PRIORITY_KEYS[type(scheduler)]
+    processors = scheduler.processors_info
+    pending = scheduler.arrivals.processes
+
+    busy = []                                       # (끝나는 시간, 프로세서 순서)
+    idle = list(range(len(processors)))             # 쉬는 프로세서 순서 (P 코어 우선)
+    free_time = [None] * len(processors)            # 프로세서별 마지막으로 끝난 시간 (None: 시작 전)
+    starts = [0] * len(processors)                  # 프로세서별 시동 횟수
+    busy_ticks = [0] * len(processors)              # 프로세서별 실행 시간
+    ready = []                                      # (우선순위, 프로세스)
+    index = 0
+    time = 0
+    end_time = 0
+
+    while index < len(pending) or ready:
+        scheduler.step_count += 1
+        # 대기 큐가 비었으면 다음 도착 시간으로 이동
+        if not ready:
+            time = max(time, pending[index].arrival)
+        while busy and busy[0][0] <= time:
+            heapq.heappush(idle, heapq.heappop(busy)[1])
+        # 쉬는 프로세서가 없으면 가장 먼저 끝나는 시간으로 이동
+        if not idle:
+            time = busy[0][0]
+            while busy and busy[0][0] <= time:
+                heapq.heappush(idle, heapq.heappop(busy)[1])
+        while index < len(pending) and pending[index].arrival <= time:
+            process = pending[index]
+            heapq.heappush(ready, (priority_key(process, index), index))
+            index += 1
+
+        while idle and ready:
+            order = heapq.heappop(idle)
+            process = pending[heapq.heappop(ready)[1]]
+            processor = processors[order]
+            ticks = math.ceil(process.burst / processor.working_speed)
+            if free_time[order] != time:
+                starts[order] += 1
+            busy_ticks[order] += ticks
+            processor.timeline.record(0, time - len(processor.timeline))
+            processor.timeline.record(process.pid, ticks)
+            free_time[order] = time + ticks
+            heapq.heappush(busy, (time + ticks, order))
+            end_time = max(end_time, time + ticks)
+
+            process.start_time = time
+            process.accumulated_wait_time = time - process.arrival
+            process.waiting_since = None
+            process.running = False
+            process.remaining_time = 0
+            process.turnaround_time = time + ticks - process.arrival
+            process.normalized_turnaround_time = process.turnaround_time / process.burst
+            if scheduler.metrics is not None:
+                scheduler.metrics.add(process)
+
+    for order, processor in enumerate(processors):
+        processor.used_power += starts[order] * processor.start_power + busy_ticks[order] * processor.working_power
+        processor.timeline.record(0, end_time - len(processor.timeline))
+        processor.PowerOn = False
+
+    scheduler.arrivals.index = len(pending)
+    scheduler.current_time = end_time + 1 if len(pending) else 0
+    scheduler.wait_clock.time = scheduler.current_time
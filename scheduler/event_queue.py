@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Optional
+from core.processor import Processor
+import heapq
+
+
+class EventType(Enum):
+    ARRIVAL = "arrival"
+    COMPLETION = "completion"
+    QUANTUM_EXPIRE = "quantum_expire"
+
+
+class EventQueue:
+    """
+    이벤트 기반 시뮬레이션용 우선순위 큐
+    - 도착, 완료, 시간 쿼텀 만료 이벤트를 시간순으로 관리
+    - 프로세서마다 유효한 이벤트는 하나뿐이며, 다시 예약하면 이전 이벤트는 꺼낼 때 버려짐
+    - 도착 이벤트는 다음 도착 시간 하나만 넣어 두어 큐 크기가 프로세스 수와 무관함
+    """
+    def __init__(self) -> None:
+        self.heap = []                              # (시간, 순번, 이벤트 종류, 대상)
+        self.sequence = 0                           # 같은 시간 이벤트의 비교를 피하기 위한 순번
+        self.scheduled = {}                         # 프로세서 -> 현재 유효한 (시간, 순번)
+        self.arrival_time = None                    # 마지막으로 넣은 도착 이벤트 시간
+
+    def push(self, time: int, event_type: EventType, target) -> int:
+        self.sequence += 1
+        heapq.heappush(self.heap, (time, self.sequence, event_type, target))
+        return self.sequence
+
+    def schedule_arrival(self, time: int) -> None:
+        """다음 도착 시간 예약 (이미 넣은 시간이면 무시)"""
+        if time != self.arrival_time:
+            self.arrival_time = time
+            self.push(time, EventType.ARRIVAL, None)
+
+    def reschedule(self, processor: Processor, current_time: int) -> None:
+        """
+        프로세서의 다음 이벤트(완료 또는 시간 쿼텀 만료)를 다시 예약하는 메서드
+        """
+        if processor.is_process_empty():
+            self.scheduled.pop(processor, None)
+            return
+
+        event_time = current_time + processor.ticks_to_completion()
+        event_type = EventType.COMPLETION
+        if processor.time_quantum is not None:
+            expire_time = current_time + max(processor.time_quantum, 1)
+            if expire_time < event_time:
+                event_time = expire_time
+                event_type = EventType.QUANTUM_EXPIRE
+
+        previous = self.scheduled.get(processor)
+        if previous is not None and previous[0] == event_time:
+            return
+        self.scheduled[processor] = (event_time, self.push(event_time, event_type, processor))
+
+    def next_time(self, current_time: int) -> Optional[int]:
+        """
+        현재 시간 이후 가장 빠른 유효 이벤트 시간 반환 (없으면 None)
+        """
+        while self.heap:
+            time, sequence, event_type, target = self.heap[0]
+            if time <= current_time:
+                heapq.heappop(self.heap)
+            elif event_type != EventType.ARRIVAL and self.scheduled.get(target) != (time, sequence):
+                heapq.heappop(self.heap)
+            else:
+                return time
+        return None
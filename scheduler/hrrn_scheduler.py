@@ -1,21 +1,20 @@
 from scheduler import BaseScheduler
-from collections import deque
+from scheduler.ready_queue import ReadyQueue, ResponseRatioReadyQueue
 
 class HRRNScheduler(BaseScheduler):
     """
     응답 비율(Response Ratio)을 기준으로 정렬하여 프로세스를 할당하는 스케줄러(비선점)
     Response Ratio = (대기 시간 + 실행 시간) / 실행 시간
     """
+    def create_ready_queue(self) -> ReadyQueue:
+        return ResponseRatioReadyQueue(ratio=self.calculate_response_ratio, clock=lambda: self.current_time)
 
     def assign_process(self) -> None:
-        for processor in self.processors_info:
+        for processor in self.dispatch_order():
             if processor.is_process_empty(): 
-                if len(self.ready_queue) > 1: # 길이 2 이상일 때 정렬
-                    self.ready_queue = deque(sorted(self.ready_queue,key=lambda p: self.calculate_response_ratio(p),reverse=True))
-                    
                 if self.ready_queue: 
-                    process = self.ready_queue.popleft()
+                    process = self.ready_queue.pop() # 응답 비율이 가장 높은 프로세스
                     processor.assign_process(process, self.current_time)
 
     def calculate_response_ratio(self, process):
-        return (process.wait_time + process.burst) / process.burst
\ No newline at end of file
+        return (process.wait_time + process.burst) / process.burst
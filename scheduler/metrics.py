@@ -0,0 +1,181 @@
+import math
+from typing import List
+from core.process import Process
+
+
+class RunningStat:
+    """값을 하나씩 받아 개수, 평균, 분산, 최솟값, 최댓값을 갱신 (Welford 방식, 값은 보관하지 않음)"""
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0                               # 평균과의 차이 제곱 합
+        self.min = None
+        self.max = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """모분산 (값이 없으면 0)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    백분위수 추정용 고정 크기 스케치 (로그 간격 구간별 개수만 저장)
+    - 0 이상의 값을 받아, 추정값과 실제값의 상대 오차가 relative_accuracy 이내
+    - 구간 수는 값의 범위(최댓값/최솟값)의 로그에 비례하므로 프로세스 수와 무관
+    """
+    __slots__ = ('gamma', 'log_gamma', 'buckets', 'zero_count', 'count')
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}                           # 구간 번호 -> 개수 (구간 i: gamma^(i-1) < 값 <= gamma^i)
+        self.zero_count = 0                         # 0인 값의 개수
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """q(0~1) 백분위수 추정값 (값이 없으면 None)"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return 2 * self.gamma ** index / (self.gamma + 1) # 구간의 대표값
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class MetricSummary:
+    """한 지표(대기 시간 등)의 요약 통계와 백분위수 스케치"""
+    __slots__ = ('stat', 'sketch')
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.stat = RunningStat()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        self.stat.add(value)
+        self.sketch.add(value)
+
+    def get_state(self) -> dict:
+        """체크포인트용 상태"""
+        stat = self.stat
+        sketch = self.sketch
+        return {"stat": (stat.count, stat.mean, stat.m2, stat.min, stat.max),
+                "buckets": dict(sketch.buckets), "zero_count": sketch.zero_count, "count": sketch.count}
+
+    def set_state(self, state: dict) -> None:
+        self.stat.count, self.stat.mean, self.stat.m2, self.stat.min, self.stat.max = state["stat"]
+        self.sketch.buckets = dict(state["buckets"])
+        self.sketch.zero_count = state["zero_count"]
+        self.sketch.count = state["count"]
+
+    def as_dict(self) -> dict:
+        return {
+            "mean": self.stat.mean,
+            "variance": self.stat.variance,
+            "min": self.stat.min,
+            "max": self.stat.max,
+            "p50": self.sketch.quantile(0.50),
+            "p95": self.sketch.quantile(0.95),
+            "p99": self.sketch.quantile(0.99),
+        }
+
+
+class StreamingMetrics:
+    """
+    프로세스가 끝날 때마다 결과 지표를 누적하는 집계기
+    - WT, TT, NTT의 개수, 평균, 분산, 최솟값, 최댓값과 P50/P95/P99 (프로세스 수와 무관한 메모리)
+    - 프로세서별 사용률(실행 시간 / 전체 시간)과 사용 전력
+    - 끝난 프로세스를 보관하지 않아도 최종 결과를 낼 수 있음 (ProcessStream과 함께 사용)
+    """
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.reset()
+
+    def reset(self) -> None:
+        self.wait_time = MetricSummary(self.relative_accuracy)
+        self.turnaround_time = MetricSummary(self.relative_accuracy)
+        self.normalized_turnaround_time = MetricSummary(self.relative_accuracy)
+        self.processors = []
+
+    def attach(self, scheduler) -> None:
+        """새 실행을 위해 지표를 비우고 스케줄러의 프로세서를 연결"""
+        self.reset()
+        self.processors = scheduler.processors_info
+
+    def add(self, process: Process) -> None:
+        """끝난 프로세스의 결과 반영"""
+        self.wait_time.add(process.wait_time)
+        self.turnaround_time.add(process.turnaround_time)
+        self.normalized_turnaround_time.add(process.normalized_turnaround_time)
+
+    def get_state(self) -> dict:
+        """체크포인트용 상태 (프로세서는 스케줄러에 연결된 것을 그대로 사용)"""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "wait_time": self.wait_time.get_state(),
+            "turnaround_time": self.turnaround_time.get_state(),
+            "normalized_turnaround_time": self.normalized_turnaround_time.get_state(),
+        }
+
+    def set_state(self, state: dict) -> None:
+        if state["relative_accuracy"] != self.relative_accuracy:
+            raise ValueError("체크포인트의 relative_accuracy가 다릅니다")
+        self.wait_time.set_state(state["wait_time"])
+        self.turnaround_time.set_state(state["turnaround_time"])
+        self.normalized_turnaround_time.set_state(state["normalized_turnaround_time"])
+
+    @property
+    def count(self) -> int:
+        return self.turnaround_time.stat.count
+
+    def processor_summary(self) -> List[dict]:
+        summary = []
+        for processor in self.processors:
+            elapsed = len(processor.timeline)
+            summary.append({
+                "id": processor.id,
+                "type": processor.type,
+                "busy": processor.timeline.busy,
+                "utilization": processor.timeline.busy / elapsed if elapsed else 0.0,
+                "energy": processor.used_power,
+            })
+        return summary
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "wait_time": self.wait_time.as_dict(),
+            "turnaround_time": self.turnaround_time.as_dict(),
+            "normalized_turnaround_time": self.normalized_turnaround_time.as_dict(),
+            "processors": self.processor_summary(),
+            "energy": sum(processor.used_power for processor in self.processors),
+        }
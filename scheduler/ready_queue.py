@@ -0,0 +1,540 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import chain
+from typing import Callable, Iterator, List, Optional, Tuple
+from core.process import Process
+import heapq
+import math
+
+
+class ReadyQueue(ABC):
+    """
+    대기 큐 인터페이스
+    - push: 큐의 맨 뒤에 프로세스 추가
+    - pop/peek: 다음에 실행할 프로세스 꺼내기/확인
+    - sorts, scanned: 정렬 횟수와 우선순위 비교를 위해 살펴본 프로세스 수 (SimulationStats용)
+    - get_state/set_state: 체크포인트용 상태 (encode/decode로 프로세스와 번호를 변환)
+    """
+    sorts = 0
+    scanned = 0
+
+    @abstractmethod
+    def push(self, process: Process) -> None:
+        pass
+
+    @abstractmethod
+    def pop(self) -> Process:
+        pass
+
+    @abstractmethod
+    def peek(self) -> Process:
+        pass
+
+    @abstractmethod
+    def remove(self, process: Process) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Process]:
+        """맨 뒤부터 맨 앞 순서로 순회 (디버깅 출력용)"""
+        pass
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @abstractmethod
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        pass
+
+    @abstractmethod
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        pass
+
+
+class FIFOReadyQueue(ReadyQueue):
+    """
+    deque 기반 선입선출 대기 큐 (FCFS, RR, Custom)
+    - 왼쪽이 맨 뒤, 오른쪽이 맨 앞
+    """
+    def __init__(self) -> None:
+        self.queue = deque()
+
+    def push(self, process: Process) -> None:
+        self.queue.appendleft(process)
+
+    def pop(self) -> Process:
+        return self.queue.pop()
+
+    def peek(self) -> Process:
+        return self.queue[-1]
+
+    def remove(self, process: Process) -> None:
+        self.queue.remove(process)
+
+    def sort(self, key: Callable[[Process], tuple], reverse: bool = False) -> None:
+        """큐를 key 기준으로 재정렬 (오른쪽 끝, 즉 가장 큰 값이 맨 앞)"""
+        self.sorts += 1
+        self.scanned += len(self.queue)
+        self.queue = deque(sorted(self.queue, key=key, reverse=reverse))
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def __iter__(self) -> Iterator[Process]:
+        return iter(self.queue)
+
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        return {"queue": [encode(p) for p in self.queue], "sorts": self.sorts, "scanned": self.scanned}
+
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        self.queue = deque(decode(ref) for ref in state["queue"])
+        self.sorts = state["sorts"]
+        self.scanned = state["scanned"]
+
+
+class HeapReadyQueue(ReadyQueue):
+    """
+    key가 작은 프로세스부터 꺼내는 이진 힙 기반 대기 큐 (SPN, SRTN)
+    - 같은 key끼리는 먼저 들어온 순서대로 묶어 두어, 정렬 후 꺼내던 기존 동작과 같은 순서를 유지
+    - key는 프로세스가 큐에 있는 동안 변하지 않아야 함
+    - scanned: 힙에서 key를 넣고 뺄 때 비교하는 횟수(힙 깊이), 같은 key가 있으면 1
+      sorts: 중간의 프로세스를 빼면서 힙을 다시 만든 횟수
+    """
+    def __init__(self, key: Callable[[Process], tuple]) -> None:
+        self.key = key
+        self.keys = []                              # key 최소 힙
+        self.buckets = {}                           # key -> 들어온 순서대로의 프로세스들
+        self.size = 0
+
+    def push(self, process: Process) -> None:
+        key = self.key(process)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = deque()
+            heapq.heappush(self.keys, key)
+            self.scanned += len(self.keys).bit_length()
+        else:
+            self.scanned += 1
+        bucket.append(process)
+        self.size += 1
+
+    def _min_bucket(self) -> deque:
+        return self.buckets[self.keys[0]]
+
+    def _discard_min_if_empty(self) -> None:
+        if not self.buckets[self.keys[0]]:
+            self.scanned += len(self.keys).bit_length()
+            del self.buckets[heapq.heappop(self.keys)]
+
+    def pop(self) -> Process:
+        """key가 가장 작은 프로세스 중 가장 먼저 들어온 프로세스"""
+        process = self._min_bucket().popleft()
+        self.size -= 1
+        self._discard_min_if_empty()
+        return process
+
+    def peek(self) -> Process:
+        return self._min_bucket()[0]
+
+    def pop_latest(self) -> Process:
+        """key가 가장 작은 프로세스 중 가장 나중에 들어온 프로세스"""
+        process = self._min_bucket().pop()
+        self.size -= 1
+        self._discard_min_if_empty()
+        return process
+
+    def peek_latest(self) -> Process:
+        return self._min_bucket()[-1]
+
+    def remove(self, process: Process) -> None:
+        key = self.key(process)
+        bucket = self.buckets[key]
+        bucket.remove(process)
+        self.size -= 1
+        if not bucket:
+            del self.buckets[key]
+            self.keys.remove(key)
+            heapq.heapify(self.keys)
+            self.sorts += 1
+            self.scanned += len(self.keys) + 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Process]:
+        for key in sorted(self.buckets, reverse=True):
+            yield from reversed(self.buckets[key])
+
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        """key 순서대로, 같은 key 안에서는 들어온 순서대로 (key는 복원할 때 다시 계산)"""
+        buckets = [[encode(p) for p in self.buckets[key]] for key in sorted(self.buckets)]
+        return {"buckets": buckets, "sorts": self.sorts, "scanned": self.scanned}
+
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        self.keys = []
+        self.buckets = {}
+        self.size = 0
+        for bucket in state["buckets"]:
+            for ref in bucket:
+                self.push(decode(ref))
+        self.sorts = state["sorts"]
+        self.scanned = state["scanned"]
+
+
+class ResponseRatioReadyQueue(ReadyQueue):
+    """
+    응답 비율이 가장 높은 프로세스부터 꺼내는 대기 큐 (HRRN)
+    - 큐에 있는 프로세스는 모두 같은 속도로 대기 시간이 늘어나므로, 실행 시간이 같은 프로세스끼리는 순서가 바뀌지 않음
+      → 실행 시간별로 힙을 두고 각 힙의 맨 앞(그룹 대표)끼리만 현재 응답 비율로 비교
+    - 그룹 대표끼리는 키네틱 토너먼트 트리로 비교 (그룹 수 G)
+      · 그룹 대표의 응답 비율 1 + (대기 시간 오프셋 + 현재 시간) / 실행 시간은 현재 시간에 대한 직선이므로
+        두 대표의 순서는 계산할 수 있는 시간에만 바뀜 → 노드마다 승자와 그 승부가 바뀔 수 있는 가장 이른 시간(fail)을 둠
+      · peek은 fail이 지난 노드만 다시 비교, 대표가 바뀐 그룹은 잎에서 뿌리까지 표시만 해 두었다가 다음 peek에서 비교
+        → 꺼낼 때마다 O(log G) + 순서가 바뀐 승부 수 (직선끼리는 한 번만 교차하므로 승부가 바뀌는 횟수는 제한됨)
+      · 실제 비교는 기존과 같은 ratio(부동소수점)로 하고, 부동소수점으로 같아질 수 있을 만큼 가까운 승부는 다음 시간에 다시 비교
+    - 동점일 때는 기존의 안정 정렬(deque(sorted(..., reverse=True)) 후 popleft)과 같은 순서를 따름
+      · 마지막 정렬 이후 들어온 프로세스가 먼저, 그 안에서는 나중에 들어온 프로세스가 먼저
+      · 마지막 정렬 때 함께 있던 프로세스끼리는 그때 응답 비율이 높았던(실행 시간이 긴) 프로세스가 먼저
+      · 이 기준은 같은 시간 안에서는 변하지 않으므로 동점 승부도 다음 시간에 다시 비교하면 됨
+    - scanned: 그룹 대표끼리 비교한 횟수
+    """
+    SAFE_MARGIN = 2 ** 51                           # 응답 비율 차이가 값의 1/SAFE_MARGIN보다 크면 부동소수점으로도 순서가 같음
+
+    def __init__(self, ratio: Callable[[Process], float], clock: Callable[[], int]) -> None:
+        self.ratio = ratio                          # 응답 비율 계산 함수
+        self.clock = clock                          # 현재 시간
+        self.groups = {}                            # 실행 시간 -> (-(대기 시간 - 들어온 시간), -순번, 프로세스) 힙
+        self.entries = {}                           # 프로세스 -> 들어온 순번
+        self.sequence = 0
+        self.sort_time = None                       # 마지막으로 정렬이 일어난 시간
+        self.sort_sequence = 0                      # 그 정렬 때까지 들어온 순번
+        self.previous_sort_sequence = 0             # 그 이전 정렬 때까지 들어온 순번
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        현재 그룹들로 토너먼트 트리를 새로 만듦 (잎이 모자랄 때, 체크포인트 복원 뒤)
+        - winner[node]: 그 노드 아래의 승자 잎 번호, fail[node]: 그 승자가 바뀔 수 있는 가장 이른 시간 (-inf면 다시 비교해야 함)
+        - 잎 번호(slot)는 그룹마다 하나, 노드 capacity + slot이 그 잎
+        """
+        capacity = 1
+        while capacity < len(self.groups):
+            capacity *= 2
+        self.capacity = capacity
+        self.winner: List[Optional[int]] = [None] * (2 * capacity)
+        self.fail: List[float] = [-math.inf] * capacity + [math.inf] * capacity
+        self.slots = {}                             # 실행 시간 -> 잎 번호
+        self.slot_bursts: List[Optional[int]] = [None] * capacity
+        for slot, burst in enumerate(self.groups):
+            self.slots[burst] = slot
+            self.slot_bursts[slot] = burst
+            self.winner[capacity + slot] = slot
+        self.free_slots = list(range(capacity - 1, len(self.groups) - 1, -1))  # 작은 번호부터 사용
+
+    def invalidate(self, slot: int) -> None:
+        """잎의 대표가 바뀌었으므로 뿌리까지 다시 비교하도록 표시"""
+        node = (self.capacity + slot) // 2
+        while node >= 1 and self.fail[node] != -math.inf: # 위쪽은 이미 표시됨
+            self.fail[node] = -math.inf
+            node //= 2
+
+    def push(self, process: Process) -> None:
+        self.sequence += 1
+        self.entries[process] = self.sequence
+        wait_offset = process.wait_time - self.clock() # 큐에 있는 동안 변하지 않는 값
+        burst = process.burst
+        group = self.groups.get(burst)
+        if group is None:
+            group = self.groups[burst] = []
+            if self.free_slots:
+                slot = self.free_slots.pop()
+                self.slots[burst] = slot
+                self.slot_bursts[slot] = burst
+                self.winner[self.capacity + slot] = slot
+            else:
+                self.rebuild()
+        heapq.heappush(group, (-wait_offset, -self.sequence, process))
+        self.invalidate(self.slots[burst])
+
+    def clean_group(self, burst) -> None:
+        """제거된 프로세스를 그룹 맨 앞에서 정리 (비면 그룹과 잎을 비움)"""
+        group = self.groups[burst]
+        while group and self.entries.get(group[0][2]) != -group[0][1]:
+            heapq.heappop(group)
+        slot = self.slots[burst]
+        if not group:
+            del self.groups[burst]
+            del self.slots[burst]
+            self.slot_bursts[slot] = None
+            self.winner[self.capacity + slot] = None
+            self.free_slots.append(slot)
+        self.invalidate(slot)
+
+    def sorted_sequence(self, current_time: int) -> int:
+        """현재 시간 이전의 마지막 정렬 때까지 들어온 순번"""
+        return self.previous_sort_sequence if self.sort_time == current_time else self.sort_sequence
+
+    def priority(self, process: Process, sorted_sequence: int) -> tuple:
+        sequence = self.entries[process]
+        if sequence > sorted_sequence:
+            return (self.ratio(process), 1, 0, sequence)
+        return (self.ratio(process), 0, process.burst, sequence)
+
+    def compare(self, first: int, second: int, current_time: int, sorted_sequence: int) -> Tuple[int, float]:
+        """두 잎의 대표를 비교해 (승자 잎, 승부가 바뀔 수 있는 가장 이른 시간) 반환"""
+        self.scanned += 1
+        heads = []
+        for slot in (first, second):
+            burst = self.slot_bursts[slot]
+            negative_offset, _, process = self.groups[burst][0]
+            heads.append((self.priority(process, sorted_sequence), slot, -negative_offset, burst))
+        (_, winner, winner_offset, winner_burst), (_, _, loser_offset, loser_burst) = sorted(heads, reverse=True)
+        # 응답 비율 × 두 실행 시간의 곱: 차이 difference, 크기 scale (모두 정수, 현재 시간에 대한 일차식)
+        difference = (winner_offset + current_time) * loser_burst - (loser_offset + current_time) * winner_burst
+        scale = (winner_offset + current_time + winner_burst) * loser_burst + (loser_offset + current_time + loser_burst) * winner_burst
+        if difference * self.SAFE_MARGIN <= scale:  # 동점이거나 부동소수점으로 같아질 수 있음
+            return winner, current_time + 1
+        slope = self.SAFE_MARGIN * (loser_burst - winner_burst) - (loser_burst + winner_burst)
+        if slope >= 0:                              # 차이가 점점 벌어짐
+            return winner, math.inf
+        return winner, current_time - (difference * self.SAFE_MARGIN - scale) // slope # 올림 나눗셈
+
+    def refresh(self, node: int, current_time: int, sorted_sequence: int) -> None:
+        """fail이 지난 노드만 아래에서부터 다시 비교"""
+        if self.fail[node] > current_time:
+            return
+        left, right = 2 * node, 2 * node + 1
+        self.refresh(left, current_time, sorted_sequence)
+        self.refresh(right, current_time, sorted_sequence)
+        first, second = self.winner[left], self.winner[right]
+        fail = min(self.fail[left], self.fail[right])
+        if first is None or second is None:
+            self.winner[node] = first if second is None else second
+        else:
+            self.winner[node], until = self.compare(first, second, current_time, sorted_sequence)
+            fail = min(fail, until)
+        self.fail[node] = fail
+
+    def peek(self) -> Process:
+        if len(self.entries) == 1:
+            return next(iter(self.entries))
+        current_time = self.clock()
+        self.refresh(1, current_time, self.sorted_sequence(current_time))
+        return self.groups[self.slot_bursts[self.winner[1]]][0][2]
+
+    def pop(self) -> Process:
+        process = self.peek()
+        if len(self.entries) > 1: # 기존 구현에서 정렬이 일어나는 경우
+            self.sorts += 1
+            current_time = self.clock()
+            if self.sort_time != current_time:
+                self.previous_sort_sequence = self.sort_sequence
+                self.sort_time = current_time
+            self.sort_sequence = self.sequence
+        self.remove(process)
+        return process
+
+    def remove(self, process: Process) -> None:
+        del self.entries[process]
+        self.clean_group(process.burst)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Process]:
+        return iter(sorted(self.entries, key=self.entries.get, reverse=True))
+
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        entries = []
+        for group in self.groups.values():
+            for negative_offset, negative_sequence, process in group:
+                if self.entries.get(process) == -negative_sequence: # 제거된 프로세스는 제외
+                    entries.append((encode(process), -negative_sequence, -negative_offset))
+        entries.sort(key=lambda entry: entry[1])
+        return {
+            "entries": entries, "sequence": self.sequence, "sort_time": self.sort_time,
+            "sort_sequence": self.sort_sequence, "previous_sort_sequence": self.previous_sort_sequence,
+            "sorts": self.sorts, "scanned": self.scanned,
+        }
+
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        self.groups = {}
+        self.entries = {}
+        for ref, sequence, wait_offset in state["entries"]:
+            process = decode(ref)
+            self.entries[process] = sequence
+            heapq.heappush(self.groups.setdefault(process.burst, []), (-wait_offset, -sequence, process))
+        self.rebuild()
+        self.sequence = state["sequence"]
+        self.sort_time = state["sort_time"]
+        self.sort_sequence = state["sort_sequence"]
+        self.previous_sort_sequence = state["previous_sort_sequence"]
+        self.sorts = state["sorts"]
+        self.scanned = state["scanned"]
+
+
+class RunQueues(ReadyQueue):
+    """
+    프로세서마다 대기 큐를 따로 두는 다중 대기 큐 (멀티 큐 모드)
+    - 각 큐는 스케줄러의 단일 대기 큐와 같은 종류 (factory = create_ready_queue) → 스케줄러별 선택 규칙을 그대로 사용
+    - select(order)로 고른 프로세서의 큐에 push, pop, peek 등이 적용됨 (할당 단계에서 프로세서마다 고름)
+    - 고른 큐가 없으면 push는 초기 배치 (대기 프로세스 수 + 실행 중이면 1이 가장 작은 프로세서, 같으면 P 코어 우선),
+      len, iter는 전체 큐 기준
+    - steal(order): 큐가 빈 프로세서가 가장 긴 큐에서 다음에 실행될 프로세스를 가져옴 (프로세스별 이동 횟수 기록)
+    - 초기 배치와 가져올 큐 고르기는 부하 힙으로 O(log 프로세서 수)
+      · 큐 길이가 바뀌거나 update(order)가 불리면 (부하, 순서) 항목을 새로 넣고, 꺼낼 때 현재 값과 다른 항목은 버림
+      · 실행 중인지 여부는 큐 밖에서 바뀌므로 스케줄러가 프로세서가 차거나 빌 때 update(order)를 호출
+    - 프로세스가 어느 큐에 있는지 PID로 기록해 두어 remove가 큐를 뒤지지 않음
+    """
+    def __init__(self, factory: Callable[[], ReadyQueue], count: int, busy: Callable[[int], bool]) -> None:
+        self.queues: List[ReadyQueue] = [factory() for _ in range(count)]  # processors_info 순서
+        self.busy = busy                            # 순서 번호 -> 프로세서가 실행 중인지 여부
+        self.active: Optional[ReadyQueue] = None    # 고른 큐 (None이면 전체)
+        self.active_order: Optional[int] = None     # 고른 큐의 순서 번호
+        self.location = {}                          # PID -> 들어 있는 큐의 순서 번호
+        self.size = 0                               # 전체 대기 프로세스 수
+        self.migrations = {}                        # PID -> 다른 프로세서 큐로 옮겨진 횟수
+        self.migration_count = 0
+        self.steals = [0] * count                   # 프로세서별 가져온 횟수
+        self.reindex()
+
+    def load(self, order: int) -> int:
+        return len(self.queues[order]) + self.busy(order)
+
+    def reindex(self) -> None:
+        """모든 프로세서의 부하로 힙을 새로 만듦 (처음, 체크포인트 복원 뒤, 낡은 항목이 쌓였을 때)"""
+        count = len(self.queues)
+        self.least_loaded = [(self.load(order), order) for order in range(count)]   # 초기 배치용 최소 힙
+        self.longest = [(-len(self.queues[order]), order) for order in range(count)] # 가져올 큐 고르기용 (길이가 긴 순)
+        heapq.heapify(self.least_loaded)
+        heapq.heapify(self.longest)
+
+    def update(self, order: int) -> None:
+        """order의 큐 길이나 실행 여부가 바뀌었을 때 힙에 현재 값을 넣음"""
+        if len(self.least_loaded) > 4 * len(self.queues) + 64:
+            self.reindex()
+            return
+        heapq.heappush(self.least_loaded, (self.load(order), order))
+        heapq.heappush(self.longest, (-len(self.queues[order]), order))
+
+    def select(self, order: Optional[int]) -> None:
+        self.active = self.queues[order] if order is not None else None
+        self.active_order = order
+
+    def place(self, process: Process) -> int:
+        """새로 도착한 프로세스를 넣을 프로세서 순서 번호"""
+        heap = self.least_loaded
+        while heap[0][0] != self.load(heap[0][1]): # 낡은 항목 정리
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def steal(self, order: int) -> Optional[Process]:
+        """가장 긴 다른 큐에서 프로세스 하나를 order의 큐로 옮김 (옮길 프로세스가 없으면 None)"""
+        heap = self.longest
+        skipped = None                              # 꺼내 둔 order 자신의 항목
+        victim = None
+        while heap:
+            length, candidate = heap[0]
+            if -length != len(self.queues[candidate]):
+                heapq.heappop(heap)
+            elif candidate == order:
+                skipped = heapq.heappop(heap)
+            else:
+                victim = candidate
+                break
+        if skipped is not None:
+            heapq.heappush(heap, skipped)
+        if victim is None or not self.queues[victim]:
+            return None
+        process = self.queues[victim].pop()
+        self.queues[order].push(process)
+        self.location[process.pid] = order
+        self.migrations[process.pid] = self.migrations.get(process.pid, 0) + 1
+        self.migration_count += 1
+        self.steals[order] += 1
+        self.update(victim)
+        self.update(order)
+        return process
+
+    def push(self, process: Process) -> None:
+        order = self.active_order if self.active is not None else self.place(process)
+        self.queues[order].push(process)
+        self.location[process.pid] = order
+        self.size += 1
+        self.update(order)
+
+    def pop(self) -> Process:
+        process = self.active.pop()
+        del self.location[process.pid]
+        self.size -= 1
+        self.update(self.active_order)
+        return process
+
+    def peek(self) -> Process:
+        return self.active.peek()
+
+    def pop_latest(self) -> Process:
+        process = self.active.pop_latest()
+        del self.location[process.pid]
+        self.size -= 1
+        self.update(self.active_order)
+        return process
+
+    def peek_latest(self) -> Process:
+        return self.active.peek_latest()
+
+    def sort(self, key: Callable[[Process], tuple], reverse: bool = False) -> None:
+        self.active.sort(key=key, reverse=reverse)
+
+    def remove(self, process: Process) -> None:
+        order = self.location.pop(process.pid)
+        self.queues[order].remove(process)
+        self.size -= 1
+        self.update(order)
+
+    @property
+    def sorts(self) -> int:
+        return sum(queue.sorts for queue in self.queues)
+
+    @property
+    def scanned(self) -> int:
+        return sum(queue.scanned for queue in self.queues)
+
+    @scanned.setter
+    def scanned(self, value: int) -> None:
+        """고른 큐에 늘어난 만큼 더함 (스케줄러가 직접 세는 경우)"""
+        self.active.scanned += value - self.scanned
+
+    def __len__(self) -> int:
+        return len(self.active) if self.active is not None else self.size
+
+    def __iter__(self) -> Iterator[Process]:
+        if self.active is not None:
+            return iter(self.active)
+        return chain.from_iterable(self.queues)
+
+    def get_state(self, encode: Callable[[Process], int]) -> dict:
+        return {
+            "queues": [queue.get_state(encode) for queue in self.queues],
+            "migrations": dict(self.migrations),
+            "steals": list(self.steals),
+        }
+
+    def set_state(self, state: dict, decode: Callable[[int], Process]) -> None:
+        if len(state["queues"]) != len(self.queues):
+            raise ValueError("체크포인트의 대기 큐 수가 다릅니다")
+        self.location = {}
+        for order, (queue, queue_state) in enumerate(zip(self.queues, state["queues"])):
+            queue.set_state(queue_state, decode)
+            for process in queue:
+                self.location[process.pid] = order
+        self.active = None
+        self.active_order = None
+        self.size = sum(len(queue) for queue in self.queues)
+        self.migrations = dict(state["migrations"])
+        self.migration_count = sum(self.migrations.values())
+        self.steals = list(state["steals"])
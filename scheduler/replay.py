@@ -0,0 +1,206 @@
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+from core.process import Process, WaitClock
+from scheduler.trace import TraceSink
+import threading
+
+
+class SimulationCancelled(Exception):
+    """기록을 취소해 백그라운드 시뮬레이션을 멈출 때 RecordingTraceSink.state()에서 발생"""
+    pass
+
+
+class RecordingTraceSink(TraceSink):
+    """
+    스케줄링 단계마다 바뀐 내용만 프레임으로 기록하는 추적 출력 (GUI 재생용)
+    - 프레임: (현재 시간, 대기 시간 계산용 시간, 프로세서별 누적 전력, 프로세서별 직전 1초 동안 실행한 PID,
+      프로세서별 할당된 PID, 바뀐 프로세스 상태들)
+    - 바로 앞 단계와 할당, 실행한 PID가 같은 tick은 기록하지 않음 (Replay가 실행 중인 프로세스를 한 tick씩 진행해 채움)
+      → 프레임 수는 tick 수가 아니라 할당이 바뀐 횟수에 비례
+    - 바뀐 프로세스는 직전 프레임이나 이번 단계에 프로세서에서 실행 중인 프로세스뿐이므로 프레임 크기는 프로세서 수에 비례
+      (대기 중인 프로세스의 대기 시간은 대기 시간 계산용 시간으로 재생할 때 계산)
+    - frames는 Replay가 적용하면서 앞에서부터 꺼내 감 (다른 스레드에서 시뮬레이션하는 동안 읽어도 됨)
+    - max_pending: 꺼내 가지 않은 프레임이 이만큼 쌓이면 시뮬레이션을 기다리게 함 (None이면 기다리지 않음)
+    - cancel(): 다음 단계에서 SimulationCancelled를 발생시켜 시뮬레이션을 멈춤
+    """
+    enabled = True
+
+    def __init__(self, max_pending: int = None) -> None:
+        self.frames = deque()
+        self.max_pending = max_pending
+        self.space = threading.Condition()          # 프레임을 꺼내 가면 알림 (max_pending용)
+        self.processor_ids: List[int] = []          # 프레임의 프로세서별 값 순서
+        self.processor_rates: List[Tuple[float, float]] = []  # 프로세서별 (실행 속도, 실행 전력)
+        self.running = {}                           # 직전 단계에 실행 중이던 프로세스 (PID -> 프로세스)
+        self.assigned: tuple = None                 # 직전 단계가 끝났을 때 프로세서별 프로세스
+        self.pids: tuple = None                     # 직전 단계에 프로세서별로 실행한 PID
+        self.last_time: Optional[int] = None        # 마지막으로 기록한(건너뛴 것 포함) 단계의 시간
+        self.recorded = 0                           # 지금까지 넣은 프레임 수
+        self.finished = False                       # 시뮬레이션이 끝났는지 여부
+        self.cancelled = False
+        self.error: Optional[BaseException] = None  # 시뮬레이션 중 난 오류 (실행한 쪽에서 기록)
+
+    def state(self, scheduler) -> None:
+        if self.cancelled:
+            raise SimulationCancelled()
+        processors = scheduler.processors_info
+        if not self.processor_ids:
+            self.processor_ids = [processor.id for processor in processors]
+            self.processor_rates = [(processor.working_speed, processor.working_power) for processor in processors]
+        time_step = scheduler.current_time - 1
+        assigned = tuple(processor.current_process for processor in processors)
+        pids = tuple(processor.timeline.pid_at(time_step) for processor in processors)
+        if (self.last_time is not None and scheduler.current_time == self.last_time + 1
+                and assigned == self.assigned and pids == self.pids):
+            self.last_time = scheduler.current_time # 실행 중인 프로세스만 진행한 tick
+            return
+        running = {process.pid: process for process in assigned if process is not None}
+        changed = dict(self.running)
+        changed.update(running)
+        self.push((
+            scheduler.current_time,
+            scheduler.wait_clock.time,
+            tuple(processor.used_power for processor in processors),
+            pids,
+            tuple(process.pid if process is not None else 0 for process in assigned),
+            tuple(process.get_state() for process in changed.values()),
+        ))
+        self.running = running
+        self.assigned = assigned
+        self.pids = pids
+        self.last_time = scheduler.current_time     # 프레임을 넣은 뒤 갱신 (Replay가 먼저 읽음)
+
+    def push(self, frame: tuple) -> None:
+        if self.max_pending is not None:
+            with self.space:
+                while len(self.frames) >= self.max_pending and not self.cancelled:
+                    self.space.wait()
+        if self.cancelled:
+            raise SimulationCancelled()
+        self.frames.append(frame)
+        self.recorded += 1
+
+    def take(self) -> tuple:
+        """가장 오래된 프레임을 꺼냄 (재생하는 쪽에서 호출)"""
+        frame = self.frames.popleft()
+        if self.max_pending is not None:
+            with self.space:
+                self.space.notify()
+        return frame
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        with self.space:
+            self.space.notify_all()
+
+    def summary(self, scheduler) -> None:
+        self.finish()
+
+    def finish(self, error: BaseException = None) -> None:
+        self.error = error
+        self.finished = True
+
+
+class Replay:
+    """
+    RecordingTraceSink의 프레임을 앞에서부터 적용해 각 tick의 상태를 다시 만드는 재생기
+    - processes는 처음 상태의 복사본 (대기 시간은 프레임의 대기 시간 계산용 시간으로 계산)
+    - 프레임이 없는 tick은 할당된 프로세스를 프로세서 속도만큼 실행하고 전력, 대기 시간 계산용 시간을 1 tick만큼 진행
+    - 한 단계 진행 비용은 프로세서 수에 비례하므로 멈춤, 한 단계 실행, 끝으로 이동에 시뮬레이션 비용이 들지 않음
+    - 적용한 프레임은 recorder에서 꺼내 버리므로 재생한 만큼 메모리가 줄어듦
+    """
+    def __init__(self, processes: Iterable[Process], recorder: RecordingTraceSink) -> None:
+        self.recorder = recorder
+        self.clock = WaitClock()
+        self.processes = {}                         # PID -> 재생 중인 프로세스 상태
+        for source in processes:
+            process = Process(pid=source.pid, arrival=source.arrival, burst=source.burst)
+            process.clock = self.clock
+            self.processes[process.pid] = process
+        self.pending = sorted(self.processes.values(), key=lambda p: p.arrival)  # 아직 도착하지 않은 프로세스
+        self.pending_index = 0
+        self.waiting = {}                           # 도착했지만 실행 중이 아니고 끝나지도 않은 프로세스 (대기 시간이 늘어나는 중)
+        self.started = False                        # 첫 프레임을 적용했는지 여부
+        self.current_time = 0
+        self.power = 0.0
+        self.processor_power: List[float] = []      # 프로세서별 누적 전력
+        self.assigned: List[int] = []               # 프로세서별 할당된 PID (0: 없음)
+        self.processor_pids: List[Tuple[int, int]] = []  # (프로세서 ID, 직전 1초 동안 실행한 PID)
+
+    def available(self) -> int:
+        """기록되었지만 아직 재생하지 않은 tick 수"""
+        last_time = self.recorder.last_time
+        if last_time is None:
+            return 0
+        if not self.started:
+            return last_time - self.recorder.frames[0][0] + 1 if self.recorder.frames else 0
+        return last_time - self.current_time
+
+    @property
+    def finished(self) -> bool:
+        """시뮬레이션이 끝났고 모든 tick을 재생했는지 여부"""
+        return self.recorder.finished and self.available() <= 0
+
+    def step(self) -> Optional[List[Process]]:
+        """
+        다음 tick을 재생하고 상태가 바뀐 프로세스와 새로 도착한 프로세스를 반환 (아직 기록되지 않았으면 None)
+        - 그 밖에 표시할 값이 바뀌는 프로세스는 waiting(대기 시간만 늘어남)뿐
+        """
+        recorder = self.recorder
+        last_time = recorder.last_time              # 프레임보다 먼저 읽음 (last_time은 프레임을 넣은 뒤 갱신됨)
+        frames = recorder.frames
+        if frames and (not self.started or frames[0][0] <= self.current_time + 1):
+            changed = self.apply_frame(recorder.take())
+        elif self.started and last_time is not None and self.current_time < last_time:
+            changed = self.advance_tick()
+        else:
+            return None
+        while self.pending_index < len(self.pending) and self.pending[self.pending_index].arrival <= self.current_time:
+            process = self.pending[self.pending_index]
+            self.pending_index += 1
+            if process.pid not in self.waiting and not process.is_running() and not process.is_completed():
+                self.waiting[process.pid] = process
+            changed.append(process)
+        return changed
+
+    def apply_frame(self, frame: tuple) -> List[Process]:
+        current_time, clock, powers, pids, assigned, changes = frame
+        self.started = True
+        self.current_time = current_time
+        self.clock.time = clock
+        self.processor_power = list(powers)
+        self.update_power()
+        self.assigned = list(assigned)
+        self.processor_pids = list(zip(self.recorder.processor_ids, pids))
+        changed = []
+        for record in changes:
+            process = self.processes[record[0]]
+            process.set_state(record)
+            if process.is_running() or process.is_completed():
+                self.waiting.pop(process.pid, None)
+            else:
+                self.waiting[process.pid] = process
+            changed.append(process)
+        return changed
+
+    def advance_tick(self) -> List[Process]:
+        """프레임이 없는 tick: 할당이 그대로인 채 1 tick 실행"""
+        self.current_time += 1
+        self.clock.time += 1
+        changed = []
+        for order, pid in enumerate(self.assigned):
+            if pid:
+                speed, working_power = self.recorder.processor_rates[order]
+                process = self.processes[pid]
+                process.run(speed)
+                self.processor_power[order] += working_power
+                changed.append(process)
+        self.update_power()
+        return changed
+
+    def update_power(self) -> None:
+        """전체 전력 (스케줄러의 calculate_total_power와 같은 순서로 더함)"""
+        power = 0.0
+        for used_power in self.processor_power:
+            power += used_power
+        self.power = power
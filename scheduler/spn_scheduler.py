@@ -1,16 +1,16 @@
 from scheduler import BaseScheduler
-from collections import deque
+from scheduler.ready_queue import ReadyQueue, HeapReadyQueue
 
 class SPNScheduler(BaseScheduler):
     """
     실행시간을 기준으로 정렬하여 프로세스를 할당하는 스케줄러(비선점)
     """
+    def create_ready_queue(self) -> ReadyQueue:
+        return HeapReadyQueue(key=lambda p: (p.burst, p.arrival)) # 실행시간, 도착시간(실행시간이 같을 경우) 순
+
     def assign_process(self) -> None:
-        for processor in self.processors_info:
+        for processor in self.dispatch_order():
             if processor.is_process_empty(): # 프로세서 비어있는 경우 프로세스 따로 할당x (비선점)
-                if len(self.ready_queue) > 1: # ready_queue가 2개 이상일 때 실행
-                    self.ready_queue = deque(sorted(self.ready_queue, key = lambda p: (p.burst, p.arrival), reverse=True)) # ready_queue를 실행시간, 도착시간(실행시간이 같을 경우) 순으로 정렬
-
                 if self.ready_queue: # ready_queue가 비어있지 않은 경우
-                    process = self.ready_queue.pop() 
-                    processor.assign_process(process,self.current_time) 
\ No newline at end of file
+                    process = self.ready_queue.pop() # 실행시간이 가장 짧은 프로세스
+                    processor.assign_process(process,self.current_time) 
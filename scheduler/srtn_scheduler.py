@@ -1,24 +1,26 @@
 from scheduler import BaseScheduler
-from collections import deque
+from scheduler.ready_queue import ReadyQueue, HeapReadyQueue
 
 class SRTNScheduler(BaseScheduler):
+    def create_ready_queue(self) -> ReadyQueue:
+        return HeapReadyQueue(key=lambda p: (p.remaining_time, p.arrival)) # RT를 기준으로 보조키 AT
+
     def assign_process(self) -> None:
         """
         Remain Time을 기준으로 정렬하여 프로세스를 할당하는 스케줄러(선점)
         실행중인 프로세스 남은시간 > 대기큐에서 남은시간이 가장 짧은 프로세스의 남은시간 => 선점
         """
-        for processor in self.processors_info:
+        for processor in self.dispatch_order():
             if not processor.is_process_empty() and self.ready_queue: #선점
-                shortest = min(self.ready_queue, key=lambda p: (p.remaining_time, p.arrival)) #RT를 기준으로 보조키 AT를 기준으로 정렬
+                shortest = self.ready_queue.peek_latest() #RT가 가장 짧은 프로세스 (같으면 가장 나중에 들어온 프로세스)
 
                 if shortest.remaining_time < processor.current_process.remaining_time: # 선점 조건
-                    self.ready_queue.remove(shortest)                                  # 큐에서 실행할 프로세스를 제거
-                    self.ready_queue.appendleft(processor.current_process)             # 큐에 실행중인 프로세스를 삽입
+                    self.ready_queue.pop_latest()                                      # 큐에서 실행할 프로세스를 제거
+                    self.ready_queue.push(processor.current_process)                   # 큐에 실행중인 프로세스를 삽입
                     processor.preempt_process()                                        # 프로세서 비움     
                     processor.assign_process(shortest, self.current_time)              # 새로운 프로세스 할당
             
             if processor.is_process_empty(): #프로세서에 비어있을 떄
                 if self.ready_queue:
-                    self.ready_queue = deque(sorted(self.ready_queue, key=lambda p: (p.remaining_time, p.arrival), reverse=True)) #RT를 기준으로 보조키 AT를 보조키로 정렬
-                    next_process = self.ready_queue.pop() #정렬된 큐에서 가장 RT가 짧은 프로세서를 next_process로 지정
-                    processor.assign_process(next_process, self.current_time) #실행
\ No newline at end of file
+                    next_process = self.ready_queue.pop() #큐에서 가장 RT가 짧은 프로세스를 next_process로 지정
+                    processor.assign_process(next_process, self.current_time) #실행
@@ -0,0 +1,108 @@
+import time
+
+
+class SimulationStats:
+    """
+    시뮬레이션 단계별 실행 시간, 호출 횟수와 스케줄링 카운터 (선택 사항)
+    - 스케줄러에 넘기면 해당 스케줄러 객체의 단계 메서드만 시간 측정 함수로 감싸므로,
+      넘기지 않은 경우에는 추가 비용이 없고 켜도 시뮬레이션 결과는 같음
+    - 대기 큐 길이는 스케줄링 단계마다(tick 또는 이벤트마다) 할당 직후 한 번씩 기록
+    - advance_to_next_event 시간에는 건너뛴 구간의 process_waiting_time_update 시간도 포함됨
+    - counters
+      · dispatches: 프로세서에 프로세스를 할당한 횟수
+      · preemptions: 끝나지 않은 프로세스를 회수한 횟수
+      · sorts: 대기 큐를 정렬한 횟수 (정렬이 있는 스케줄러만, 힙 대기 큐는 힙을 다시 만든 횟수)
+      · scanned: 우선순위 비교를 위해 살펴본 프로세스 수 (힙 대기 큐는 key 비교 횟수)
+      · migrations: 다른 프로세서의 대기 큐로 옮겨진 횟수 (멀티 큐 모드만)
+    """
+    PHASES = (
+        "update_ready_queue", "schedule", "assign_process", "power_off_idle_processors",
+        "process_waiting_time_update", "log_state", "advance_to_next_event",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase_time = {phase: 0.0 for phase in self.PHASES}     # 단계별 누적 시간 (초)
+        self.phase_calls = {phase: 0 for phase in self.PHASES}      # 단계별 호출 횟수
+        self.ready_queue_samples = 0
+        self.ready_queue_total = 0
+        self.ready_queue_max = 0
+        self.counters = {"dispatches": 0, "preemptions": 0, "sorts": 0, "scanned": 0, "migrations": 0}
+        self.scheduler = None
+
+    def attach(self, scheduler) -> None:
+        """스케줄러의 단계 메서드를 측정 함수로 감쌈 (이전 결과는 지움)"""
+        self.reset()
+        self.scheduler = scheduler
+        self.initial_dispatches = sum(p.dispatches for p in scheduler.processors_info)
+        self.initial_preemptions = sum(p.preemptions for p in scheduler.processors_info)
+        for phase in self.PHASES:
+            method = getattr(scheduler, phase)
+            if phase == "assign_process":
+                setattr(scheduler, phase, self.timed_assign(method, scheduler))
+            else:
+                setattr(scheduler, phase, self.timed(phase, method))
+
+    def timed(self, phase: str, method):
+        phase_time = self.phase_time
+        phase_calls = self.phase_calls
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                phase_time[phase] += time.perf_counter() - start
+                phase_calls[phase] += 1
+        return wrapper
+
+    def timed_assign(self, method, scheduler):
+        """할당 단계 측정 + 할당 직후 대기 큐 길이 기록"""
+        timed = self.timed("assign_process", method)
+
+        def wrapper():
+            timed()
+            length = len(scheduler.ready_queue)
+            self.ready_queue_samples += 1
+            self.ready_queue_total += length
+            if length > self.ready_queue_max:
+                self.ready_queue_max = length
+        return wrapper
+
+    def collect(self) -> None:
+        """프로세서와 대기 큐의 카운터를 가져옴 (시뮬레이션이 끝난 뒤 호출)"""
+        scheduler = self.scheduler
+        if scheduler is None:
+            return
+        self.counters["dispatches"] = sum(p.dispatches for p in scheduler.processors_info) - self.initial_dispatches
+        self.counters["preemptions"] = sum(p.preemptions for p in scheduler.processors_info) - self.initial_preemptions
+        self.counters["sorts"] = scheduler.ready_queue.sorts
+        self.counters["scanned"] = scheduler.ready_queue.scanned
+        if scheduler.multi_queue:
+            self.counters["migrations"] = scheduler.ready_queue.migration_count
+
+    @property
+    def ready_queue_average(self) -> float:
+        return self.ready_queue_total / self.ready_queue_samples if self.ready_queue_samples else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": {phase: {"time": self.phase_time[phase], "calls": self.phase_calls[phase]}
+                       for phase in self.PHASES if self.phase_calls[phase]},
+            "ready_queue": {"samples": self.ready_queue_samples, "average": self.ready_queue_average, "max": self.ready_queue_max},
+            "counters": dict(self.counters),
+        }
+
+    def report(self) -> str:
+        """사람이 읽기 쉬운 요약"""
+        total = sum(self.phase_time.values())
+        lines = ["단계                           시간(s)     비율     호출 수"]
+        for phase in self.PHASES:
+            if self.phase_calls[phase]:
+                ratio = self.phase_time[phase] / total if total else 0
+                lines.append(f"{phase.ljust(28)} {self.phase_time[phase]:9.4f} {ratio:8.1%} {self.phase_calls[phase]:10d}")
+        lines.append(f"대기 큐 길이: 평균 {self.ready_queue_average:.2f}, 최대 {self.ready_queue_max}")
+        lines.append(", ".join(f"{name} {value}" for name, value in self.counters.items()))
+        return "\n".join(lines)
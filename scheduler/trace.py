@@ -0,0 +1,175 @@
+import json
+import sys
+
+
+class TraceSink:
+    """
+    시뮬레이션 추적 출력 인터페이스 (기본 구현은 아무것도 하지 않음)
+    - enabled가 False면 스케줄러는 상태 정리 자체를 건너뜀
+    - state: 스케줄링 단계가 끝난 시점의 상태 (tick 또는 이벤트마다)
+    - summary: 시뮬레이션 종료 후 결과
+    """
+    enabled = False
+
+    def state(self, scheduler) -> None:
+        pass
+
+    def summary(self, scheduler) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class NullTraceSink(TraceSink):
+    """추적을 하지 않는 기본 출력"""
+    pass
+
+
+class TextTraceSink(TraceSink):
+    """기존 디버깅 출력과 같은 형식의 텍스트 출력"""
+    enabled = True
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+
+    def print(self, *args, **kwargs) -> None:
+        print(*args, file=self.stream, **kwargs)
+
+    def print_process(self, process) -> None:
+        self.print(f"Process {process.pid}: Arrival {process.arrival}, BT {process.burst}, Remaining {process.remaining_time}, ST {process.start_time}, WT {process.wait_time}, TT {process.turnaround_time}, NTT {process.normalized_turnaround_time}")
+
+    def state(self, scheduler) -> None:
+        waiting_processes = [p for p in scheduler.processes if not p.is_completed() and not p.is_running()]
+        ended_processes = [p for p in scheduler.processes if p.is_completed()]
+
+        self.print("-----------")
+        self.print(f"현재 시간: {scheduler.current_time}")
+        self.print(f"현재 전력 사용량: {scheduler.calculate_total_power()}")
+        self.print(f"현재 대기 큐:", end="")
+        for process in scheduler.ready_queue:
+            self.print(f" {process.pid}", end="")
+        self.print()
+        self.print("실행 중인 프로세스")
+        for processor in scheduler.processors_info:
+            if(processor.PowerOn == False): self.print(f"[꺼짐]", end="")
+            else: self.print(f"[켜짐]", end="")
+            self.print(f"프로세서 {processor.id} |", end="")
+            if(processor.time_quantum is not None): self.print(f"시간 쿼텀: {processor.time_quantum}", end="")
+            if(processor.current_process):
+                self.print_process(processor.current_process)
+            else:
+                self.print("없음")
+
+        self.print("쉬는 프로세스")
+        for process in waiting_processes:
+            self.print_process(process)
+
+        self.print("종료된 프로세스")
+        for process in ended_processes:
+            self.print_process(process)
+        self.print("-----------")
+        self.print()
+        self.print()
+
+    def summary(self, scheduler) -> None:
+        self.print("끝")
+        cell_width = 5
+        header = "프로세서 시간|"
+        for t in range(1, scheduler.current_time):
+            header += f"{str(t).rjust(cell_width)}"
+        self.print(header)
+        for processor in scheduler.processors_info:
+            row = f"프로세서 {processor.id}".ljust(9) + "|"
+            for pid in processor.timeline:
+                cell = str(pid) if pid is not None else "-"
+                row += f"{cell.rjust(cell_width)}"
+            self.print(row)
+
+        # 평균 NTT 값 (성능평가용, 집계기가 있으면 끝난 프로세스를 다시 모으지 않음)
+        if scheduler.metrics is not None:
+            self.print("평균 NTT : ", scheduler.metrics.normalized_turnaround_time.stat.mean)
+            return
+        ended_processes = [p for p in scheduler.processes if p.is_completed()]
+        sum_ntt = 0
+        for process in ended_processes:
+            sum_ntt += process.normalized_turnaround_time
+        avg_ntt = sum_ntt / len(ended_processes)
+        self.print("평균 NTT : ", avg_ntt)
+
+
+class JSONLTraceSink(TraceSink):
+    """
+    한 줄에 하나의 JSON 레코드로 기록하는 출력 (buffer_size 개씩 모아서 기록)
+    - state 레코드는 현재 실행 상태만 담아 프로세스 수와 무관한 크기를 유지
+    """
+    enabled = True
+
+    def __init__(self, file, buffer_size: int = 1000) -> None:
+        if isinstance(file, str):
+            self.file = open(file, "w", encoding="utf-8")
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+        self.buffer_size = buffer_size
+        self.buffer = []
+
+    def write(self, record: dict) -> None:
+        self.buffer.append(json.dumps(record, ensure_ascii=False))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.buffer.clear()
+        self.file.flush()
+
+    def state(self, scheduler) -> None:
+        self.write({
+            "type": "state",
+            "time": scheduler.current_time,
+            "power": scheduler.calculate_total_power(),
+            "ready_queue": [process.pid for process in scheduler.ready_queue],
+            "processors": [
+                {
+                    "id": processor.id,
+                    "power_on": processor.PowerOn,
+                    "time_quantum": processor.time_quantum,
+                    "pid": processor.current_process.pid if processor.current_process else None,
+                    "remaining": processor.current_process.remaining_time if processor.current_process else None,
+                }
+                for processor in scheduler.processors_info
+            ],
+        })
+
+    def summary(self, scheduler) -> None:
+        self.write({
+            "type": "summary",
+            "time": scheduler.current_time,
+            "power": scheduler.calculate_total_power(),
+            "metrics": scheduler.metrics.as_dict() if scheduler.metrics is not None else None,
+            "processes": [
+                {
+                    "pid": process.pid,
+                    "arrival": process.arrival,
+                    "burst": process.burst,
+                    "start": process.start_time,
+                    "wait": process.wait_time,
+                    "turnaround": process.turnaround_time,
+                    "ntt": process.normalized_turnaround_time,
+                }
+                for process in scheduler.processes
+            ],
+            "processors": [
+                {"id": processor.id, "type": processor.type, "used_power": processor.used_power, "timeline": list(processor.timeline.segments())}
+                for processor in scheduler.processors_info
+            ],
+        })
+        self.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self.owns_file:
+            self.file.close()
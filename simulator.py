@@ -1,5 +1,8 @@
-from typing import List
+from typing import Callable, Iterable, List, Union
 from core.process import Process
+from core.process_table import ProcessTable
+from core.process_stream import ProcessStream
+from core.workload import Workload
 from core.processor import Processor
 from scheduler import (
     BaseScheduler,
@@ -10,13 +13,27 @@ from scheduler import (
     SRTNScheduler,
     CustomScheduler,
     SchedulerType,
+    TraceSink,
+    SimulationStats,
+    StreamingMetrics,
+    Checkpointer,
 )
+from scheduler import closed_form
 
 class SchedulerApp:
-    def __init__(self, scheduler_type: SchedulerType = SchedulerType.FCFS) -> None:
-        self.processes: List[Process] = []
+    def __init__(self, scheduler_type: SchedulerType = SchedulerType.FCFS, event_driven: bool = False, trace: TraceSink = None, columnar: bool = False,
+                 stats: SimulationStats = None, metrics: StreamingMetrics = None, checkpoint: Checkpointer = None,
+                 multi_queue: bool = False) -> None:
+        # columnar: True면 프로세스를 ProcessTable(열 단위 저장)에 보관 (대규모 작업량용)
+        self.processes: Union[List[Process], ProcessTable] = ProcessTable() if columnar else []
         self.processors: List[Processor] = []
         self.scheduler_type: SchedulerType = scheduler_type
+        self.event_driven: bool = event_driven     # True면 이벤트 기반 시뮬레이션(빈 구간 건너뜀)
+        self.trace: TraceSink = trace              # 추적 출력 (None이면 출력 안 함)
+        self.stats: SimulationStats = stats        # 단계별 측정 (None이면 측정 안 함, 실행 후 결과를 읽음)
+        self.metrics: StreamingMetrics = metrics   # 끝난 프로세스 결과 집계 (None이면 집계 안 함)
+        self.checkpoint: Checkpointer = checkpoint # 주기적 체크포인트 저장 (None이면 저장 안 함)
+        self.multi_queue: bool = multi_queue       # True면 프로세서별 대기 큐 + 작업 가져오기
         self.scheduler: BaseScheduler = None
         
         self.scheduler_map = {
@@ -30,17 +47,53 @@ class SchedulerApp:
 
     # 프로세스 관련 메서드
     def add_process(self, pid: int, arrival: int, burst: int) -> None:
-        self.processes.append(Process(pid=pid, arrival=arrival, burst=burst))
+        if isinstance(self.processes, ProcessTable):
+            self.processes.add(pid=pid, arrival=arrival, burst=burst)
+        else:
+            self.processes.append(Process(pid=pid, arrival=arrival, burst=burst))
 
     def add_processes(self, process_list: List[Process]) -> None:
         self.processes.extend(process_list)
 
     def remove_process(self, pid: int) -> None:
-        self.processes = [p for p in self.processes if p.pid != pid]
+        if isinstance(self.processes, ProcessTable):
+            self.processes = self.processes.without_pid(pid)
+        else:
+            self.processes = [p for p in self.processes if p.pid != pid]
 
     def reset_processes(self) -> None:
         self.processes.clear()
 
+    def load_workload(self, workload: Workload) -> None:
+        """작업량 명세로 프로세스 목록을 새로 만듦 (기존 프로세스는 대체)"""
+        self.processes = workload.to_table() if isinstance(self.processes, ProcessTable) else workload.to_processes()
+
+    def load_stream(self, processes: Iterable[Process], reorder_window: int = 0,
+                    on_complete: Callable[[Process], None] = None, keep_completed: bool = False) -> None:
+        """
+        도착 순서로 읽어 오는 작업량을 사용 (read_csv, read_jsonl 등의 결과)
+        - 실행 중에는 도착했지만 끝나지 않은 프로세스만 메모리에 남음 (자세한 내용은 ProcessStream 참고)
+        """
+        self.processes = ProcessStream(processes, reorder_window=reorder_window,
+                                       on_complete=on_complete, keep_completed=keep_completed)
+
+    def reset_state(self) -> None:
+        """
+        이전 실행 결과를 지우고 프로세스, 프로세서를 처음 상태로 되돌림
+        - 객체를 새로 만들지 않으므로 같은 입력으로 scheduler_type만 바꿔 다시 실행할 수 있음
+        """
+        if isinstance(self.processes, ProcessStream):
+            if self.scheduler is not None and self.scheduler.processes is self.processes:
+                raise ValueError("스트림 작업량은 다시 실행할 수 없습니다. load_stream()으로 다시 읽어야 합니다")
+        elif isinstance(self.processes, ProcessTable):
+            self.processes.reset()
+        else:
+            for process in self.processes:
+                process.reset()
+        for processor in self.processors:
+            processor.reset()
+        self.scheduler = None
+
     # 프로세서 관련 메서드
     def add_processor(self, id: int, type: str, time_quantum: int = None) -> None: #time_quantum은 RR용으로만 사용됨
         self.processors.append(Processor(id=id, type=type, time_quantum=time_quantum))
@@ -59,18 +112,38 @@ class SchedulerApp:
         scheduler_class = self.scheduler_map.get(self.scheduler_type)
         if scheduler_class is None:
             raise ValueError(f"지원하지 않는 스케줄러 유형입니다: {self.scheduler_type}")
-        self.scheduler = scheduler_class(self.processes, self.processors)
+        self.scheduler = scheduler_class(self.processes, self.processors, trace=self.trace, stats=self.stats,
+                                         metrics=self.metrics, checkpoint=self.checkpoint, multi_queue=self.multi_queue)
 
     # 시뮬레이션 관련 메서드
     def run_scheduler(self) -> None:
-        self.scheduler.simulate()
+        # 비선점 FCFS, SPN은 시간 단위 시뮬레이션 없이 결과를 바로 계산
+        if closed_form.can_solve(self.scheduler):
+            closed_form.solve(self.scheduler)
+        elif self.event_driven:
+            self.scheduler.simulate_event_driven()
+        else:
+            self.scheduler.simulate()
 
     def print_results(self) -> None:
-        print("끝")
         if self.scheduler:
             self.scheduler.log_process_queue()
 
     def run(self) -> None:
+        if self.scheduler is not None:
+            self.reset_state() # 이전 실행 결과가 남아 있으면 초기화 후 다시 실행
+        self.select_scheduler()
+        self.run_scheduler()
+        self.print_results()
+
+    def resume(self, path: str) -> None:
+        """
+        체크포인트 파일에서 이어서 실행 (저장할 때와 같은 작업량, 프로세서, scheduler_type이어야 함)
+        - 스트림 작업량은 load_stream()으로 같은 입력을 다시 읽은 뒤 호출
+        """
+        if self.scheduler is not None:
+            self.reset_state()
         self.select_scheduler()
+        self.scheduler.restore_checkpoint(path)
         self.run_scheduler()
         self.print_results()
@@ -1,7 +1,57 @@
+import io
+import json
+import os
+import random
+import tempfile
+import threading
 import unittest
-from core import Process, Processor
+from core import Process, WaitClock, Processor, Timeline, BoundedTimeline, ProcessTable, Workload, read_csv, read_jsonl, generate_workload, generate_processes
 from simulator import SchedulerApp  
-from scheduler import SchedulerType
+import batch
+import benchmark
+from scheduler import SchedulerType, FCFSScheduler, SPNScheduler, JSONLTraceSink, SimulationStats, RunQueues, FIFOReadyQueue, ResponseRatioReadyQueue, StreamingMetrics, Checkpointer, RecordingTraceSink, Replay, SimulationCancelled, closed_form
+
+# 여러 테스트가 함께 쓰는 작업량 (동시에 대기하는 프로세스가 많고, 시간 40에 쉬는 구간 뒤 하나가 더 도착)
+WORKLOAD = Workload([(1, 0, 7), (2, 1, 6), (3, 3, 5), (4, 4, 10), (5, 6, 5), (6, 40, 5)])
+
+
+def time_quantum(scheduler_type):
+    """시간 쿼텀을 쓰는 스케줄러(RR, CUSTOM)는 2, 나머지는 None"""
+    return 2 if scheduler_type in (SchedulerType.RR, SchedulerType.CUSTOM) else None
+
+
+def new_app(scheduler_type, workload=WORKLOAD, processors="EP", stream=None, **options):
+    """
+    workload를 읽고 processors의 종류 순서대로 프로세서(ID 1부터)를 추가한 SchedulerApp
+    - stream이 있으면 workload 대신 도착 순서로 읽어 오는 작업량 사용 (끝난 프로세스도 결과 비교용으로 보관)
+    - options는 SchedulerApp에 그대로 전달
+    """
+    app = SchedulerApp(scheduler_type=scheduler_type, **options)
+    if stream is not None:
+        app.load_stream(stream, reorder_window=2, keep_completed=True)
+    else:
+        app.load_workload(workload)
+    for id, type in enumerate(processors, start=1):
+        app.add_processor(id=id, type=type, time_quantum=time_quantum(scheduler_type))
+    return app
+
+
+def result(scheduler):
+    """실행 결과 비교용 (끝난 시간, PID 순서의 프로세스 결과, 프로세서별 전력과 실행 구간)"""
+    processes = sorted((p.pid, p.start_time, p.wait_time, p.turnaround_time, p.normalized_turnaround_time) for p in scheduler.get_process())
+    processors = [(p.id, p.used_power, list(p.timeline.segments())) for p in scheduler.get_processors()]
+    return scheduler.current_time, processes, processors
+
+
+def dispatches(scheduler):
+    """프로세서별 할당 횟수 (closed_form은 세지 않으므로 시뮬레이션끼리 비교할 때만 사용)"""
+    return [p.dispatches for p in scheduler.get_processors()]
+
+
+def run(app):
+    app.run()
+    return result(app.scheduler)
+
 
 class TestSchedulerApp(unittest.TestCase):
     def setUp(self):
@@ -176,6 +226,565 @@ class TestSchedulerApp(unittest.TestCase):
         self.assertEqual(processors[0].used_power, 0.1 + 1 * 20) 
 
 
+class TestEventDrivenEngine(unittest.TestCase):
+    """이벤트 기반 시뮬레이션이 기존 tick 시뮬레이션과 같은 결과를 내는지 테스트"""
+    def test_same_results(self):
+        for scheduler_type in SchedulerType:
+            for processors in ("E", "EP"):
+                with self.subTest(scheduler_type=scheduler_type, processors=processors):
+                    self.assertEqual(run(new_app(scheduler_type, processors=processors, event_driven=False)),
+                                     run(new_app(scheduler_type, processors=processors, event_driven=True)))
+
+
+class TestProcessorSets(unittest.TestCase):
+    """프로세서가 많을 때 실행 중, 쉬는 프로세서 목록이 실제 상태와 맞고 결과가 tick, 이벤트 기반에서 같은지 테스트"""
+    workload = generate_workload(1500, "PE" * 16, utilization=0.5, arrival="bursty", seed=7)
+
+    def new_app(self, scheduler_type, event_driven):
+        app = new_app(scheduler_type, self.workload, "EP" * 16, event_driven=event_driven)
+        app.select_scheduler()
+        return app
+
+    def result(self, app):
+        """closed_form을 거치지 않도록 시뮬레이션을 직접 실행"""
+        app.scheduler.simulate_event_driven() if app.event_driven else app.scheduler.simulate()
+        return result(app.scheduler), dispatches(app.scheduler)
+
+    def test_sets_match_processors(self):
+        for scheduler_type in SchedulerType:
+            with self.subTest(scheduler_type=scheduler_type):
+                scheduler = self.new_app(scheduler_type, False).scheduler
+                while scheduler.has_next():
+                    scheduler.update_ready_queue()
+                    scheduler.schedule()
+                    scheduler.assign_process()
+                    scheduler.power_off_idle_processors()
+                    scheduler.process_waiting_time_update()
+                    busy = [order for order, p in enumerate(scheduler.processors_info) if not p.is_process_empty()]
+                    self.assertEqual(scheduler.busy_order, busy)
+                    self.assertEqual(sorted(scheduler.idle_order + busy), list(range(len(scheduler.processors_info))))
+                    self.assertFalse(any(scheduler.processors_info[order].PowerOn for order in scheduler.idle_order))
+                    scheduler.update_current_time()
+
+    def test_same_results(self):
+        for scheduler_type in SchedulerType:
+            with self.subTest(scheduler_type=scheduler_type):
+                self.assertEqual(self.result(self.new_app(scheduler_type, False)), self.result(self.new_app(scheduler_type, True)))
+
+
+class TestClosedForm(unittest.TestCase):
+    """FCFS, SPN 바로 계산 결과가 tick 시뮬레이션과 같은지 테스트"""
+    def build(self, scheduler_class):
+        processes = [
+            Process(pid=1, arrival=0, burst=7),
+            Process(pid=2, arrival=1, burst=6),
+            Process(pid=3, arrival=1, burst=2),
+            Process(pid=4, arrival=4, burst=10),
+            Process(pid=5, arrival=6, burst=5),
+            Process(pid=6, arrival=40, burst=5),
+        ]
+        processors = [Processor(id=1, type="E"), Processor(id=2, type="P")]
+        return scheduler_class(processes, processors)
+
+    def test_same_results(self):
+        for scheduler_class in (FCFSScheduler, SPNScheduler):
+            with self.subTest(scheduler=scheduler_class.__name__):
+                expected = self.build(scheduler_class)
+                expected.simulate()
+                actual = self.build(scheduler_class)
+                self.assertTrue(closed_form.can_solve(actual))
+                closed_form.solve(actual)
+                self.assertEqual(result(expected), result(actual))
+
+
+class TestBatch(unittest.TestCase):
+    """배치 실행 결과가 병렬, 순차 실행에서 같고 단독 실행과도 같은지 테스트"""
+    def test_parallel_matches_serial(self):
+        workloads = {
+            "ppt": [(1, 0, 3), (2, 2, 7), (3, 4, 2), (4, 5, 5), (5, 6, 3)],
+            "gap": [(1, 0, 7), (2, 1, 6), (3, 40, 5)],
+        }
+        processor_configs = {
+            "E1": [(1, "E", 2)],
+            "P1E1": [(1, "P", 3), (2, "E", 3)],
+        }
+        serial = batch.run_batch(workloads, processor_configs, max_workers=1)
+        parallel = batch.run_batch(workloads, processor_configs, max_workers=2, chunksize=3)
+        self.assertEqual(len(serial), len(workloads) * len(processor_configs) * len(SchedulerType))
+        self.assertEqual(serial, parallel)
+        jobs = batch.build_jobs(workloads, processor_configs, SchedulerType)
+        self.assertEqual({job[0] for job in jobs}, set(workloads)) # 실행 단위에는 작업량 이름만 담음
+        self.assertTrue(all(isinstance(value, (str, tuple)) for job in jobs for value in job))
+
+        app = SchedulerApp(scheduler_type=SchedulerType.FCFS)
+        for pid, arrival, burst in workloads["ppt"]:
+            app.add_process(pid=pid, arrival=arrival, burst=burst)
+        app.add_processor(id=1, type="E")
+        app.run()
+        row = serial[0]
+        self.assertEqual((row["workload"], row["processors"], row["scheduler"]), ("ppt", "E1", "FCFS"))
+        self.assertEqual(row["total_power"], app.scheduler.calculate_total_power())
+
+
+class TestWorkloadReset(unittest.TestCase):
+    """같은 SchedulerApp을 초기화하며 반복 실행한 결과가 새로 만든 것과 같은지 테스트"""
+    def test_rerun_matches_fresh(self):
+        scheduler_types = [SchedulerType.SRTN, SchedulerType.FCFS, SchedulerType.HRRN, SchedulerType.SPN, SchedulerType.SRTN]
+        for columnar in (False, True):
+            reused = new_app(scheduler_types[0], columnar=columnar)
+            for scheduler_type in scheduler_types:
+                with self.subTest(columnar=columnar, scheduler_type=scheduler_type):
+                    reused.scheduler_type = scheduler_type
+                    self.assertEqual(run(reused), run(new_app(scheduler_type, columnar=columnar)))
+        self.assertEqual(Workload.from_processes(reused.processes), WORKLOAD)
+
+
+class TestProcessStream(unittest.TestCase):
+    """도착 순서로 읽어 오는 작업량이 전체 목록과 같은 결과를 내는지 테스트"""
+    rows = [list(WORKLOAD)[i] for i in (1, 0, 2, 4, 3, 5)] # WORKLOAD를 도착 순서가 조금 섞이게 나열 (reorder_window=2로 정렬)
+
+    def test_same_results_as_process_list(self):
+        jsonl = "".join(json.dumps({"pid": pid, "arrival": arrival, "burst": burst}) + "\n" for pid, arrival, burst in self.rows)
+        for scheduler_type in (SchedulerType.FCFS, SchedulerType.RR, SchedulerType.SRTN):
+            with self.subTest(scheduler_type=scheduler_type):
+                expected = run(new_app(scheduler_type, event_driven=True))
+                actual = run(new_app(scheduler_type, stream=read_jsonl(io.StringIO(jsonl)), event_driven=True))
+                self.assertEqual(expected, actual)
+
+    def test_out_of_order(self):
+        app = SchedulerApp()
+        app.load_stream(read_csv(io.StringIO("pid,arrival,burst\n1,5,3\n2,0,3\n")))
+        app.add_processor(id=1, type="E")
+        with self.assertRaises(ValueError):
+            app.run()
+
+    def test_read_csv(self):
+        rows = lambda text: [(p.pid, p.arrival, p.burst) for p in read_csv(io.StringIO(text))]
+        self.assertEqual(rows("# 주석\nburst,PID,arrival\n3,1,0\n"), [(1, 0, 3)])
+        self.assertEqual(rows("1,0,3\n2,1,4\n"), [(1, 0, 3), (2, 1, 4)])
+        with self.assertRaisesRegex(ValueError, "2번째 줄의 arrival"):
+            rows("1,0,3\n2,x,4\n")
+        with self.assertRaisesRegex(ValueError, "1번째 줄의 pid"): # 열 이름이 다르면 머리글로 보지 않음
+            rows("id,arrival,burst\n1,0,3\n")
+        with self.assertRaisesRegex(ValueError, "2번째 줄에 burst"):
+            rows("pid,arrival,burst\n1,0\n")
+
+
+class TestWorkloadGenerator(unittest.TestCase):
+    """seed가 같으면 같은 작업량이 나오고, 평균 부하가 목표 근처인지 테스트"""
+    def test_reproducible(self):
+        for arrival in ("poisson", "bursty"):
+            for burst in ("exponential", "bimodal", "pareto"):
+                with self.subTest(arrival=arrival, burst=burst):
+                    options = dict(utilization=0.9, arrival=arrival, burst=burst, seed=42)
+                    workload = generate_workload(20000, "PPEE", **options)
+                    self.assertEqual(workload, generate_workload(20000, "PPEE", **options))
+                    self.assertEqual(list(workload), [(p.pid, p.arrival, p.burst) for p in generate_processes(20000, "PPEE", **options)])
+                    rows = list(workload)
+                    utilization = sum(burst for _, _, burst in rows) / (rows[-1][1] + 1) / 6
+                    self.assertAlmostEqual(utilization, 0.9, delta=0.1)
+                    self.assertEqual([arrival for _, arrival, _ in rows], sorted(arrival for _, arrival, _ in rows))
+
+
+class TestBenchmark(unittest.TestCase):
+    """측정 결과 형식과 기준값 비교 테스트"""
+    def test_compare_results(self):
+        case = benchmark.build_cases([50], ["PE"], [2], [SchedulerType.RR])[0]
+        result = benchmark.run_case(case)
+        self.assertAlmostEqual(result["ticks"], result["ticks_per_sec"] * result["wall_time"])
+        self.assertGreater(result["steps"], 0)
+        self.assertIn("workload_memory_mb", result) # 작업량 생성분은 엔진 메모리와 따로 기록
+
+        baseline = [dict(result, ticks_per_sec=result["ticks_per_sec"] * 2)]
+        self.assertEqual(len(benchmark.compare_results([result], baseline, threshold=0.2)), 1)
+        self.assertEqual(benchmark.compare_results([result], [result], threshold=0.2), [])
+
+        small = dict(result, peak_memory_mb=1.0)
+        self.assertEqual(benchmark.compare_results([dict(small, peak_memory_mb=3.0)], [small], threshold=0.2), [])
+        self.assertEqual(len(benchmark.compare_results([dict(small, peak_memory_mb=30.0)], [small], threshold=0.2)), 1)
+
+    def test_worst_case_bursts(self):
+        """HRRN은 실행 시간 종류가 많은 pareto 분포로도 측정"""
+        cases = benchmark.build_cases([50], ["PE"], [2], [SchedulerType.RR, SchedulerType.HRRN])
+        self.assertEqual([benchmark.case_key(case) for case in cases],
+                         ["RR/q2/PE/n50/event", "HRRN/PE/n50/event", "HRRN/PE/pareto/n50/event"])
+        self.assertGreater(benchmark.run_case(cases[-1])["steps"], 0)
+
+    def test_closed_form_cases_use_engine(self):
+        """비선점 FCFS, SPN도 지정한 엔진으로 시뮬레이션해 tick과 event 결과가 같음"""
+        for scheduler_type in (SchedulerType.FCFS, SchedulerType.SPN):
+            with self.subTest(scheduler_type=scheduler_type):
+                tick, event = (benchmark.run_case(case) for case in
+                               (benchmark.build_cases([50], ["PE"], [2], [scheduler_type], event_driven=event_driven)[0]
+                                for event_driven in (False, True)))
+                self.assertEqual(tick["ticks"], event["ticks"])
+                self.assertGreater(tick["steps"], event["steps"]) # closed_form이면 둘 다 0
+
+
+class TestSimulationStats(unittest.TestCase):
+    """단계별 측정을 켜도 결과가 같고, 카운터가 채워지는지 테스트"""
+    def test_same_results(self):
+        for scheduler_type in SchedulerType:
+            for event_driven in (False, True):
+                with self.subTest(scheduler_type=scheduler_type, event_driven=event_driven):
+                    stats = SimulationStats()
+                    expected = run(new_app(scheduler_type, event_driven=event_driven))
+                    app = new_app(scheduler_type, event_driven=event_driven, stats=stats)
+                    self.assertEqual(expected, run(app))
+                    scheduler = app.scheduler
+                    self.assertEqual(stats.phase_calls["update_ready_queue"], scheduler.step_count)
+                    self.assertEqual(stats.ready_queue_samples, scheduler.step_count)
+                    self.assertEqual(stats.counters["dispatches"] - stats.counters["preemptions"], 6)
+                    if scheduler_type == SchedulerType.RR:
+                        self.assertGreater(stats.counters["preemptions"], 0)
+                    if scheduler_type == SchedulerType.HRRN:
+                        self.assertGreater(stats.counters["sorts"], 0)
+                    if scheduler_type in (SchedulerType.SPN, SchedulerType.SRTN):
+                        self.assertGreater(stats.counters["scanned"], 0)
+
+
+class TestStreamingMetrics(unittest.TestCase):
+    """끝날 때마다 누적한 지표가 전체 결과로 계산한 값과 같은지(백분위수는 상대 오차 1% 이내) 테스트"""
+    def test_matches_post_hoc(self):
+        workload = generate_workload(3000, "PE", utilization=0.95, burst="pareto", seed=5)
+        for scheduler_type in (SchedulerType.FCFS, SchedulerType.RR, SchedulerType.HRRN):
+            with self.subTest(scheduler_type=scheduler_type):
+                expected = SchedulerApp(scheduler_type=scheduler_type, event_driven=True)
+                expected.load_workload(workload)
+                metrics = StreamingMetrics()
+                streamed = SchedulerApp(scheduler_type=scheduler_type, event_driven=True, metrics=metrics)
+                streamed.load_stream(iter(workload.to_processes()))
+                for app in (expected, streamed):
+                    app.add_processor(id=1, type="P", time_quantum=3)
+                    app.add_processor(id=2, type="E", time_quantum=3)
+                    app.run()
+                self.assertEqual(list(streamed.processes), []) # 끝난 프로세스는 보관하지 않음
+
+                processes = expected.scheduler.get_process()
+                self.assertEqual(metrics.count, len(processes))
+                for name in ("wait_time", "turnaround_time", "normalized_turnaround_time"):
+                    values = sorted(getattr(p, name) for p in processes)
+                    summary = getattr(metrics, name).as_dict()
+                    self.assertAlmostEqual(summary["mean"], sum(values) / len(values))
+                    self.assertEqual((summary["min"], summary["max"]), (values[0], values[-1]))
+                    for key, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+                        exact = values[int(q * (len(values) - 1))]
+                        self.assertLessEqual(abs(summary[key] - exact), exact * 0.01 + 1e-9)
+                for processor, expected_processor in zip(metrics.processor_summary(), expected.scheduler.get_processors()):
+                    self.assertEqual(processor["energy"], expected_processor.used_power)
+                    self.assertEqual(processor["busy"], sum(end - start for pid, start, end in expected_processor.timeline.segments() if pid))
+
+
+class TestCheckpoint(unittest.TestCase):
+    """체크포인트에서 이어서 실행한 결과가 중단 없이 실행한 것과 같은지 테스트"""
+    workload = generate_workload(200, "PE", utilization=1.2, seed=7)
+
+    class Interrupt(Exception):
+        pass
+
+    class InterruptingCheckpointer(Checkpointer):
+        """두 번째 저장 직후 실행을 멈춤 (프로세스 재시작 대신)"""
+        def save(self, scheduler):
+            super().save(scheduler)
+            if self.saved == 2:
+                raise TestCheckpoint.Interrupt()
+
+    def new_app(self, scheduler_type, event_driven, kind, checkpoint):
+        stream = iter(self.workload.to_processes()) if kind == "stream" else None
+        return new_app(scheduler_type, self.workload, stream=stream, event_driven=event_driven, columnar=kind == "table",
+                       metrics=StreamingMetrics(), checkpoint=checkpoint)
+
+    def result(self, app):
+        """공통 결과에 할당 횟수, 진행 단계 수, 프로세스의 전체 상태, 누적 지표를 더함"""
+        scheduler = app.scheduler
+        return result(scheduler), dispatches(scheduler), scheduler.step_count, sorted(p.get_state() for p in scheduler.get_process()), app.metrics.as_dict()
+
+    def test_resume_matches_uninterrupted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ckpt")
+            for scheduler_type in SchedulerType:
+                for event_driven in (False, True):
+                    for kind in ("list", "table", "stream"):
+                        with self.subTest(scheduler_type=scheduler_type, event_driven=event_driven, kind=kind):
+                            # 체크포인트를 켜면 바로 계산(closed_form) 대신 시뮬레이션을 사용하므로 기준도 같게 맞춤
+                            expected = self.new_app(scheduler_type, event_driven, kind, Checkpointer(os.path.join(directory, "unused.ckpt"), every_steps=10 ** 9))
+                            expected.run()
+                            interrupted = self.new_app(scheduler_type, event_driven, kind, self.InterruptingCheckpointer(path, every_steps=23))
+                            with self.assertRaises(self.Interrupt):
+                                interrupted.run()
+                            resumed = self.new_app(scheduler_type, event_driven, kind, None)
+                            resumed.resume(path)
+                            self.assertEqual(self.result(expected), self.result(resumed))
+
+    def test_mismatched_configuration(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ckpt")
+            app = self.new_app(SchedulerType.RR, True, "list", Checkpointer(path, every_time=50))
+            app.run()
+            self.assertGreater(app.checkpoint.saved, 0)
+            with self.assertRaises(ValueError):
+                self.new_app(SchedulerType.SRTN, True, "list", None).resume(path)
+
+
+class TestRunQueues(unittest.TestCase):
+    """프로세서별 대기 큐(멀티 큐 모드) 테스트"""
+    workload = generate_workload(1500, "PE" * 4, utilization=0.9, arrival="bursty", seed=3)
+
+    def new_app(self, scheduler_type, event_driven, processors, multi_queue=True, checkpoint=None):
+        return new_app(scheduler_type, self.workload, ("EP" * processors)[:processors], event_driven=event_driven,
+                       multi_queue=multi_queue, stats=SimulationStats(), checkpoint=checkpoint)
+
+    def result(self, app):
+        """공통 결과에 할당 횟수와 프로세스를 옮긴 횟수를 더함"""
+        scheduler = app.scheduler
+        return result(scheduler), dispatches(scheduler), scheduler.ready_queue.migrations if scheduler.multi_queue else None
+
+    def test_single_processor_matches_shared_queue(self):
+        for scheduler_type in SchedulerType:
+            with self.subTest(scheduler_type=scheduler_type):
+                multi = self.new_app(scheduler_type, True, 1)
+                multi.run()
+                shared = self.new_app(scheduler_type, True, 1, multi_queue=False)
+                shared.run()
+                self.assertEqual(self.result(multi)[:2], self.result(shared)[:2])
+                self.assertEqual(multi.scheduler.ready_queue.migration_count, 0)
+
+    def test_work_stealing(self):
+        for scheduler_type in SchedulerType:
+            with self.subTest(scheduler_type=scheduler_type):
+                tick = self.new_app(scheduler_type, False, 8)
+                tick.run()
+                event = self.new_app(scheduler_type, True, 8)
+                event.run()
+                self.assertEqual(self.result(tick), self.result(event))
+                run_queues = tick.scheduler.ready_queue
+                self.assertEqual(len(run_queues), 0)
+                self.assertEqual(run_queues.location, {})
+                self.assertTrue(all(p.is_completed() for p in tick.scheduler.get_process()))
+                self.assertGreater(run_queues.migration_count, 0)
+                self.assertEqual(sum(run_queues.migrations.values()), run_queues.migration_count)
+                self.assertEqual(sum(run_queues.steals), run_queues.migration_count)
+                self.assertEqual(tick.stats.counters["migrations"], run_queues.migration_count)
+
+    def test_remove_after_steal(self):
+        run_queues = RunQueues(FIFOReadyQueue, 2, busy=lambda order: False)
+        processes = [Process(pid=pid, arrival=0, burst=3) for pid in range(1, 5)]
+        run_queues.select(0)
+        for process in processes:
+            run_queues.push(process)
+        run_queues.select(None)
+        stolen = run_queues.steal(1)
+        self.assertEqual(run_queues.location[stolen.pid], 1)
+        run_queues.remove(stolen)
+        run_queues.remove(processes[1])
+        self.assertEqual(len(run_queues), 2)
+        self.assertEqual([len(queue) for queue in run_queues.queues], [2, 0])
+        self.assertEqual(set(run_queues.location), {3, 4})
+
+    def test_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ckpt")
+            for scheduler_type in SchedulerType:
+                with self.subTest(scheduler_type=scheduler_type):
+                    expected = self.new_app(scheduler_type, True, 8)
+                    expected.run()
+                    interrupted = self.new_app(scheduler_type, True, 8, checkpoint=TestCheckpoint.InterruptingCheckpointer(path, every_steps=97))
+                    with self.assertRaises(TestCheckpoint.Interrupt):
+                        interrupted.run()
+                    resumed = self.new_app(scheduler_type, True, 8)
+                    resumed.resume(path)
+                    self.assertEqual(self.result(expected), self.result(resumed))
+                    with self.assertRaises(ValueError):
+                        self.new_app(scheduler_type, True, 8, multi_queue=False).resume(path)
+
+
+class TestResponseRatioReadyQueue(unittest.TestCase):
+    """토너먼트 트리로 고른 프로세스가 모든 프로세스의 우선순위를 비교해 고른 것과 같은지 테스트"""
+    def test_matches_full_scan(self):
+        rng = random.Random(7)
+        clock = WaitClock()
+        queue = ResponseRatioReadyQueue(ratio=lambda p: (p.wait_time + p.burst) / p.burst, clock=lambda: clock.time)
+        pid = 0
+        full_scan = 0                               # 그룹 대표를 모두 비교했을 때의 비교 횟수
+        for _ in range(1500):
+            clock.time += rng.choice((0, 0, 1, 1, 2, 7))
+            for _ in range(rng.choice((0, 1, 1, 2, 5))):
+                pid += 1
+                process = Process(pid=pid, arrival=clock.time - rng.randrange(3), burst=int(rng.paretovariate(1.2)))
+                process.clock = clock
+                queue.push(process)
+            for _ in range(rng.choice((0, 1, 1, 2))):
+                if not queue:
+                    break
+                if rng.random() < 0.1:
+                    queue.remove(rng.choice(list(queue)))
+                    continue
+                sorted_sequence = queue.sorted_sequence(clock.time)
+                expected = max(queue, key=lambda p: queue.priority(p, sorted_sequence))
+                full_scan += len(queue.groups)
+                self.assertIs(queue.pop(), expected)
+        self.assertLess(queue.scanned, full_scan / 2)
+
+
+class TestProcessTable(unittest.TestCase):
+    def test_same_results_as_process_list(self):
+        for scheduler_type in SchedulerType:
+            results = []
+            for columnar in (False, True):
+                app = SchedulerApp(scheduler_type=scheduler_type, columnar=columnar)
+                for pid, arrival, burst in [(1, 0, 3), (2, 1, 7), (3, 3, 2), (4, 5, 5), (5, 6, 3)]:
+                    app.add_process(pid=pid, arrival=arrival, burst=burst)
+                app.add_processor(id=1, type="E", time_quantum=2 if scheduler_type == SchedulerType.RR else None)
+                app.add_processor(id=2, type="P", time_quantum=2 if scheduler_type == SchedulerType.RR else None)
+                app.run()
+                results.append([(p.pid, p.start_time, p.wait_time, p.turnaround_time, p.normalized_turnaround_time) for p in app.scheduler.get_process()])
+            with self.subTest(scheduler_type=scheduler_type):
+                self.assertIsInstance(app.processes, ProcessTable)
+                self.assertEqual(results[0], results[1])
+
+
+class TestTimeline(unittest.TestCase):
+    def test_segments(self):
+        timeline = Timeline()
+        for pid in [1, 1, 1, 0, 2, 2]:
+            timeline.record(pid)
+        timeline.record(2, 1000000)
+
+        self.assertEqual(list(timeline.segments()), [(1, 0, 3), (0, 3, 4), (2, 4, 1000006)])
+        self.assertEqual([timeline.pid_at(t) for t in (0, 2, 3, 4, 999999, 1000006)], [1, 1, 0, 2, 2, 0])
+        self.assertEqual(len(timeline), 1000006)
+
+    def test_bounded_history(self):
+        rng = random.Random(3)
+        full = Timeline()
+        bounded = BoundedTimeline(max_segments=64, max_bins=32, bin_ticks=4)
+        for _ in range(20000):
+            pid, ticks = rng.choice([0, 1, 2, 3]), rng.randint(1, 50)
+            full.record(pid, ticks)
+            bounded.record(pid, ticks)
+            self.assertLessEqual(len(bounded.pids), 2 * 64)
+            self.assertLessEqual(len(bounded.bin_pids), 32)
+
+        detail_start = bounded.detail_start
+        self.assertEqual(list(bounded.segments()), [s for s in full.segments() if s[1] >= detail_start])
+        self.assertEqual(len(list(bounded.segments())), 64)
+        bins = list(bounded.bins())
+        self.assertEqual((bins[0][0], bins[-1][1]), (0, detail_start))
+        busy = sum(b[4] for b in bins) + sum(end - start for pid, start, end in bounded.segments() if pid != 0)
+        self.assertEqual(busy, full.busy)
+        self.assertEqual(list(bounded.segments(full.end - 1, full.end)), list(full.segments())[-1:])
+
+
+class TestTraceSink(unittest.TestCase):
+    def test_jsonl(self):
+        stream = io.StringIO()
+        app = SchedulerApp(scheduler_type=SchedulerType.FCFS, trace=JSONLTraceSink(stream, buffer_size=4))
+        app.add_process(pid=1, arrival=0, burst=3)
+        app.add_process(pid=2, arrival=1, burst=2)
+        app.add_processor(id=1, type="E")
+        app.run()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["time"] for r in records if r["type"] == "state"], [0, 1, 2, 3, 4, 5])
+        self.assertEqual(records[1]["ready_queue"], [2])
+        self.assertEqual(records[-1]["type"], "summary")
+        self.assertEqual([p["turnaround"] for p in records[-1]["processes"]], [3, 4])
+
+
+
+class TestReplay(unittest.TestCase):
+    """백그라운드에서 기록한 프레임을 재생한 상태가 한 단계씩 실행한 상태와 같은지 테스트"""
+    def new_app(self, scheduler_type, trace=None):
+        app = new_app(scheduler_type, trace=trace)
+        app.select_scheduler()
+        return app
+
+    def test_matches_step_by_step(self):
+        for scheduler_type in SchedulerType:
+            with self.subTest(scheduler_type=scheduler_type):
+                recorder = RecordingTraceSink()
+                recorded = self.new_app(scheduler_type, recorder)
+                replay = Replay(recorded.scheduler.processes, recorder)
+                worker = threading.Thread(target=recorded.run_scheduler)
+                worker.start()
+                worker.join()
+                recorded.print_results()
+                self.assertFalse(replay.finished)
+
+                scheduler = self.new_app(scheduler_type).scheduler
+                while scheduler.has_next(): # 기존 GUI의 한 단계 실행과 같은 순서
+                    scheduler.update_ready_queue()
+                    scheduler.schedule()
+                    scheduler.assign_process()
+                    scheduler.power_off_idle_processors()
+                    scheduler.process_waiting_time_update()
+                    before = {p.pid: (p.remaining_time, p.start_time, p.wait_time, p.turnaround_time) for p in replay.processes.values()}
+                    changed = replay.step()
+                    self.assertIsNotNone(changed)
+                    # 상태가 바뀐 프로세스와 대기 중인 프로세스만 다시 그리면 됨
+                    dirty = {p.pid for p in changed} | set(replay.waiting)
+                    for p in replay.processes.values():
+                        if p.pid not in dirty:
+                            self.assertEqual(before[p.pid], (p.remaining_time, p.start_time, p.wait_time, p.turnaround_time))
+                    self.assertEqual(replay.current_time, scheduler.current_time)
+                    self.assertEqual(replay.power, scheduler.calculate_total_power())
+                    self.assertEqual(replay.processor_pids, [(p.id, p.timeline.pid_at(scheduler.current_time - 1)) for p in scheduler.processors_info])
+                    self.assertEqual(sorted((p.pid, p.remaining_time, p.start_time, p.wait_time, p.turnaround_time) for p in replay.processes.values()),
+                                     sorted((p.pid, p.remaining_time, p.start_time, p.wait_time, p.turnaround_time) for p in scheduler.processes))
+                    scheduler.update_current_time()
+                self.assertTrue(replay.finished)
+                self.assertIsNone(replay.step())
+                self.assertEqual(len(recorder.frames), 0) # 적용한 프레임은 남지 않음
+
+    def start_worker(self, app, recorder):
+        """GUI처럼 백그라운드에서 실행 (취소되면 기록 종료만 표시)"""
+        def run():
+            try:
+                app.run_scheduler()
+            except SimulationCancelled:
+                recorder.finish()
+                return
+            app.print_results()
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        return worker
+
+    def large_app(self, recorder):
+        app = SchedulerApp(scheduler_type=SchedulerType.RR, trace=recorder)
+        app.load_workload(generate_workload(3000, "PPEE", utilization=0.9, seed=5))
+        for id, type in enumerate("PPEE", start=1):
+            app.add_processor(id=id, type=type, time_quantum=4)
+        app.select_scheduler()
+        return app
+
+    def test_bounded_buffer(self):
+        recorder = RecordingTraceSink(max_pending=16)
+        app = self.large_app(recorder)
+        replay = Replay(app.scheduler.processes, recorder)
+        worker = self.start_worker(app, recorder)
+        while not replay.finished:
+            self.assertLessEqual(len(recorder.frames), 16)
+            replay.step()
+        worker.join()
+        self.assertEqual(len(recorder.frames), 0)
+        self.assertLess(recorder.recorded, replay.current_time) # 할당이 바뀐 tick만 기록
+        self.assertEqual(sorted((p.pid, p.start_time, p.wait_time, p.turnaround_time) for p in replay.processes.values()),
+                         sorted((p.pid, p.start_time, p.wait_time, p.turnaround_time) for p in app.scheduler.processes))
+        self.assertEqual(replay.power, app.scheduler.calculate_total_power())
+
+    def test_cancel(self):
+        recorder = RecordingTraceSink(max_pending=4)
+        app = self.large_app(recorder)
+        worker = self.start_worker(app, recorder)
+        while len(recorder.frames) < 4: # 꺼내 가지 않으면 시뮬레이션이 기다림
+            worker.join(0.01)
+        recorder.cancel()
+        worker.join(5)
+        self.assertFalse(worker.is_alive())
+        self.assertTrue(recorder.finished)
+        self.assertTrue(app.scheduler.has_next())
+
+
 if __name__ == '__main__':
     choice = input("실행할 스케줄러 입력 (fcfs, rr,rr3, spn, hrrn, srtn, all): ").strip().lower()
     
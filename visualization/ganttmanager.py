@@ -1,77 +1,389 @@
+from collections import deque
+from core.timeline import BoundedTimeline
 import random
 
+# 확대 단계 (1 tick당 픽셀 수, 1보다 작으면 한 픽셀에 여러 tick을 모아서 표시)
+ZOOM_LEVELS = (40, 25, 10, 5, 2, 1, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005, 0.002, 0.001)
+# 모아서 표시할 때 실행 비율별 음영 (비율이 낮을수록 옅게)
+UTILIZATION_STIPPLES = ((0.75, ""), (0.5, "gray75"), (0.25, "gray50"), (0.0, "gray25"))
+MAX_VISIBLE_ROWS = 8  # 한 번에 그리는 프로세서 행 수 (넘으면 세로 스크롤)
+
+
 class GanttManager:
+    """
+    간트 차트 (보이는 시간 구간만 그림)
+    - 프로세서별 실행 기록은 BoundedTimeline(최근 구간 + 오래된 구간은 고정 폭 묶음)에 보관하고, 스크롤, 확대하면 보이는 구간만 다시 그림
+    - 끝 부분을 따라가는 동안 새 프레임은 이어 그림 (같은 PID가 이어지면 마지막 사각형을 늘리고, PID가 바뀔 때만 새로 그림)
+      → 기록 메모리와 다시 그리는 작업량, 캔버스 도형 수는 화면 너비와 보이는 행 수에 비례하고 실행 길이, 전체 프로세서 수와 무관
+    - 묶음으로 줄어든 오래된 구간은 묶음마다 가장 오래 실행한 PID의 색으로, 실행 비율에 따라 음영을 넣어 표시
+    - 1 tick이 1픽셀보다 작으면 픽셀마다 가장 오래 실행한 PID의 색으로, 실행 비율에 따라 음영을 넣어 표시
+    """
     def __init__(self, app):
         self.app = app
-        
-    def update_gantt_chart_live(self, processors: list, current_time: int):
-        app = self.app
+        self.timelines = {}                         # 프로세서 ID -> 실행 기록
+        self.end = 0                                # 기록된 마지막 시간
+        self.view_start = 0.0                       # 화면 왼쪽 끝 시간
+        self.row_start = 0                          # 화면 맨 위 행 (processor_data 위치)
+        self.follow = True                          # True면 새 프레임이 오면 끝 부분을 따라감
+        self.open_segments = {}                     # 프로세서 ID -> 지금 늘려 가는 실행 구간 (create_segment 참고)
+        self.drawn_segments = {}                    # 프로세서 ID -> 그려 둔 구간 (시간 순서, 화면 왼쪽으로 밀려나면 지움)
+        self.drawn_layout = None                    # 이어 그릴 수 있는 화면 배치 (None이면 다음에 전부 다시 그림)
+        self.drawn_view_start = 0.0                 # 마지막으로 그린 화면 왼쪽 끝 시간
+        self.drawn_end = 0                          # 마지막으로 그린 기록 끝 시간
+        self.zoom_index = ZOOM_LEVELS.index(app.gantt_time_scale) if app.gantt_time_scale in ZOOM_LEVELS else 1
+
+    def update_gantt_chart_live(self, processor_pids: list, current_time: int):
+        """processor_pids: (프로세서 ID, current_time - 1 ~ current_time 동안 실행한 PID) 목록"""
+        self.record(processor_pids, current_time)
+        self.refresh()
+
+    def record(self, processor_pids: list, current_time: int):
+        """프레임 하나를 실행 기록에 추가 (그리지는 않음, 여러 프레임을 모아서 그릴 때 사용)"""
         if current_time == 0:
             return
         time_step = current_time - 1
-        num_processors = len(app.processor_data)
-        required_canvas_height = app.gantt_header_height + (num_processors * (app.gantt_row_height + app.gantt_padding)) + app.gantt_padding
-        if num_processors == 0:
-            required_canvas_height = app.gantt_header_height + 30
-        if abs(app.gantt_canvas.winfo_reqheight() - required_canvas_height) > 1:
-            app.gantt_canvas.config(height=required_canvas_height)
-        required_total_width = app.gantt_label_width + (current_time * app.gantt_time_scale) + app.gantt_padding
-        current_scroll_region = app.gantt_canvas.cget("scrollregion")
-        if current_scroll_region:
-            try:
-                _, _, current_scroll_width, current_scroll_height = map(int, current_scroll_region.split())
-            except ValueError:
-                current_scroll_width = app.gantt_label_width + 800
-                current_scroll_height = required_canvas_height
-        else:
-            current_scroll_width = app.gantt_label_width + 800
-            current_scroll_height = required_canvas_height
-        current_canvas_height = required_canvas_height
-        width_changed = False
-        if required_total_width > current_scroll_width:
-            new_scroll_width = required_total_width + 200
-            app.gantt_canvas.configure(scrollregion=(0, 0, new_scroll_width, current_canvas_height))
-            start_t = int((current_scroll_width - app.gantt_label_width) / app.gantt_time_scale)
-            end_t = int((new_scroll_width - app.gantt_label_width) / app.gantt_time_scale) + 1
-            time_axis_y = app.gantt_padding + app.gantt_header_height / 2
-            grid_line_top = app.gantt_padding
-            grid_line_bottom = current_canvas_height - app.gantt_padding
-            for t in range(start_t, end_t):
-                x = app.gantt_label_width + (t * app.gantt_time_scale)
-                app.gantt_canvas.create_line(x, grid_line_top, x, grid_line_bottom, fill="lightgrey", dash=(2,2), tags="time_grid")
-                if t % 5 == 0:
-                    app.gantt_canvas.create_text(x, time_axis_y, text=str(t), anchor="center", tags="time_label")
-            current_scroll_width = new_scroll_width
-            width_changed = True
-        height_changed = False
-        if abs(current_scroll_height - current_canvas_height) > 1:
-            app.gantt_canvas.configure(scrollregion=(0, 0, current_scroll_width, current_canvas_height))
-            height_changed = True
-        visible_width = app.gantt_canvas.winfo_width()
-        target_x_pos = app.gantt_label_width + (current_time * app.gantt_time_scale)
-        if (width_changed or height_changed or (target_x_pos > visible_width + app.gantt_canvas.xview()[0] * current_scroll_width)) and current_scroll_width > 0:
-            scroll_fraction = (target_x_pos - visible_width + 50) / current_scroll_width
-            app.gantt_canvas.xview_moveto(min(max(0, scroll_fraction), 1.0))
-        for i, processor in enumerate(processors):
-            try:
-                gui_proc_index = next(idx for idx, data in enumerate(app.processor_data) if data['id'] == processor.id)
-            except StopIteration:
+        for processor_id, pid in processor_pids:
+            timeline = self.timelines.get(processor_id)
+            if timeline is None:
+                timeline = self.timelines[processor_id] = BoundedTimeline()
+            if timeline.end < time_step:
+                timeline.record(0, time_step - timeline.end)
+            if timeline.end == time_step:
+                timeline.record(pid)
+        self.end = max(self.end, current_time)
+
+    # 화면 계산
+    def chart_width(self):
+        """시간 축을 그릴 수 있는 폭 (픽셀)"""
+        app = self.app
+        width = app.gantt_canvas.winfo_width()
+        if width <= 1: # 아직 화면에 배치되기 전
+            width = app.gantt_label_width + 800 + app.gantt_padding
+        return max(1, width - app.gantt_label_width - app.gantt_padding)
+
+    def visible_ticks(self):
+        return self.chart_width() / self.app.gantt_time_scale
+
+    def total_ticks(self):
+        """스크롤 범위 (끝 부분 오른쪽에 50픽셀 여유)"""
+        return max(self.end + 50 / self.app.gantt_time_scale, self.visible_ticks())
+
+    def max_view_start(self):
+        return self.total_ticks() - self.visible_ticks()
+
+    def time_to_x(self, time):
+        app = self.app
+        return app.gantt_label_width + (time - self.view_start) * app.gantt_time_scale
+
+    def row_top(self, row):
+        app = self.app
+        return app.gantt_padding + app.gantt_header_height + row * (app.gantt_row_height + app.gantt_padding)
+
+    def grid_step(self):
+        """격자선 간격 (20픽셀 이상이 되는 가장 작은 1, 2, 5 x 10^k tick)"""
+        step = 1
+        while True:
+            for multiplier in (1, 2, 5):
+                if step * multiplier * self.app.gantt_time_scale >= 20:
+                    return step * multiplier
+            step *= 10
+
+    def visible_rows(self):
+        """화면에 그릴 (행 위치, 프로세서 정보) 목록"""
+        rows = self.app.processor_data[self.row_start:self.row_start + MAX_VISIBLE_ROWS]
+        return list(enumerate(rows))
+
+    # 스크롤, 확대
+    def on_scroll(self, *args):
+        """가로 스크롤바 명령 ("moveto", 비율) 또는 ("scroll", 개수, "units"/"pages")"""
+        visible = self.visible_ticks()
+        if args[0] == "moveto":
+            self.view_start = float(args[1]) * self.total_ticks()
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else max(1.0, visible / 10)
+            self.view_start += int(args[1]) * step
+        self.view_start = min(max(0.0, self.view_start), self.max_view_start())
+        self.follow = self.view_start >= self.max_view_start()
+        self.refresh()
+
+    def on_vscroll(self, *args):
+        """세로 스크롤바 명령 (프로세서 행 단위)"""
+        total = len(self.app.processor_data)
+        if args[0] == "moveto":
+            self.row_start = round(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = MAX_VISIBLE_ROWS if args[2] == "pages" else 1
+            self.row_start += int(args[1]) * step
+        self.row_start = min(max(0, self.row_start), max(0, total - MAX_VISIBLE_ROWS))
+        self.refresh()
+
+    def zoom(self, direction):
+        """direction: 1이면 확대, -1이면 축소 (화면 가운데 시간 유지)"""
+        index = self.zoom_index - direction
+        if not 0 <= index < len(ZOOM_LEVELS):
+            return
+        center = self.view_start + self.visible_ticks() / 2
+        self.zoom_index = index
+        self.app.gantt_time_scale = ZOOM_LEVELS[index]
+        self.view_start = min(max(0.0, center - self.visible_ticks() / 2), self.max_view_start())
+        self.refresh()
+
+    def zoom_in(self):
+        self.zoom(1)
+
+    def zoom_out(self):
+        self.zoom(-1)
+
+    def zoom_text(self):
+        scale = self.app.gantt_time_scale
+        return f"{scale:g} px/tick" if scale >= 1 else f"{1 / scale:g} tick/px"
+
+    # 그리기
+    def refresh(self, event=None):
+        """
+        보이는 시간 구간을 그림
+        - 끝 부분을 따라가는 중이고 배율, 행, 화면 너비가 지난번과 같으면 extend_drawing()으로 새 프레임만 이어 그림
+        - 그 밖에는 redraw()로 보이는 구간만 전부 다시 그림
+        """
+        app = self.app
+        if self.follow:
+            self.view_start = self.max_view_start()
+        total_rows = len(app.processor_data)
+        self.row_start = min(self.row_start, max(0, total_rows - MAX_VISIBLE_ROWS))
+        rows = self.visible_rows()
+        view_end = self.view_start + self.visible_ticks()
+        if not self.extend_drawing(rows, view_end):
+            self.redraw(rows, view_end)
+        if hasattr(app, 'gantt_hbar'):
+            total = self.total_ticks()
+            app.gantt_hbar.set(self.view_start / total, min(1.0, view_end / total))
+        if hasattr(app, 'gantt_vbar'):
+            if total_rows:
+                app.gantt_vbar.set(self.row_start / total_rows, (self.row_start + len(rows)) / total_rows)
+            else:
+                app.gantt_vbar.set(0.0, 1.0)
+        if hasattr(app, 'gantt_zoom_var'):
+            app.gantt_zoom_var.set(self.zoom_text())
+
+    def layout_key(self, rows):
+        """이어 그릴 수 있는지 확인할 화면 배치 (배율, 보이는 프로세서, 화면 너비)"""
+        return self.app.gantt_time_scale, tuple(processor_info['id'] for _, processor_info in rows), self.chart_width()
+
+    def redraw(self, rows, view_end):
+        """캔버스를 비우고 보이는 구간만 다시 그림 (1 tick이 1픽셀 이상이고 끝 부분을 따라가는 중이면 이어 그릴 준비)"""
+        app = self.app
+        canvas = app.gantt_canvas
+        canvas.delete("all")
+        self.open_segments.clear()
+        self.drawn_segments.clear()
+        canvas_height = self.canvas_height(rows)
+        if abs(canvas.winfo_reqheight() - canvas_height) > 1:
+            canvas.config(height=canvas_height)
+        self.draw_time_grid(view_end, canvas_height)
+        for row, processor_info in rows:
+            timeline = self.timelines.get(processor_info['id'])
+            if timeline is None:
+                continue
+            if app.gantt_time_scale >= 1:
+                self.draw_segments(processor_info['id'], timeline, row, view_end)
+            else:
+                self.draw_aggregated(timeline, row, view_end)
+        self.draw_processor_labels(rows, canvas_height)
+        self.drawn_layout = self.layout_key(rows) if self.follow and app.gantt_time_scale >= 1 else None
+        self.drawn_view_start = self.view_start
+        self.drawn_end = self.end
+
+    def extend_drawing(self, rows, view_end):
+        """
+        지난번에 그린 뒤 추가된 프레임만 이어 그림 (이어 그릴 수 없으면 False)
+        - 그려 둔 도형은 화면이 밀린 만큼 옮기고, 같은 PID가 이어서 실행되면 extend_segment로 사각형만 늘림
+        - PID가 바뀐 구간만 create_segment로 새로 그리고, 화면 왼쪽으로 밀려난 도형은 지움
+          → 프레임마다 작업량은 새 구간 수와 격자선 수에 비례
+        """
+        app = self.app
+        canvas = app.gantt_canvas
+        if (self.drawn_layout is None or not self.follow or self.layout_key(rows) != self.drawn_layout
+                or not 0 <= self.end - self.drawn_end <= self.visible_ticks()):
+            return False
+        for _, processor_info in rows:
+            timeline = self.timelines.get(processor_info['id'])
+            if timeline is not None and timeline.detail_start > self.drawn_end:
+                return False # 그린 뒤에 묶음으로 옮겨진 구간이 있음
+        shift = (self.drawn_view_start - self.view_start) * app.gantt_time_scale
+        canvas.move("block", shift, 0)
+        canvas.move("block_text", shift, 0)
+        canvas.delete("time_grid", "time_label")
+        self.draw_time_grid(view_end, self.canvas_height(rows))
+        canvas.tag_lower("time_label")
+        canvas.tag_lower("time_grid")
+        for row, processor_info in rows:
+            processor_id = processor_info['id']
+            timeline = self.timelines.get(processor_id)
+            if timeline is None:
                 continue
-            y_top = app.gantt_padding + app.gantt_header_height + gui_proc_index * (app.gantt_row_height + app.gantt_padding)
-            y_bottom = y_top + app.gantt_row_height
-            pid_at_step = 0
-            if time_step < len(processor.process_queue):
-                pid_at_step = processor.process_queue[time_step] if processor.process_queue[time_step] is not None else 0
-            pid = pid_at_step
-            x_start = app.gantt_label_width + time_step * app.gantt_time_scale
-            x_end = x_start + app.gantt_time_scale
-            color = self.generate_color(pid)
-            tag_name = f"t{time_step}_p{processor.id}"
+            y_top = self.row_top(row)
+            segment = self.open_segments.pop(processor_id, None)
+            drawn = self.drawn_segments.setdefault(processor_id, deque())
+            for pid, start, end in timeline.segments(self.drawn_end, view_end):
+                if pid == 0:
+                    continue
+                if segment is not None and segment[0] == pid and segment[1] == start:
+                    self.extend_segment(segment, end, y_top)
+                else:
+                    segment = self.create_segment(pid, start, end, y_top)
+                    drawn.append(segment)
+            if segment is not None and segment[2] == timeline.end:
+                self.open_segments[processor_id] = segment
+            while drawn and drawn[0][2] <= self.view_start:
+                for item in drawn.popleft()[3:]:
+                    if item is not None:
+                        canvas.delete(item)
+        canvas.tag_raise("proc_label")
+        self.drawn_view_start = self.view_start
+        self.drawn_end = self.end
+        return True
+
+    def canvas_height(self, rows):
+        app = self.app
+        if not rows:
+            return app.gantt_header_height + 30
+        return app.gantt_header_height + (len(rows) * (app.gantt_row_height + app.gantt_padding)) + app.gantt_padding
+
+    def draw_time_grid(self, view_end, canvas_height):
+        """격자선과 5칸마다 시간 표시"""
+        app = self.app
+        canvas = app.gantt_canvas
+        step = self.grid_step()
+        time_axis_y = app.gantt_padding + app.gantt_header_height / 2
+        grid_line_top = app.gantt_padding
+        grid_line_bottom = canvas_height - app.gantt_padding
+        t = -(-int(self.view_start) // step) * step # view_start 이상인 첫 격자
+        while t <= view_end:
+            x = self.time_to_x(t)
+            canvas.create_line(x, grid_line_top, x, grid_line_bottom, fill="lightgrey", dash=(2,2), tags="time_grid")
+            if (t // step) % 5 == 0:
+                canvas.create_text(x, time_axis_y, text=str(t), anchor="center", tags="time_label")
+            t += step
+
+    def draw_segments(self, processor_id, timeline, row, view_end):
+        """1 tick이 1픽셀 이상이면 실행 구간마다 사각형 하나 (넓으면 가운데에 PID), 묶음으로 줄어든 구간은 묶음마다 사각형 하나"""
+        y_top = self.row_top(row)
+        drawn = self.drawn_segments[processor_id] = deque()
+        for start, end, pid, pid_ticks, busy in timeline.bins(self.view_start, view_end):
+            if pid != 0:
+                drawn.append(self.create_segment(pid, start, end, y_top, self.column_style(pid, busy / (end - start))[1]))
+        segment = None
+        for pid, start, end in timeline.segments(self.view_start, view_end):
+            if pid != 0:
+                segment = self.create_segment(pid, start, end, y_top)
+                drawn.append(segment)
+        if segment is not None and segment[2] == timeline.end:
+            self.open_segments[processor_id] = segment
+
+    def create_segment(self, pid, start, end, y_top, stipple=None):
+        """
+        start ~ end 실행 구간을 사각형으로 그림 (같은 PID가 이어서 실행되면 extend_segment로 늘림)
+        - stipple이 있으면 묶음 (테두리, PID 없이 음영)
+        - 반환값: [PID, 시작 시간, 끝 시간, 사각형 ID, 글자 ID]
+        """
+        app = self.app
+        canvas = app.gantt_canvas
+        x_start = self.time_to_x(max(start, self.view_start))
+        x_end = self.time_to_x(end)
+        color = self.generate_color(pid)
+        if stipple is not None:
+            rect = canvas.create_rectangle(x_start, y_top + 1, x_end, y_top + app.gantt_row_height - 1, fill=color, outline="", stipple=stipple, tags="block")
+            return [pid, start, end, rect, None]
+        rect = canvas.create_rectangle(x_start, y_top + 1, x_end, y_top + app.gantt_row_height - 1, fill=color, outline="black", width=1, tags="block")
+        segment = [pid, start, end, rect, None]
+        self.update_segment_text(segment, x_start, x_end, y_top)
+        return segment
+
+    def extend_segment(self, segment, end, y_top):
+        """실행 구간을 end까지 늘림 (새 도형을 만들지 않고 좌표만 바꿈, PID는 보이는 부분 가운데에 표시)"""
+        canvas = self.app.gantt_canvas
+        segment[2] = end
+        x_end = self.time_to_x(end)
+        x1, y1, _, y2 = canvas.coords(segment[3])
+        canvas.coords(segment[3], x1, y1, x_end, y2)
+        self.update_segment_text(segment, self.time_to_x(max(segment[1], self.view_start)), x_end, y_top)
+
+    def update_segment_text(self, segment, x_start, x_end, y_top):
+        """구간이 18픽셀보다 넓으면 가운데에 PID 표시 (처음 넓어질 때 글자를 만들고, 이후에는 옮기기만 함)"""
+        app = self.app
+        canvas = app.gantt_canvas
+        if x_end - x_start <= 18:
+            return
+        x_center, y_center = (x_start + x_end) / 2, y_top + app.gantt_row_height / 2
+        if segment[4] is not None:
+            canvas.coords(segment[4], x_center, y_center)
+            return
+        color = self.generate_color(segment[0])
+        text_color = "white" if sum(int(color[i:i+2], 16) for i in (1,3,5)) < 384 else "black"
+        segment[4] = canvas.create_text(x_center, y_center, text=str(segment[0]), fill=text_color, font=('Arial', 8, 'bold'), tags="block_text")
+
+    def draw_aggregated(self, timeline, row, view_end):
+        """
+        1 tick이 1픽셀보다 작으면 픽셀마다 가장 오래 실행한 PID와 실행 비율을 구해,
+        같은 (PID, 음영)이 이어지는 픽셀끼리 사각형 하나로 그림
+        - 묶음은 픽셀과 겹치는 비율만큼 실행 시간을 나눠 더함
+        """
+        app = self.app
+        canvas = app.gantt_canvas
+        scale = app.gantt_time_scale
+        columns = int(self.chart_width()) + 1
+        dominant = [0] * columns                    # 픽셀별 가장 오래 실행한 PID
+        dominant_ticks = [0.0] * columns
+        busy = [0.0] * columns                      # 픽셀별 실행 시간
+        pieces = [(start, end, pid, pid_ticks / (end - start), total / (end - start))
+                  for start, end, pid, pid_ticks, total in timeline.bins(self.view_start, view_end)]
+        pieces += [(start, end, pid, 1.0, 1.0) for pid, start, end in timeline.segments(self.view_start, view_end)]
+        for start, end, pid, pid_ratio, busy_ratio in pieces:
+            start = max(start, self.view_start)
+            end = min(end, view_end)
+            if pid == 0 or end <= start:
+                continue
+            first = int((start - self.view_start) * scale)
+            last = min(int((end - self.view_start) * scale), columns - 1)
+            for column in range(first, last + 1):
+                column_start = self.view_start + column / scale
+                ticks = min(end, column_start + 1 / scale) - max(start, column_start)
+                if ticks <= 0:
+                    continue
+                busy[column] += ticks * busy_ratio
+                if ticks * pid_ratio > dominant_ticks[column]:
+                    dominant[column] = pid
+                    dominant_ticks[column] = ticks * pid_ratio
+
+        styles = [self.column_style(dominant[column], busy[column] * scale) for column in range(columns)]
+        y_top = self.row_top(row)
+        y_bottom = y_top + app.gantt_row_height
+        run_start = 0
+        for column in range(1, columns + 1):
+            if column < columns and styles[column] == styles[run_start]:
+                continue
+            pid, stipple = styles[run_start]
             if pid != 0:
-                app.gantt_canvas.create_rectangle(x_start, y_top + 1, x_end, y_bottom - 1, fill=color, outline="black", width=1, tags=(tag_name, "block"))
-                if app.gantt_time_scale > 18:
-                    text_color = "white" if sum(int(color[i:i+2], 16) for i in (1,3,5)) < 384 else "black"
-                    app.gantt_canvas.create_text(x_start + app.gantt_time_scale / 2, y_top + app.gantt_row_height / 2, text=str(pid), fill=text_color, font=('Arial', 8, 'bold'), tags=(tag_name, "block_text"))
+                canvas.create_rectangle(app.gantt_label_width + run_start, y_top + 1, app.gantt_label_width + column, y_bottom - 1,
+                                        fill=self.generate_color(pid), outline="", stipple=stipple, tags="block")
+            run_start = column
+
+    def column_style(self, pid, ratio):
+        """픽셀의 (PID, 실행 비율에 따른 음영)"""
+        for threshold, stipple in UTILIZATION_STIPPLES:
+            if ratio >= threshold:
+                return pid, stipple
+
+    def draw_processor_labels(self, rows, canvas_height):
+        """왼쪽 프로세서 이름 (스크롤해도 그대로)"""
+        app = self.app
+        canvas = app.gantt_canvas
+        canvas.create_rectangle(0, 0, app.gantt_label_width - 1, canvas_height, fill="white", outline="", tags="proc_label")
+        label_x_pos = app.gantt_label_width - 5
+        for i, processor_info in rows:
+            label_y_center = self.row_top(i) + app.gantt_row_height / 2
+            canvas.create_text(label_x_pos, label_y_center - 6, text=f"CPU {processor_info['id']}", anchor="e", tags="proc_label", font=('Arial', 9))
+            canvas.create_text(label_x_pos, label_y_center + 6, text=f"({processor_info['type']}-Core)", anchor="e", tags="proc_label", font=('Arial', 8))
 
     def generate_color(self, pid):
         app = self.app
@@ -88,30 +400,11 @@ class GanttManager:
 
     def draw_initial_gantt_layout(self):
         app = self.app
-        app.gantt_canvas.delete("all")
         app.process_colors.clear()
-        num_processors = len(app.processor_data)
-        canvas_height = app.gantt_header_height + (num_processors * (app.gantt_row_height + app.gantt_padding)) + app.gantt_padding
-        if num_processors == 0:
-            canvas_height = app.gantt_header_height + 30
-        app.gantt_canvas.config(height=canvas_height)
-        initial_drawing_width = 800
-        scroll_width = app.gantt_label_width + initial_drawing_width + app.gantt_padding
-        app.gantt_canvas.configure(scrollregion=(0, 0, scroll_width, canvas_height))
-        drawing_width_available = initial_drawing_width
-        max_initial_time = int(drawing_width_available / app.gantt_time_scale)
-        max_initial_time = max(0, max_initial_time)
-        time_axis_y = app.gantt_padding + app.gantt_header_height / 2
-        grid_line_top = app.gantt_padding
-        grid_line_bottom = canvas_height - app.gantt_padding
-        for t in range(max_initial_time + 1):
-            x = app.gantt_label_width + (t * app.gantt_time_scale)
-            app.gantt_canvas.create_line(x, grid_line_top, x, grid_line_bottom, fill="lightgrey", dash=(2,2), tags="time_grid")
-            if t % 5 == 0 or max_initial_time <= 20:
-                app.gantt_canvas.create_text(x, time_axis_y, text=str(t), anchor="center", tags="time_label")
-        label_x_pos = app.gantt_label_width - 5
-        for i, processor_info in enumerate(app.processor_data):
-            y_top = app.gantt_padding + app.gantt_header_height + i * (app.gantt_row_height + app.gantt_padding)
-            label_y_center = y_top + app.gantt_row_height / 2
-            app.gantt_canvas.create_text(label_x_pos, label_y_center - 6, text=f"CPU {processor_info['id']}", anchor="e", tags="proc_label", font=('Arial', 9))
-            app.gantt_canvas.create_text(label_x_pos, label_y_center + 6, text=f"({processor_info['type']}-Core)", anchor="e", tags="proc_label", font=('Arial', 8))
+        self.timelines.clear()
+        self.end = 0
+        self.view_start = 0.0
+        self.row_start = 0
+        self.follow = True
+        self.drawn_layout = None
+        self.refresh()
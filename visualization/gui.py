@@ -1,5 +1,4 @@
 import customtkinter as ctk
-from tkinter import messagebox
 import sys
 import os
 
@@ -9,13 +8,10 @@ sys.path.append(parent_dir)
 
 from simulator import SchedulerApp
 from visualization.widgetmanager import WidgetManager
-from visualization.inputmanager import InputManager
+from visualization.inputmanager import InputManager, MAX_PROCESSES, MAX_PROCESSORS
 from visualization.ganttmanager import GanttManager
 from visualization.simuationmanager import SimulationManager
 
-# 상수 정의
-MAX_PROCESSES = 15
-MAX_PROCESSORS = 4
 """ 
 pip install customtkinter 한후에 실행가능
 """
@@ -28,7 +24,9 @@ class SchedulerGUI(ctk.CTk):
         # 데이터 저장용 변수
         self.app = SchedulerApp()
         self.process_data = []
+        self.process_by_pid = {}                    # PID -> process_data 항목
         self.processor_data = []
+        self.results_processes = {}                 # PID -> 결과 테이블에 표시할 프로세스
         self.process_colors = {}
 
         # 시뮬레이션 상태 변수
@@ -78,20 +76,6 @@ class SchedulerGUI(ctk.CTk):
                     child.configure(text=new_text)
 
 
-        if self.simulation_running:
-            messagebox.showwarning("실행 중", "시뮬레이션 중에는 프로세서를 제거할 수 없습니다.")
-            return
-        selected_items = self.processor_tree.selection()
-        if not selected_items:
-            return
-        if messagebox.askyesno("삭제 확인", "선택된 프로세서를 삭제하시겠습니까?"):
-            ids_to_remove = [int(self.processor_tree.item(item, 'values')[0]) for item in selected_items]
-            self.processor_data = [p for p in self.processor_data if p['id'] not in ids_to_remove]
-            for item in selected_items:
-                self.processor_tree.delete(item)
-            self.gantt.draw_initial_gantt_layout()
-            self.update_list_counts()
-
     def update_speed(self, value):
         new_speed = int(float(value))
         speed_changed = new_speed != self.simulation_speed_ms
@@ -106,16 +90,23 @@ class SchedulerGUI(ctk.CTk):
         if self.current_after_id:
             self.after_cancel(self.current_after_id)
             self.current_after_id = None
+        self.simulation.cancel_render()
+        self.simulation.stop_worker()
         self.simulation_running = False
         self.simulation_paused = False
-        self.process_tree.delete(*self.process_tree.get_children())
-        self.processor_tree.delete(*self.processor_tree.get_children())
         self.process_data.clear()
+        self.process_by_pid.clear()
+        self.process_pager.clear()
+        self.processor_tree.delete(*self.processor_tree.get_children())
         self.processor_data.clear()
+        self.input.reset()
         self.arrival_entry.delete(0, "end")
         self.burst_entry.delete(0, "end")
         self.proc_type_var.set("P")
         self.rr_quantum_entry.delete(0, "end")
+        self.break_time_entry.delete(0, "end")
+        self.break_pid_entry.delete(0, "end")
+        self.fast_forward_var.set(False)
         self.scheduler_combo.set(self.scheduler_combo.cget("values")[0])
         self.widget.update_rr_quantum_visibility()
         self.speed_scale.set(300)
@@ -125,6 +116,7 @@ class SchedulerGUI(ctk.CTk):
         self.start_button.configure(text="Start", state="normal")
         self.pause_resume_button.configure(text="Pause", state="disabled")
         self.step_button.configure(state="disabled")
+        self.end_button.configure(state="disabled")
         self.widget.enable_inputs()
         self.app = SchedulerApp()
         self.process_colors.clear()
@@ -132,33 +124,42 @@ class SchedulerGUI(ctk.CTk):
     def clear_outputs(self):
         self.gantt_canvas.delete("all")
         self.gantt.draw_initial_gantt_layout()
-        self.results_tree.delete(*self.results_tree.get_children())
-        self.results_tree_items.clear()
+        self.results_processes.clear()
+        self.results_pager.clear()
         self.summary_label_vars["Total Power Used"].set("N/A")
         self.summary_label_vars["Current Time"].set("0")
 
     def prepare_results_table(self, initial_processes: list):
-        self.results_tree.delete(*self.results_tree.get_children())
-        self.results_tree_items.clear()
-        initial_processes.sort(key=lambda p: p.pid)
-        for p in initial_processes:
-            item_id = self.results_tree.insert("", "end", values=(p.pid, p.arrival, p.burst, p.remaining_time, "-", "-", "-", "-"))
-            self.results_tree_items[p.pid] = item_id
+        """결과 테이블에 보여줄 프로세스를 정함 (Treeview에는 현재 페이지의 행만 넣음)"""
+        self.results_processes = {p.pid: p for p in sorted(initial_processes, key=lambda p: p.pid)}
+        self.results_pager.page = 0
+        self.results_pager.set_keys(self.results_processes)
+
+    def process_row_values(self, pid):
+        data = self.process_by_pid[pid]
+        return (data['pid'], data['arrival'], data['burst'])
+
+    def result_row_values(self, pid):
+        p = self.results_processes[pid]
+        st = p.start_time if p.start_time is not None else "-"
+        wt = p.wait_time
+        tt = p.turnaround_time if p.turnaround_time is not None else "-"
+        ntt = f"{p.normalized_turnaround_time:.3f}" if p.normalized_turnaround_time is not None else "-"
+        remain = p.remaining_time
+        return (p.pid, p.arrival, p.burst, remain, st, wt, tt, ntt)
 
     def update_results_table_live(self, current_processes: list):
+        """넘겨받은 프로세스 중 현재 페이지에 있고 표시 값이 바뀐 행만 Treeview에 반영"""
         for p in current_processes:
-            if p.pid in self.results_tree_items:
-                item_id = self.results_tree_items[p.pid]
-                st = p.start_time if p.start_time is not None else "-"
-                wt = p.wait_time
-                tt = p.turnaround_time if p.turnaround_time is not None else "-"
-                ntt = f"{p.normalized_turnaround_time:.3f}" if p.normalized_turnaround_time is not None else "-"
-                remain = p.remaining_time
-                self.results_tree.item(item_id, values=(p.pid, p.arrival, p.burst, remain, st, wt, tt, ntt))
+            self.results_pager.update_row(p.pid)
 
     def update_summary_live(self, current_time: int, current_power: float):
-        self.summary_label_vars["Current Time"].set(str(current_time))
-        self.summary_label_vars["Total Power Used"].set(f"{current_power:.2f}")
+        time_text = str(current_time)
+        power_text = f"{current_power:.2f}"
+        if self.summary_label_vars["Current Time"].get() != time_text:
+            self.summary_label_vars["Current Time"].set(time_text)
+        if self.summary_label_vars["Total Power Used"].get() != power_text:
+            self.summary_label_vars["Total Power Used"].set(power_text)
 
     def calculate_and_display_summary(self, total_power: float, final_time: int):
         self.summary_label_vars["Current Time"].set(str(final_time))
@@ -1,10 +1,13 @@
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
+from core.process_stream import read_csv, read_jsonl
 
-MAX_PROCESSES = 15
-MAX_PROCESSORS = 4
+MAX_PROCESSES = 100000
+MAX_PROCESSORS = 256
 class InputManager:
     def __init__(self, app):
         self.app = app
+        self.next_pid = 1                           # 다음에 붙일 PID (목록을 다시 훑지 않음)
+        self.next_processor_id = 1
     
     def add_process(self):
         app = self.app
@@ -20,8 +23,11 @@ class InputManager:
             burst = int(app.burst_entry.get())
             if arrival < 0 or burst <= 0:
                 raise ValueError("Arrival은 0 이상, Burst는 0 보다 커야 합니다.")
-            app.process_tree.insert("", "end", values=(pid, arrival, burst))
-            app.process_data.append({'pid': pid, 'arrival': arrival, 'burst': burst})
+            data = {'pid': pid, 'arrival': arrival, 'burst': burst}
+            app.process_data.append(data)
+            app.process_by_pid[pid] = data
+            self.next_pid = pid + 1
+            app.process_pager.append(pid)
             app.arrival_entry.delete(0, "end")
             app.burst_entry.delete(0, "end")
             app.arrival_entry.focus()
@@ -29,19 +35,60 @@ class InputManager:
         except ValueError as e:
             messagebox.showerror("입력 오류", f"잘못된 프로세스 정보입니다: {e}")
 
+    def import_processes(self):
+        """
+        CSV(pid, arrival, burst) 또는 JSONL 파일의 프로세스를 한 번에 추가
+        - 파일 전체를 먼저 검사하고, 잘못된 줄이 있으면 아무것도 추가하지 않음
+        - 이미 있는 PID(또는 파일 안에서 겹치는 PID)는 새 PID로 바꿔 붙임
+        """
+        app = self.app
+        if app.simulation_running:
+            messagebox.showwarning("실행 중", "시뮬레이션 중에는 프로세스를 추가할 수 없습니다.")
+            return
+        path = filedialog.askopenfilename(
+            title="프로세스 불러오기",
+            filetypes=[("Workload", "*.csv *.jsonl"), ("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        reader = read_jsonl if path.lower().endswith((".jsonl", ".json")) else read_csv
+        try:
+            records = []
+            for process in reader(path):
+                if process.arrival < 0 or process.burst <= 0:
+                    raise ValueError(f"PID {process.pid}: Arrival은 0 이상, Burst는 0 보다 커야 합니다.")
+                records.append((process.pid, process.arrival, process.burst))
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("불러오기 오류", f"파일을 읽을 수 없습니다: {e}")
+            return
+        if len(app.process_data) + len(records) > MAX_PROCESSES:
+            messagebox.showwarning("개수 초과", f"최대 {MAX_PROCESSES}개의 프로세스만 추가할 수 있습니다.")
+            return
+        for pid, arrival, burst in records:
+            if pid <= 0 or pid in app.process_by_pid:
+                pid = self.get_unique_pid()
+            data = {'pid': pid, 'arrival': arrival, 'burst': burst}
+            app.process_data.append(data)
+            app.process_by_pid[pid] = data
+            self.next_pid = max(self.next_pid, pid + 1)
+        app.process_pager.set_keys(app.process_by_pid)
+        app.update_list_counts()
+
     def remove_process(self):
         app = self.app
         if app.simulation_running:
             messagebox.showwarning("실행 중", "시뮬레이션 중에는 프로세스를 제거할 수 없습니다.")
             return
-        selected_items = app.process_tree.selection()
-        if not selected_items:
+        pids_to_remove = set(app.process_pager.selected_keys())
+        if not pids_to_remove:
             return
         if messagebox.askyesno("삭제 확인", "선택된 프로세스를 삭제하시겠습니까?"):
-            pids_to_remove = [int(app.process_tree.item(item, 'values')[0]) for item in selected_items]
             app.process_data = [p for p in app.process_data if p['pid'] not in pids_to_remove]
-            for item in selected_items:
-                app.process_tree.delete(item)
+            for pid in pids_to_remove:
+                del app.process_by_pid[pid]
+            if self.next_pid - 1 in pids_to_remove: # 마지막 PID를 지웠으면 다시 이어서 붙임
+                self.next_pid = max(app.process_by_pid, default=0) + 1
+            app.process_pager.set_keys(app.process_by_pid)
             app.update_list_counts()
 
     def add_processor(self):
@@ -58,6 +105,7 @@ class InputManager:
             raise ValueError("프로세서 타입은 'P' 또는 'E' 여야 합니다.")
         app.processor_tree.insert("", "end", values=(proc_id, proc_type))
         app.processor_data.append({'id': proc_id, 'type': proc_type, 'quantum': None})
+        self.next_processor_id = proc_id + 1
         app.gantt.draw_initial_gantt_layout()
         app.update_list_counts()
 
@@ -70,19 +118,24 @@ class InputManager:
         if not selected_items:
             return
         if messagebox.askyesno("삭제 확인", "선택된 프로세서를 삭제하시겠습니까?"):
-            ids_to_remove = [int(app.processor_tree.item(item, 'values')[0]) for item in selected_items]
+            ids_to_remove = {int(app.processor_tree.item(item, 'values')[0]) for item in selected_items}
             app.processor_data = [p for p in app.processor_data if p['id'] not in ids_to_remove]
             for item in selected_items:
                 app.processor_tree.delete(item)
+            if self.next_processor_id - 1 in ids_to_remove:
+                self.next_processor_id = max((p['id'] for p in app.processor_data), default=0) + 1
             app.gantt.draw_initial_gantt_layout()
             app.update_list_counts()
 
     def get_unique_pid(self):
         app = self.app
-        existing_pids = {int(app.process_tree.item(item, 'values')[0]) for item in app.process_tree.get_children()}
-        return max(existing_pids, default=0) + 1
+        while self.next_pid in app.process_by_pid:
+            self.next_pid += 1
+        return self.next_pid
 
     def get_unique_processor_id(self):
-        app = self.app
-        existing_ids = {int(app.processor_tree.item(item, 'values')[0]) for item in app.processor_tree.get_children()}
-        return max(existing_ids, default=0) + 1
\ No newline at end of file
+        return self.next_processor_id
+
+    def reset(self):
+        self.next_pid = 1
+        self.next_processor_id = 1
@@ -0,0 +1,92 @@
+PAGE_SIZE = 200  # 한 페이지에 Treeview에 넣는 행 수
+
+
+class PagedTree:
+    """
+    많은 행을 페이지 단위로 보여주는 Treeview 목록 (현재 페이지의 행만 Treeview에 넣음)
+    - keys: 전체 행의 키 (표시 순서), row_values(key): 행에 표시할 값
+    - 행이 수천 개여도 Treeview 항목 수는 page_size 이하라 추가, 삭제, 갱신 비용이 페이지 크기에 비례
+    - 표시 중인 값을 기억해 두고 값이 바뀐 행만 다시 씀
+    """
+    def __init__(self, tree, row_values, page_size: int = PAGE_SIZE):
+        self.tree = tree
+        self.row_values = row_values
+        self.page_size = page_size
+        self.keys = []
+        self.page = 0
+        self.items = {}                             # 현재 페이지의 키 -> Treeview 항목
+        self.values = {}                            # 현재 페이지의 키 -> 표시 중인 값
+        self.page_var = None                        # 페이지 표시용 StringVar (위젯을 만들 때 연결)
+
+    def page_count(self) -> int:
+        return max(1, (len(self.keys) + self.page_size - 1) // self.page_size)
+
+    def set_keys(self, keys) -> None:
+        """전체 행을 바꾸고 현재 페이지를 다시 그림 (페이지 번호는 가능한 한 유지)"""
+        self.keys = list(keys)
+        self.page = min(self.page, self.page_count() - 1)
+        self.show()
+
+    def append(self, key) -> None:
+        """행 하나를 끝에 추가 (마지막 페이지를 보고 있고 자리가 남으면 그 행만 넣음)"""
+        self.keys.append(key)
+        last_page = self.page_count() - 1
+        if self.page == last_page and len(self.items) < self.page_size:
+            values = self.row_values(key)
+            self.items[key] = self.tree.insert("", "end", values=values)
+            self.values[key] = values
+            self.update_page_label()
+        else:
+            self.page = last_page
+            self.show()
+
+    def clear(self) -> None:
+        self.keys = []
+        self.page = 0
+        self.show()
+
+    def show(self) -> None:
+        """현재 페이지의 행만 Treeview에 넣음"""
+        self.tree.delete(*self.tree.get_children())
+        self.items.clear()
+        self.values.clear()
+        start = self.page * self.page_size
+        for key in self.keys[start:start + self.page_size]:
+            values = self.row_values(key)
+            self.items[key] = self.tree.insert("", "end", values=values)
+            self.values[key] = values
+        self.update_page_label()
+
+    def update_row(self, key) -> None:
+        """현재 페이지에 있는 행이면 표시 값이 바뀐 경우에만 다시 씀"""
+        item = self.items.get(key)
+        if item is None:
+            return
+        values = self.row_values(key)
+        if self.values.get(key) != values:
+            self.values[key] = values
+            self.tree.item(item, values=values)
+
+    def selected_keys(self) -> list:
+        keys_by_item = {item: key for key, item in self.items.items()}
+        return [keys_by_item[item] for item in self.tree.selection() if item in keys_by_item]
+
+    def next_page(self) -> None:
+        if self.page < self.page_count() - 1:
+            self.page += 1
+            self.show()
+
+    def prev_page(self) -> None:
+        if self.page > 0:
+            self.page -= 1
+            self.show()
+
+    def update_page_label(self) -> None:
+        if self.page_var is None:
+            return
+        if not self.keys:
+            self.page_var.set("0 / 0")
+            return
+        start = self.page * self.page_size
+        end = min(start + self.page_size, len(self.keys))
+        self.page_var.set(f"{start + 1}-{end} / {len(self.keys)}")
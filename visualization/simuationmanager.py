@@ -1,18 +1,37 @@
-from simulator import SchedulerType
 from tkinter import messagebox
 from simulator import SchedulerApp, SchedulerType
+from scheduler import RecordingTraceSink, Replay, SimulationCancelled
+import threading
+import time
+
+FRAME_INTERVAL_MS = 33  # 화면(간트 차트, 결과 테이블, 요약) 갱신 최소 간격 (약 30fps)
+STEP_BUDGET_MS = 15     # 빨리 감기에서 after() 한 번에 프레임을 적용할 시간 (넘으면 다음 호출로 넘김)
+MAX_PENDING_FRAMES = 100000  # 재생하지 않은 프레임이 이만큼 쌓이면 백그라운드 시뮬레이션을 기다리게 함
+STOP_TIMEOUT_S = 0.5    # 이전 시뮬레이션 스레드가 멈추기를 기다리는 최대 시간 (넘으면 분리하고 진행)
 
 
 class SimulationManager:
     def __init__(self, app):
         self.app = app
+        self.recorder: RecordingTraceSink = None    # 백그라운드 시뮬레이션이 기록하는 프레임
+        self.replay: Replay = None                  # 화면에 보여줄 상태 (기록된 프레임을 재생)
+        self.worker: threading.Thread = None
+        self.dirty = {}                             # 마지막 갱신 이후 표시 값이 바뀐 프로세스 (PID -> 프로세스)
+        self.render_after_id = None                 # 예약된 화면 갱신
+        self.last_render = 0.0                      # 마지막 화면 갱신 시각 (perf_counter)
+        self.break_time = None                      # 이 시간에 도달하면 멈춤
+        self.break_pid = None                       # 이 프로세스가 끝나면 멈춤
     
     def start_simulation(self):
         app = self.app
         if app.simulation_running:
             return
+        self.stop_worker()
         app.clear_outputs()
-        app.app = SchedulerApp()
+        self.cancel_render()
+        self.dirty.clear()
+        self.recorder = RecordingTraceSink(max_pending=MAX_PENDING_FRAMES)
+        app.app = SchedulerApp(trace=self.recorder)
         selected_scheduler_name = app.scheduler_var.get()
         try:
             app.app.scheduler_type = SchedulerType[selected_scheduler_name]
@@ -52,7 +71,8 @@ class SimulationManager:
                 app.processor_data[i]['quantum'] = q_for_processor
         try:
             app.app.select_scheduler()
-            app.prepare_results_table(app.app.scheduler.processes)
+            self.replay = Replay(app.app.scheduler.processes, self.recorder)
+            app.prepare_results_table(list(self.replay.processes.values()))
             app.gantt.draw_initial_gantt_layout()
         except Exception as e:
             messagebox.showerror("초기화 오류", f"스케줄러 초기화 실패: {e}")
@@ -64,8 +84,43 @@ class SimulationManager:
         app.start_button.configure(state="disabled")
         app.pause_resume_button.configure(text="Pause", state="normal")
         app.step_button.configure(state="normal")
+        app.end_button.configure(state="normal")
+        self.start_worker()
         self.simulation_step()
 
+    def start_worker(self):
+        """
+        스케줄러를 백그라운드 스레드에서 끝까지 실행 (화면은 기록된 프레임만 재생)
+        - 실행 중에는 메인 스레드에서 스케줄러 객체를 건드리지 않음
+        """
+        scheduler_app = self.app.app
+        recorder = self.recorder
+
+        def run():
+            try:
+                scheduler_app.run_scheduler()
+            except SimulationCancelled:
+                recorder.finish()
+                return
+            except Exception as e:
+                recorder.finish(e)
+                return
+            scheduler_app.print_results() # 기록 종료 표시
+
+        self.worker = threading.Thread(target=run, daemon=True)
+        self.worker.start()
+
+    def stop_worker(self):
+        """
+        실행 중인 백그라운드 시뮬레이션을 취소 (다음 단계를 기록할 때 멈춤)
+        - 한 단계가 오래 걸리면 STOP_TIMEOUT_S만 기다리고 분리 (취소된 기록은 더 쓰이지 않음)
+        """
+        if self.recorder is not None:
+            self.recorder.cancel()
+        if self.worker is not None:
+            self.worker.join(STOP_TIMEOUT_S)
+            self.worker = None
+
     def toggle_pause_simulation(self):
         app = self.app
         if not app.simulation_running:
@@ -79,6 +134,7 @@ class SimulationManager:
         else:
             app.pause_resume_button.configure(text="Pause")
             app.step_button.configure(state="normal")
+            app.end_button.configure(state="normal")
             app.current_after_id = app.after(app.simulation_speed_ms, self.simulation_step)
 
     def step_simulation(self):
@@ -91,38 +147,168 @@ class SimulationManager:
             if app.current_after_id:
                 app.after_cancel(app.current_after_id)
             app.current_after_id = None
+        self.read_breakpoints()
         self._execute_one_step()
 
     def _execute_one_step(self):
+        applied, hit = self.apply_frames(limit=1)
+        if hit:
+            self.pause_at_breakpoint()
+            return False
+        if applied:
+            return True
+        if self.replay.finished:
+            self.simulation_finished()
+            return False
+        return True # 아직 기록되지 않음, 다음 호출에서 다시 확인
+
+    def apply_frames(self, limit=None, budget_ms=None):
+        """
+        기록된 프레임을 재생기에 적용하고 (적용한 프레임 수, 중단점에 걸렸는지 여부) 반환
+        - limit개를 적용했거나, budget_ms가 지났거나, 중단점에 걸리거나, 적용할 프레임이 없으면 멈춤
+        - 화면 갱신은 요청만 함 (FRAME_INTERVAL_MS마다 한 번으로 모음)
+        """
+        app = self.app
+        replay = self.replay
+        deadline = time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        applied = 0
+        hit = False
+        while limit is None or applied < limit:
+            previous_time = replay.current_time
+            changed = replay.step()
+            if changed is None:
+                break
+            applied += 1
+            app.gantt.record(replay.processor_pids, replay.current_time)
+            for process in changed:
+                self.dirty[process.pid] = process
+            if self.hit_breakpoint(previous_time, changed):
+                hit = True
+                break
+            if deadline is not None and applied % 64 == 0 and time.perf_counter() >= deadline:
+                break
+        if applied:
+            self.request_render()
+        return applied, hit
+
+    def read_breakpoints(self):
+        """중단점 입력을 읽음 (비어 있거나 잘못된 값이면 중단점 없음)"""
         app = self.app
-        scheduler = app.app.scheduler
-        if scheduler.has_next():
-            current_time = scheduler.current_time
-            scheduler.update_ready_queue()
-            scheduler.schedule()
-            scheduler.assign_process()
-            scheduler.power_off_idle_processors()
-            scheduler.process_waiting_time_update()
-            current_processes = scheduler.get_process()
-            current_processors = scheduler.get_processors()
-            current_power = scheduler.calculate_total_power()
-            app.gantt.update_gantt_chart_live(current_processors, current_time)
-            app.update_results_table_live(current_processes)
-            app.update_summary_live(current_time, current_power)
-            scheduler.update_current_time()
+        self.break_time = self.break_pid = None
+        try:
+            self.break_time = int(app.break_time_entry.get())
+        except ValueError:
+            pass
+        try:
+            self.break_pid = int(app.break_pid_entry.get())
+        except ValueError:
+            pass
+
+    def hit_breakpoint(self, previous_time, changed):
+        """이번 프레임에 멈출 시간을 지났거나 멈출 프로세스가 끝났는지 여부"""
+        current_time = self.replay.current_time
+        if self.break_time is not None and previous_time < self.break_time <= current_time:
             return True
+        if self.break_pid is not None:
+            for process in changed:
+                if (process.pid == self.break_pid and process.is_completed()
+                        and process.arrival + process.turnaround_time == current_time):
+                    return True
+        return False
+
+    def pause_at_breakpoint(self):
+        """중단점에 걸리면 일시 정지 상태로 바꾸고 그 시점을 바로 그림"""
+        app = self.app
+        if app.current_after_id:
+            app.after_cancel(app.current_after_id)
+            app.current_after_id = None
+        app.simulation_paused = True
+        app.pause_resume_button.configure(text="Resume", state="normal")
+        app.step_button.configure(state="normal")
+        app.end_button.configure(state="normal")
+        self.cancel_render()
+        self.render()
+
+    def request_render(self):
+        if self.render_after_id is not None:
+            return
+        elapsed = (time.perf_counter() - self.last_render) * 1000
+        if elapsed >= FRAME_INTERVAL_MS:
+            self.render()
         else:
+            self.render_after_id = self.app.after(int(FRAME_INTERVAL_MS - elapsed) + 1, self.render)
+
+    def cancel_render(self):
+        if self.render_after_id is not None:
+            self.app.after_cancel(self.render_after_id)
+            self.render_after_id = None
+
+    def render(self):
+        """
+        모아 둔 변경 사항을 화면에 반영
+        - 결과 테이블은 상태가 바뀐 프로세스와 대기 중인(대기 시간이 늘어나는) 프로세스만 확인
+        """
+        app = self.app
+        replay = self.replay
+        self.render_after_id = None
+        self.last_render = time.perf_counter()
+        app.gantt.refresh()
+        self.dirty.update(replay.waiting)
+        app.update_results_table_live(self.dirty.values())
+        self.dirty.clear()
+        app.update_summary_live(replay.current_time, replay.power)
+
+    def jump_to_end(self):
+        """
+        끝까지 실행 (시뮬레이션은 백그라운드에서 엔진 속도로 진행하고, 화면은 끝나거나 중단점에 걸렸을 때 한 번만 그림)
+        - 아직 끝나지 않았으면 기록된 프레임까지 적용하고 FRAME_INTERVAL_MS 뒤 이어서 적용 (그동안 요약만 갱신)
+        """
+        app = self.app
+        if not app.simulation_running:
+            return
+        if app.current_after_id:
+            app.after_cancel(app.current_after_id)
+            app.current_after_id = None
+        app.simulation_paused = True
+        app.pause_resume_button.configure(text="Resume", state="disabled")
+        app.step_button.configure(state="disabled")
+        app.end_button.configure(state="disabled")
+        self.read_breakpoints()
+        applied, hit = self.apply_frames()
+        self.cancel_render()
+        if hit:
+            self.pause_at_breakpoint()
+        elif self.replay.finished:
             self.simulation_finished()
-            return False
+        else:
+            if applied:
+                app.update_summary_live(self.replay.current_time, self.replay.power)
+            app.current_after_id = app.after(FRAME_INTERVAL_MS, self.jump_to_end)
 
     def simulation_step(self):
+        """
+        보통은 호출마다 한 프레임, 빨리 감기면 STEP_BUDGET_MS 동안 적용할 수 있는 만큼 적용
+        (빨리 감기는 속도 설정과 무관하게 바로 다음 호출을 예약)
+        """
         app = self.app
         if not app.simulation_running or app.simulation_paused:
             app.current_after_id = None
             return
-        executed = self._execute_one_step()
+        self.read_breakpoints()
+        fast = app.fast_forward_var.get()
+        if fast:
+            applied, hit = self.apply_frames(budget_ms=STEP_BUDGET_MS)
+            if hit:
+                self.pause_at_breakpoint()
+                return
+            if not applied and self.replay.finished:
+                self.simulation_finished()
+                return
+            executed = True
+        else:
+            executed = self._execute_one_step()
         if executed and app.simulation_running and not app.simulation_paused:
-            app.current_after_id = app.after(app.simulation_speed_ms, self.simulation_step)
+            app.current_after_id = app.after(1 if fast else app.simulation_speed_ms, self.simulation_step)
         else:
             app.current_after_id = None
 
@@ -132,21 +318,25 @@ class SimulationManager:
         app.simulation_paused = False
         final_time = "N/A"
         total_power = 0.0
-        if app.app and app.app.scheduler:
-            final_processes = app.app.scheduler.get_process()
-            final_processors = app.app.scheduler.get_processors()
-            final_time = app.app.scheduler.current_time -1
-            total_power = app.app.scheduler.calculate_total_power()
-            app.update_results_table_live(final_processes)
+        self.cancel_render()
+        if self.replay is not None and self.recorder.error is None:
+            final_time = self.replay.current_time
+            total_power = self.replay.power
+            app.gantt.refresh()
+            app.update_results_table_live(self.replay.processes.values())
             app.calculate_and_display_summary(total_power, final_time)
         else:
             app.calculate_and_display_summary(0.0, 0)
         app.start_button.configure(text="Start", state="normal")
         app.pause_resume_button.configure(text="Pause", state="disabled")
         app.step_button.configure(state="disabled")
+        app.end_button.configure(state="disabled")
         app.widget.enable_inputs()
         if app.current_after_id:
             app.after_cancel(app.current_after_id)
             app.current_after_id = None
+        if self.recorder is not None and self.recorder.error is not None:
+            messagebox.showerror("실행 오류", f"시뮬레이션 중 오류가 발생했습니다: {self.recorder.error}")
+            return
         ftime_display = final_time if final_time != "N/A" else 0
         messagebox.showinfo("시뮬레이션 완료", f"시뮬레이션이 시간 {ftime_display}에 종료되었습니다.")
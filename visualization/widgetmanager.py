@@ -1,6 +1,7 @@
 import customtkinter as ctk
 import tkinter.ttk as ttk
 from simulator import SchedulerType
+from visualization.pagedtree import PagedTree
 
 class WidgetManager:
     def __init__(self, app ):
@@ -57,9 +58,23 @@ class WidgetManager:
         app.step_button = ctk.CTkButton(app.control_frame, text="Step", command=app.simulation.step_simulation, width=50, state="disabled")
         app.step_button.pack(side="left", padx=2)
 
+        app.end_button = ctk.CTkButton(app.control_frame, text="End", command=app.simulation.jump_to_end, width=50, state="disabled")
+        app.end_button.pack(side="left", padx=2)
+
         app.reset_button = ctk.CTkButton(app.control_frame, text="Reset", command=app.reset_all, width=60)
         app.reset_button.pack(side="left", padx=(10,2))
 
+        # 빨리 감기, 중단점 (실행 중에도 바꿀 수 있음)
+        app.fast_forward_var = ctk.BooleanVar(value=False)
+        app.fast_forward_check = ctk.CTkCheckBox(app.control_frame, text="Fast", variable=app.fast_forward_var, width=60)
+        app.fast_forward_check.pack(side="left", padx=(10,2))
+        ctk.CTkLabel(app.control_frame, text="Break t:").pack(side="left", padx=(5,2))
+        app.break_time_entry = ctk.CTkEntry(app.control_frame, width=60)
+        app.break_time_entry.pack(side="left", padx=2)
+        ctk.CTkLabel(app.control_frame, text="PID:").pack(side="left", padx=(5,2))
+        app.break_pid_entry = ctk.CTkEntry(app.control_frame, width=50)
+        app.break_pid_entry.pack(side="left", padx=2)
+
         # 속도 조절
         app.speed_label_var = ctk.StringVar(value=f"{app.simulation_speed_ms} ms")
         ctk.CTkLabel(app.control_frame, textvariable=app.speed_label_var, width=70).pack(side="right", padx=(0,5))
@@ -113,8 +128,15 @@ class WidgetManager:
         app.process_tree.configure(yscrollcommand=process_scrollbar.set)
         process_scrollbar.pack(side="right", fill="y")
         app.process_tree.pack(side="left", fill="x", expand=True)
-        app.remove_process_button = ctk.CTkButton(process_section_frame, text="Remove Selected Process", command=app.input.remove_process)
-        app.remove_process_button.pack(pady=(0,5), padx=5)
+        # 프로세스가 많으면 페이지 단위로 표시
+        app.process_pager = PagedTree(app.process_tree, app.process_row_values)
+        self.create_pager_nav(process_section_frame, app.process_pager)
+        process_button_frame = ctk.CTkFrame(process_section_frame, fg_color="transparent")
+        process_button_frame.pack(pady=(0,5), padx=5)
+        app.remove_process_button = ctk.CTkButton(process_button_frame, text="Remove Selected Process", command=app.input.remove_process)
+        app.remove_process_button.pack(side="left", padx=(0,5))
+        app.import_process_button = ctk.CTkButton(process_button_frame, text="Import...", command=app.input.import_processes, width=70)
+        app.import_process_button.pack(side="left")
 
         # 프로세서 입력
         processor_section_frame = ctk.CTkFrame(input_content_frame)
@@ -155,15 +177,25 @@ class WidgetManager:
         app = self.app
         
         # 간트 차트 영역
-        gantt_header = ctk.CTkLabel(app.output_container_frame, text="Gantt Chart", font=("Arial", 12, "bold"))
-        gantt_header.pack(pady=(5,0), anchor="w", padx=5)
+        gantt_header_frame = ctk.CTkFrame(app.output_container_frame, fg_color="transparent")
+        gantt_header_frame.pack(pady=(5,0), fill="x", padx=5)
+        gantt_header = ctk.CTkLabel(gantt_header_frame, text="Gantt Chart", font=("Arial", 12, "bold"))
+        gantt_header.pack(side="left")
+        # 확대/축소 (보이는 구간만 그리므로 실행이 길어도 스크롤과 확대 비용은 화면 크기에 비례)
+        app.gantt_zoom_var = ctk.StringVar(value="")
+        ctk.CTkButton(gantt_header_frame, text="+", command=app.gantt.zoom_in, width=28).pack(side="right", padx=2)
+        ctk.CTkButton(gantt_header_frame, text="-", command=app.gantt.zoom_out, width=28).pack(side="right", padx=2)
+        ctk.CTkLabel(gantt_header_frame, textvariable=app.gantt_zoom_var, width=90).pack(side="right", padx=2)
         gantt_frame = ctk.CTkFrame(app.output_container_frame)  # padx, pady 제거
         gantt_frame.pack(side="top", fill="x", padx=5, pady=5)  # pack()에서 패딩 지정
         app.gantt_canvas = ctk.CTkCanvas(gantt_frame, bg="white", height=100, highlightthickness=0)
-        gantt_hbar = ttk.Scrollbar(gantt_frame, orient="horizontal", command=app.gantt_canvas.xview)
-        gantt_hbar.pack(side="bottom", fill="x")
-        app.gantt_canvas.configure(xscrollcommand=gantt_hbar.set)
+        app.gantt_hbar = ttk.Scrollbar(gantt_frame, orient="horizontal", command=app.gantt.on_scroll)
+        app.gantt_hbar.pack(side="bottom", fill="x")
+        # 프로세서가 많으면 보이는 행만 그리고 세로로 스크롤
+        app.gantt_vbar = ttk.Scrollbar(gantt_frame, orient="vertical", command=app.gantt.on_vscroll)
+        app.gantt_vbar.pack(side="right", fill="y")
         app.gantt_canvas.pack(fill="x", expand=True)
+        app.gantt_canvas.bind("<Configure>", app.gantt.refresh)
         app.gantt.draw_initial_gantt_layout()
 
         # 결과 테이블 영역
@@ -195,7 +227,8 @@ class WidgetManager:
         app.results_tree.configure(yscrollcommand=results_scrollbar.set)
         results_scrollbar.pack(side="right", fill="y")
         app.results_tree.pack(side="left", fill="both", expand=True)
-        app.results_tree_items = {}
+        app.results_pager = PagedTree(app.results_tree, app.result_row_values)
+        self.create_pager_nav(app.output_container_frame, app.results_pager)
 
         # 요약 정보 영역
         summary_frame = ctk.CTkFrame(app.output_container_frame)  # padx, pady 제거
@@ -210,6 +243,16 @@ class WidgetManager:
         app.summary_label_vars["Total Power Used"] = power_var
         ctk.CTkLabel(summary_frame, textvariable=power_var, font=("Arial", 10)).pack(side="left", padx=(0,5))
 
+    def create_pager_nav(self, parent, pager):
+        """페이지 이동 버튼과 현재 페이지 범위 표시"""
+        nav_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        nav_frame.pack(pady=(0,5), padx=5, fill="x")
+        pager.page_var = ctk.StringVar(value="0 / 0")
+        ctk.CTkButton(nav_frame, text="<", command=pager.prev_page, width=28).pack(side="left")
+        ctk.CTkLabel(nav_frame, textvariable=pager.page_var).pack(side="left", expand=True)
+        ctk.CTkButton(nav_frame, text=">", command=pager.next_page, width=28).pack(side="right")
+        return nav_frame
+
     def update_rr_quantum_visibility(self, event=None):
         app = self.app
         selected_scheduler = app.scheduler_var.get()
@@ -230,11 +273,17 @@ class WidgetManager:
                 app.rr_quantum_entry.pack_forget()
 
 
+    def live_controls(self):
+        """시뮬레이션 중에도 켜 두는 위젯"""
+        app = self.app
+        return [app.start_button, app.pause_resume_button, app.step_button, app.end_button, app.reset_button,
+                app.fast_forward_check, app.break_time_entry, app.break_pid_entry]
+
     def disable_inputs(self):
         app = self.app
         for frame in [app.input_frame, app.control_frame]:
             for widget in frame.winfo_children():
-                if widget not in [app.start_button, app.pause_resume_button, app.step_button, app.reset_button]:
+                if widget not in self.live_controls():
                     try:
                         widget.configure(state="disabled")
                     except:
@@ -250,7 +299,7 @@ class WidgetManager:
         app = self.app
         for frame in [app.input_frame, app.control_frame]:
             for widget in frame.winfo_children():
-                if widget not in [app.start_button, app.pause_resume_button, app.step_button, app.reset_button]:
+                if widget not in self.live_controls():
                     try:
                         widget.configure(state="normal")
                     except: